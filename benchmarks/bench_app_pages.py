@@ -0,0 +1,231 @@
+"""Rerun-latency suite for streamlit_app.py: every page plus the common interactions.
+
+Usage: python benchmarks/bench_app_pages.py --projects 2000 --boq-rows 20000 --notifications 2000
+       python benchmarks/bench_app_pages.py --runs 30 --json logs/app_bench.json
+       python benchmarks/bench_app_pages.py --thresholds ''   (report only, never fail)
+
+Seeds a temporary project_management.db with the given volumes and drives the
+app headlessly with AppTest:
+- page:<name> reruns each sidebar page without changes.
+- add_material adds a BOQ row on Material Entry.
+- submit_project submits a one-row project from Submit Project.
+- review_boq applies a bulk action in the Admin Panel's BOQ review grid and saves.
+
+For each scenario it reports p50 and p95 script-run time over --runs
+repetitions (see bench_app_rerun.py for how script time is taken). It also
+reports the peak memory traced by tracemalloc during one extra run, kept out of
+the timed runs because tracing slows Python code down.
+
+The run fails (exit 1) if a scenario's p95 or peak memory exceeds its limit in
+--thresholds (default benchmarks/app_thresholds.json). The limits are set for
+the default volumes; pass your own file when benchmarking other sizes.
+"""
+import argparse
+import itertools
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import tracemalloc
+
+from streamlit.testing.v1 import AppTest
+
+from bench_app_rerun import PAGES, PASSWORDS, timed_run
+from bench_utils import mb, project_root
+from db import db_config
+from dashboard.connection import ConnectionManager
+from dashboard.listing import DOMAINS, PRIORITIES, STATUSES
+from dashboard.migrations import migrate
+
+DEFAULT_THRESHOLDS = project_root / 'benchmarks' / 'app_thresholds.json'
+CATEGORIES = ['1. Supply', '2. Erection', '3. Erection & Commissioning', '4. Running Expenses',
+              '5. Project Management Service PMC', '6. Travels & Others']
+
+def seed_app_db(path, projects, boq_rows, notifications):
+    """Projects (newest last), BOQ rows spread evenly over them, and notifications"""
+    rng = random.Random(0)
+    db = ConnectionManager(path)
+    migrate(db.connection())
+    with db.transaction() as conn:
+        conn.executemany('''
+            INSERT INTO projects (tracking_id, project_name, project_description, domain, priority, total_cost,
+                                  material_cost, start_date, end_date, department, justification, status,
+                                  submitted_by, submitted_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', ((f'PRJ{i:08d}', f'Project {i}', 'Upgrade of plant equipment', rng.choice(DOMAINS),
+               rng.choice(PRIORITIES), rng.uniform(1e4, 1e7), 0.0, '2025-01-01', '2025-12-31',
+               f'Dept {i % 12}', 'Needed for the next production cycle', rng.choice(STATUSES), 'bench',
+               f'2025-{i * 12 // max(projects, 1) + 1:02d}-{i % 28 + 1:02d} {i % 24:02d}:{i % 60:02d}:00')
+              for i in range(projects)))
+        conn.executemany('''
+            INSERT INTO project_materials (project_id, category, subtopic, description, units_qty, nos, source_type,
+                                           payment_schedule, unit_price, amount_inr, justification, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', ((i % projects + 1, CATEGORIES[i % len(CATEGORIES)], f'Item {i}', f'Item {i} - supply and fit',
+               'Nos', i % 10 + 1, 'Bought out', 'Monthly', 1000.0, 1000.0 * (i % 10 + 1), 'Per drawing',
+               'pending') for i in range(boq_rows if projects else 0)))
+        conn.executemany('''
+            INSERT INTO notifications (project_id, notification_type, title, message)
+            VALUES (?, ?, ?, ?)
+        ''', ((i % projects + 1, 'project_submitted', f'Project Submitted: PRJ{i % projects:08d}', 'Seeded')
+              for i in range(notifications if projects else 0)))
+    db.connection().execute('ANALYZE')
+    db.close()
+
+def open_page(at, page):
+    at.sidebar.selectbox[0].select(page)
+    timed_run(at)
+    if page in PASSWORDS:
+        next(t for t in at.text_input if 'Password' in t.label).input(PASSWORDS[page])
+        timed_run(at)
+
+def widget(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+# Each scenario: (setup(at), step(at)); step is what gets timed and must leave the app ready to repeat
+
+def page_scenario(page):
+    return (lambda at: open_page(at, page)), timed_run
+
+def add_material_setup(at):
+    open_page(at, "📦 Material Entry")
+
+def add_material_step(at):
+    widget(at.number_input, "Unit Price Total Amount").set_value(2500.0)
+    at.text_area(key='mat_justification_text').input('Needed for the site work')
+    widget(at.button, 'Add Entry').click()
+    return timed_run(at)
+
+def submit_project_setup(at):
+    open_page(at, "📝 Submit Project")
+
+def submit_project_step(at):
+    # Step 1 (project details) and one BOQ row are not timed; the submission is
+    widget(at.text_input, "Project Name *").input('Bench project')
+    widget(at.text_area, "Project Description *").input('Benchmark submission')
+    widget(at.text_input, "Submitted By *").input('bench')
+    widget(at.text_area, "Justification *").input('Benchmark')
+    widget(at.button, "🚀 Proceed to BOM/Material Entry →").click()
+    timed_run(at)
+    at.number_input(key='unit_price_proj2').set_value(1500.0)
+    at.text_area(key='proj_mat_justification_text').input('Benchmark row')
+    widget(at.button, 'Add Material to Project').click()
+    timed_run(at)
+    widget(at.button, 'Submit Full Project (with BOM)').click()
+    seconds = timed_run(at)
+    if not any('Tracking ID' in s.value for s in at.success):
+        raise SystemExit('submit_project: no tracking ID shown')
+    timed_run(at)  # back to step 1 for the next submission
+    return seconds
+
+def filter_every_category(at):
+    """Pick every category in the review grid's filter; Reject Filtered is disabled without a filter"""
+    categories = next(m for m in at.multiselect if m.label == 'Filter rows by Category')
+    for option in categories.options:
+        categories.select(option)
+    timed_run(at)
+
+def review_boq_setup(at):
+    open_page(at, "👨‍💼 Admin Panel")
+    chooser = next(s for s in at.selectbox if s.label.startswith('Choose a project'))
+    # The newest project that has BOQ rows
+    for option in chooser.options:
+        chooser.select(option)
+        timed_run(at)
+        if any(b.label == '💾 Save Row Changes' for b in at.button):
+            filter_every_category(at)
+            return
+        chooser = next(s for s in at.selectbox if s.label.startswith('Choose a project'))
+    raise SystemExit('review_boq: no project with BOQ rows on the first admin page')
+
+# Alternate the grid's bulk actions so every save changes rows
+_review_actions = itertools.cycle(['❌ Reject Filtered', '✅ Approve All in Category'])
+
+def review_boq_step(at):
+    action = next(_review_actions)
+    next(b for b in at.button if b.label.startswith(action)).click()
+    return timed_run(at)
+
+SCENARIOS = {f'page:{page}': page_scenario(page) for page in PAGES}
+SCENARIOS.update({
+    'add_material': (add_material_setup, add_material_step),
+    'submit_project': (submit_project_setup, submit_project_step),
+    'review_boq': (review_boq_setup, review_boq_step),
+})
+
+def percentile(values, pct):
+    return statistics.quantiles(values, n=100, method='inclusive')[pct - 1] if len(values) > 1 else values[0]
+
+def run_scenario(setup, step, runs):
+    at = AppTest.from_file(str(project_root / 'streamlit_app.py'), default_timeout=120)
+    timed_run(at)
+    setup(at)
+    step(at)  # warm-up: first visit imports and caches
+    times = [step(at) for _ in range(runs)]
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        step(at)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'runs': runs, 'p50_ms': percentile(times, 50) * 1000, 'p95_ms': percentile(times, 95) * 1000,
+            'peak_mb': mb(peak)}
+
+def check(results, thresholds):
+    failures = []
+    for name, result in results.items():
+        limits = thresholds.get(name, {})
+        for metric in ('p95_ms', 'peak_mb'):
+            if metric in limits and result[metric] > limits[metric]:
+                failures.append(f'{name}: {metric} {result[metric]:.1f} > {limits[metric]}')
+    return failures
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--boq-rows', type=int, default=20000)
+    parser.add_argument('--notifications', type=int, default=2000)
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--only', nargs='+', help='scenario names (default: all)')
+    parser.add_argument('--thresholds', default=str(DEFAULT_THRESHOLDS), help="JSON limits file, '' to skip")
+    parser.add_argument('--json', help='also write the results to this file')
+    args = parser.parse_args()
+
+    names = args.only or list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        raise SystemExit(f'unknown scenarios: {sorted(unknown)}; choose from {list(SCENARIOS)}')
+    thresholds = json.loads(open(args.thresholds).read()) if args.thresholds else {}
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project_management.db')
+        seed_app_db(path, args.projects, args.boq_rows, args.notifications)
+        # The app reads this when it creates its connection manager
+        db_config.DASHBOARD_DB_URL = 'sqlite:///' + path
+        os.chdir(project_root)
+        print(f'{args.projects} projects, {args.boq_rows} BOQ rows, {args.notifications} notifications, '
+              f'{args.runs} runs per scenario')
+        for name in names:
+            setup, step = SCENARIOS[name]
+            results[name] = result = run_scenario(setup, step, args.runs)
+            limits = thresholds.get(name, {})
+            print(f"{name:32s} p50 {result['p50_ms']:8.1f} ms   p95 {result['p95_ms']:8.1f} ms"
+                  f"{'/' + str(limits['p95_ms']) if 'p95_ms' in limits else '':>7s}"
+                  f"   peak {result['peak_mb']:7.1f} MB{'/' + str(limits['peak_mb']) if 'peak_mb' in limits else ''}")
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'volumes': {'projects': args.projects, 'boq_rows': args.boq_rows,
+                                   'notifications': args.notifications},
+                       'results': results}, f, indent=2)
+    failures = check(results, thresholds)
+    for failure in failures:
+        print('REGRESSION', failure)
+    return 1 if failures else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
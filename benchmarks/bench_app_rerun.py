@@ -0,0 +1,80 @@
+"""Script-run time of streamlit_app.py per page, measured with Streamlit's headless AppTest.
+
+Usage: python benchmarks/bench_app_rerun.py --projects 2000 --reruns 10
+
+Each page is opened once (the first visit, which includes any lazy imports),
+then rerun --reruns times without changes, like a widget interaction that
+does not touch the data. The app runs against a seeded temporary database.
+
+Times are for executing the script in AppTest's runner thread. AppTest.run()
+itself adds a few hundred milliseconds of thread start-up and polling, which
+would swamp the difference between pages.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+import streamlit.runtime.scriptrunner.script_runner as script_runner
+from streamlit.testing.v1 import AppTest
+
+from bench_utils import project_root
+from bench_dashboard_kpis import seed
+from db import db_config
+from dashboard.connection import ConnectionManager
+from dashboard.migrations import migrate
+
+PAGES = ["🏠 Dashboard Overview", "📝 Submit Project", "🔍 Track Project", "👨‍💼 Admin Panel",
+         "👑 Super User Dashboard", "📊 Analytics", "📁 File Upload", "📦 Material Entry"]
+PASSWORDS = {"👨‍💼 Admin Panel": 'admin123', "👑 Super User Dashboard": 'super123'}
+
+_script_seconds = []
+
+def _timed_exec(func, ctx, _exec=script_runner.exec_func_with_error_handling):
+    start = time.perf_counter()
+    try:
+        return _exec(func, ctx)
+    finally:
+        _script_seconds.append(time.perf_counter() - start)
+
+# ScriptRunner looks this up in its module namespace on every run
+script_runner.exec_func_with_error_handling = _timed_exec
+
+def timed_run(at):
+    """Seconds the app script took for one at.run()"""
+    _script_seconds.clear()
+    at.run()
+    if at.exception:
+        raise SystemExit(f'app raised: {at.exception[0].value}')
+    return sum(_script_seconds)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--projects', type=int, default=2000)
+    parser.add_argument('--reruns', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project_management.db')
+        db = ConnectionManager(path)
+        migrate(db.connection())
+        seed(db, args.projects)
+        db.close()
+        # The app reads this when it creates its connection manager
+        db_config.DASHBOARD_DB_URL = 'sqlite:///' + path
+        os.chdir(project_root)
+
+        at = AppTest.from_file(str(project_root / 'streamlit_app.py'), default_timeout=120)
+        print(f'first run (process start): {timed_run(at) * 1000:8.1f} ms')
+        for page in PAGES:
+            at.sidebar.selectbox[0].select(page)
+            first = timed_run(at)
+            if page in PASSWORDS:
+                at.text_input[0].input(PASSWORDS[page])
+                first = timed_run(at)
+            reruns = [timed_run(at) for _ in range(args.reruns)]
+            print(f'{page:28s} first {first * 1000:8.1f} ms   rerun median {statistics.median(reruns) * 1000:8.1f} ms')
+
+if __name__ == '__main__':
+    main()
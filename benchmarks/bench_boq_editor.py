@@ -0,0 +1,103 @@
+"""Cost of adding one BOQ row on Material Entry and Submit Project with many rows already in the session.
+
+Usage: python benchmarks/bench_boq_editor.py --rows 0 500 2000 --runs 10
+
+The BOQ form and the grouped table are fragments, so in the browser adding a
+row reruns only them. AppTest always reruns the whole script, so two times are
+reported per add: the full rerun (what an add would cost without the fragments)
+and the time spent in the editor fragment, which is what an add costs now.
+"""
+import argparse
+import os
+import statistics
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+from bench_app_pages import open_page, seed_app_db, widget
+from bench_app_rerun import timed_run
+from bench_utils import project_root
+from db import db_config
+from dashboard.boq import BOQ_TOPICS
+
+def session_rows(n):
+    categories = list(BOQ_TOPICS)
+    return [{"Category": categories[i % len(categories)], "Sub-topic": "Raw Materials", "Description": f"Item {i}",
+             "Units/Qty": "kgs", "Nos": i % 20 + 1, "Source/Type": "Vendor Quote", "Payment Schedule": "Monthly",
+             "Unit Price Total Amount": 1000.0, "Amount INR": 1000.0 * (i % 20 + 1), "Justification": "Per drawing",
+             "Justification Type": "Text Input", "Justification File Path": ""} for i in range(n)]
+
+def fragment_timer(module, name):
+    """Wrap module.name (a fragment render calls) and return the list its run times go to"""
+    seconds, fragment = [], getattr(module, name)
+
+    def timed(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return fragment(*args, **kwargs)
+        finally:
+            seconds.append(time.perf_counter() - start)
+
+    setattr(module, name, timed)
+    return seconds
+
+def material_entry(at, rows):
+    at.session_state["materials_data"] = session_rows(rows)
+    open_page(at, "📦 Material Entry")
+
+    def add():
+        widget(at.number_input, "Unit Price Total Amount").set_value(2500.0)
+        at.text_area(key='mat_justification_text').input('Needed for the site work')
+        widget(at.button, 'Add Entry').click()
+        return timed_run(at)
+    return 'dashboard.pages.material_entry', '_material_entry_editor', add
+
+def submit_project(at, rows):
+    open_page(at, "📝 Submit Project")
+    widget(at.text_input, "Project Name *").input('Bench project')
+    widget(at.text_area, "Project Description *").input('Benchmark submission')
+    widget(at.text_input, "Submitted By *").input('bench')
+    widget(at.text_area, "Justification *").input('Benchmark')
+    widget(at.button, "🚀 Proceed to BOM/Material Entry →").click()
+    timed_run(at)
+    at.session_state["project_materials_data"] = session_rows(rows)
+
+    def add():
+        at.number_input(key='unit_price_proj2').set_value(1500.0)
+        at.text_area(key='proj_mat_justification_text').input('Benchmark row')
+        widget(at.button, 'Add Material to Project').click()
+        return timed_run(at)
+    return 'dashboard.pages.submit_project', '_project_materials_editor', add
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[0, 500, 2000])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project_management.db')
+        seed_app_db(path, 100, 1000, 100)
+        # The app reads this when it creates its connection manager
+        db_config.DASHBOARD_DB_URL = 'sqlite:///' + path
+        os.chdir(project_root)
+
+        for page in (material_entry, submit_project):
+            for rows in args.rows:
+                at = AppTest.from_file(str(project_root / 'streamlit_app.py'), default_timeout=120)
+                timed_run(at)
+                module_name, fragment, add = page(at, rows)
+                add()  # warm-up
+                module = __import__(module_name, fromlist=[fragment])
+                original = getattr(module, fragment)
+                fragment_seconds = fragment_timer(module, fragment)
+                try:
+                    full = [add() for _ in range(args.runs)]
+                finally:
+                    setattr(module, fragment, original)
+                print(f'{page.__name__:15s} {rows:>6} session rows: full rerun {statistics.median(full) * 1000:7.1f} ms   '
+                      f'editor fragment {statistics.median(fragment_seconds) * 1000:7.1f} ms')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""Admin Panel BOQ review of large projects: page render and bulk save times.
+
+Usage: python benchmarks/bench_boq_review.py --rows 500 5000 --runs 5
+
+Seeds one project per --rows size holding that many BOQ rows and opens each
+in the Admin Panel with every category picked in the row filter. It times
+reruns of the page, then saves from the review grid, alternating "Reject
+Filtered" (every row changes) and "Approve All in Category". A save includes
+the rerun that shows the new statuses. Times are script-run time, as in
+bench_app_rerun.py.
+"""
+import argparse
+import os
+import sqlite3
+import statistics
+import tempfile
+
+from streamlit.testing.v1 import AppTest
+
+from bench_app_pages import CATEGORIES, filter_every_category, open_page, seed_app_db
+from bench_app_rerun import timed_run
+from bench_utils import project_root
+from db import db_config
+
+ACTIONS = ['❌ Reject Filtered', '✅ Approve All in Category']
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[500, 5000])
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project_management.db')
+        # Project i (tracking id PRJ0000000i) gets args.rows[i] BOQ rows
+        seed_app_db(path, len(args.rows), 0, 0)
+        conn = sqlite3.connect(path)
+        with conn:
+            for project, rows in enumerate(args.rows):
+                conn.executemany('''
+                    INSERT INTO project_materials (project_id, category, subtopic, description, units_qty, nos,
+                                                   source_type, payment_schedule, unit_price, amount_inr, status)
+                    VALUES (?, ?, ?, ?, 'Nos', ?, 'Bought out', 'Monthly', 1000.0, ?, 'pending')
+                ''', ((project + 1, CATEGORIES[i % len(CATEGORIES)], f'Item {i}', f'Item {i} - supply and fit',
+                       i % 10 + 1, 1000.0 * (i % 10 + 1)) for i in range(rows)))
+        # The app reads this when it creates its connection manager
+        db_config.DASHBOARD_DB_URL = 'sqlite:///' + path
+        os.chdir(project_root)
+
+        at = AppTest.from_file(str(project_root / 'streamlit_app.py'), default_timeout=300)
+        timed_run(at)
+        open_page(at, "👨‍💼 Admin Panel")
+        for project, rows in enumerate(args.rows):
+            chooser = next(s for s in at.selectbox if s.label.startswith('Choose a project'))
+            chooser.select(next(o for o in chooser.options if f'PRJ{project:08d}' in str(o)))
+            timed_run(at)
+            filter_every_category(at)
+            render = [timed_run(at) for _ in range(args.runs)]
+            saves = []
+            for run in range(args.runs):
+                action = ACTIONS[run % len(ACTIONS)]
+                next(b for b in at.button if b.label.startswith(action)).click()
+                saves.append(timed_run(at))
+            statuses = dict(conn.execute(
+                "SELECT status, COUNT(*) FROM project_materials WHERE project_id = ? GROUP BY status",
+                (project + 1,)).fetchall())
+            print(f'{rows:>6} BOQ rows: render {statistics.median(render):6.2f}s   '
+                  f'save {statistics.median(saves):6.2f}s   statuses after {statuses}')
+        conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+"""Per-row UPDATEs, as the Admin Panel saved reviews before, versus bulk_update_material_status.
+
+Usage: python benchmarks/bench_bulk_review.py --rows 1000 --changed 0.5
+"""
+import argparse
+import os
+import sqlite3
+import tempfile
+
+import pandas as pd
+
+from bench_utils import timed
+from dashboard.boq import bulk_update_material_status
+from dashboard.connection import ConnectionManager
+from dashboard.migrations import migrate
+
+def seed(path, rows):
+    conn = sqlite3.connect(path)
+    migrate(conn)
+    conn.execute('DELETE FROM project_materials')
+    conn.executemany("INSERT INTO project_materials (project_id, subtopic, amount_inr) VALUES (1, ?, ?)",
+                     [(f'Item {i}', float(i)) for i in range(rows)])
+    conn.commit()
+    conn.close()
+
+def load(path):
+    conn = sqlite3.connect(path)
+    df = pd.read_sql_query('SELECT * FROM project_materials WHERE project_id = 1', conn)
+    conn.close()
+    return df
+
+def legacy_update(path, current, proposed):
+    # The Admin Panel loop before the bulk API: one connection and commit per changed row
+    for (_, material), (_, row) in zip(current.iterrows(), proposed.iterrows()):
+        if (row['status'] != material['status'] or row['review_comments'] != (material['review_comments'] or '')
+                or row['finalized'] != (material['finalized'] == 1)):
+            conn = sqlite3.connect(path)
+            conn.execute('''
+                UPDATE project_materials
+                SET status = ?, review_comments = ?, reviewed_by = ?, reviewed_at = CURRENT_TIMESTAMP, finalized = ?
+                WHERE id = ?
+            ''', (row['status'], row['review_comments'], 'Admin', 1 if row['finalized'] else 0, int(material['id'])))
+            conn.commit()
+            conn.close()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--changed', type=float, default=0.5, help='fraction of rows the reviewer changes')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'project_management.db')
+        for label in ('per-row', 'bulk'):
+            seed(path, args.rows)
+            current = load(path)
+            proposed = current[['id', 'status', 'review_comments', 'finalized']].copy()
+            step = max(1, round(1 / args.changed)) if args.changed else len(current) + 1
+            proposed.loc[::step, 'status'] = 'approved'
+            proposed['review_comments'] = proposed['review_comments'].fillna('')
+            proposed['finalized'] = proposed['finalized'] == 1
+
+            if label == 'per-row':
+                secs = timed(legacy_update, path, current, proposed)
+            else:
+                db = ConnectionManager(path)
+                secs = timed(bulk_update_material_status, db, current, proposed)
+                db.close()
+            approved = (load(path)['status'] == 'approved').sum()
+            print(f'{label:8s} {args.rows} rows, {approved} approved: {secs:.3f}s')
+
+if __name__ == '__main__':
+    main()
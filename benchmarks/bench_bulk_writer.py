@@ -0,0 +1,101 @@
+"""Persist time of the columnar budget_items writer versus the original iterrows writer.
+
+Usage: python benchmarks/bench_bulk_writer.py --rows 10000 1000000 10000000 --legacy-max-rows 1000000
+
+The legacy writer is skipped above --legacy-max-rows because it needs minutes
+per million rows. Point DATABASE_URL-style runs at PostgreSQL with --db.
+"""
+import argparse
+import contextlib
+import io
+import tempfile
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from bench_utils import AGENCIES, use_temp_database, timed
+import db.db_operations as db_operations
+from deploy.init_db import init_db
+
+def legacy_replace_budget_items(df, raw_file):
+    # replace_budget_items as it was before the columnar write path
+    with db_operations.engine.begin() as conn:
+        conn.execute(text("DELETE FROM budget_items WHERE project_id=1"))
+        rows = []
+        for _, r in df.iterrows():
+            rows.append({
+                'project_id': 1,
+                'sl_no': int(r.sl_no) if pd.notna(r.sl_no) else None,
+                'description': str(r.description) if pd.notna(r.description) else None,
+                'responsible_agency': str(r.responsible_agency) if pd.notna(r.responsible_agency) else None,
+                'qty': float(r.qty) if pd.notna(r.qty) else None,
+                'duration_text': str(r.duration_text) if pd.notna(r.duration_text) else None,
+                'weight_kg': float(r.weight_kg) if pd.notna(r.weight_kg) else None,
+                'total_weight_kg': float(r.total_weight_kg) if pd.notna(r.total_weight_kg) else None,
+                'unit_rate_inr': float(r.unit_rate_inr) if pd.notna(r.unit_rate_inr) else None,
+                'total_budget': float(r.total_budget) if pd.notna(r.total_budget) else None,
+                'computed_total': float(r.computed_total) if pd.notna(r.computed_total) else None,
+                'needs_review': bool(r.needs_review),
+                'raw_file': raw_file,
+                'created_at': r.get('created_at').strftime('%Y-%m-%d %H:%M:%S') if pd.notna(r.get('created_at')) else None
+            })
+        conn.execute(text("""INSERT INTO budget_items
+        (project_id, sl_no, description, responsible_agency, qty, duration_text,
+        weight_kg, total_weight_kg, unit_rate_inr, total_budget, computed_total, needs_review, raw_file, created_at)
+        VALUES
+        (:project_id, :sl_no, :description, :responsible_agency, :qty, :duration_text,
+         :weight_kg, :total_weight_kg, :unit_rate_inr, :total_budget, :computed_total, :needs_review, :raw_file, :created_at)
+        """), rows)
+        return len(rows)
+
+def transformed_frame(rows):
+    """Build a frame shaped like transform() output without parsing a file"""
+    rng = np.random.default_rng(0)
+    qty = rng.integers(1, 900, rows).astype(float)
+    rate = rng.uniform(100, 850, rows).round(2)
+    rate[::50] = np.nan  # the #REF! rows
+    weight = rng.uniform(0.5, 20, rows).round(2)
+    return pd.DataFrame({
+        'sl_no': np.arange(1, rows + 1),
+        'description': np.array(['Shaft for ESP', 'Grip Coupling for ESP', 'Pin Wheel for ESP'], dtype=object)[np.arange(rows) % 3],
+        'responsible_agency': np.array(AGENCIES, dtype=object)[np.arange(rows) % len(AGENCIES)],
+        'qty': qty,
+        'duration_text': 'Monthly',
+        'weight_kg': weight,
+        'total_weight_kg': weight * qty,
+        'unit_rate_inr': rate,
+        'total_budget': qty * rate,
+        'computed_total': qty * rate,
+        'needs_review': np.isnan(rate),
+        'created_at': datetime.now(timezone.utc),
+    })
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[10000, 1000000, 10000000])
+    parser.add_argument('--legacy-max-rows', type=int, default=1000000)
+    parser.add_argument('--db', default=None, help='DB URL to benchmark against (default: temporary SQLite)')
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'legacy s':>10} {'columnar s':>11} {'speedup':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if args.db:
+                engine = create_engine(args.db)
+                init_db(engine)
+                db_operations.engine = engine
+            else:
+                use_temp_database(tmp)
+        for rows in args.rows:
+            df = transformed_frame(rows)
+            new = timed(db_operations.replace_budget_items, df, 'bench.csv')
+            if rows <= args.legacy_max_rows:
+                old = timed(legacy_replace_budget_items, df, 'bench.csv')
+                print(f'{rows:>10} {old:>10.2f} {new:>11.2f} {old / new:>7.1f}x')
+            else:
+                print(f'{rows:>10} {"skipped":>10} {new:>11.2f} {"-":>8}')
+
+if __name__ == '__main__':
+    main()
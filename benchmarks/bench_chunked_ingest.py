@@ -0,0 +1,41 @@
+"""Peak memory of the whole-file ETL path versus the --chunk-size streaming path.
+
+Usage: python benchmarks/bench_chunked_ingest.py --rows 20000 80000 --chunk-size 5000
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+from datetime import datetime, timezone
+
+from bench_utils import make_budget_csv, use_temp_database, measure, mb
+from etl.preprocess import parse_file, transform
+from etl.etl_runner import run_streaming
+from db.db_operations import replace_budget_items
+
+def full_load(path):
+    df_t = transform(parse_file(path))
+    df_t['created_at'] = datetime.now(timezone.utc)
+    return replace_budget_items(df_t, os.path.basename(path))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[20000, 80000])
+    parser.add_argument('--chunk-size', type=int, default=5000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'mode':>10} {'seconds':>9} {'peak MB':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            use_temp_database(tmp)
+        for rows in args.rows:
+            path = make_budget_csv(os.path.join(tmp, f'budget_{rows}.csv'), rows)
+            secs, peak, _ = measure(full_load, path)
+            print(f'{rows:>10} {"full":>10} {secs:>9.2f} {mb(peak):>9.1f}')
+            with contextlib.redirect_stdout(io.StringIO()):
+                secs, peak, _ = measure(run_streaming, path, args.chunk_size)
+            print(f'{rows:>10} {"chunked":>10} {secs:>9.2f} {mb(peak):>9.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+"""parse_file with and without header-alias column pruning on a bhel_budget_large.csv-style export.
+
+Usage: python benchmarks/bench_column_pruning.py --rows 500000
+"""
+import argparse
+import os
+import tempfile
+
+from bench_utils import AGENCIES, measure, timed, mb
+from etl.preprocess import parse_file
+
+BHEL_HEADER = ('SL.NO,DESCRIPTION,RESPONSIBLE_AGENCY,QTY,DURATION,WEIGHT_KG,TOTAL_WEIGHT_KG,'
+               'UNIT_RATE_INR,TOTAL_BUDGET,DATE,PROJECT_NAME,APPROVED_BY,CURRENCY\n')
+
+def make_bhel_csv(path, rows):
+    with open(path, 'w', newline='') as f:
+        f.write(BHEL_HEADER)
+        for i in range(1, rows + 1):
+            qty = i % 900 + 1
+            f.write(f'{i},Complete manufacturing of Shaft {i} for ESP,{AGENCIES[i % 4]},{qty},Monthly,'
+                    f'{i % 20 + 0.5},{qty * (i % 20 + 0.5):.2f},{100 + i % 500:.2f},{qty * (100 + i % 500):.2f},'
+                    f'2025-01-{i % 28 + 1:02d},BHEL Ranipet L{i % 3 + 1},Kumar,INR\n')
+    return path
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=500000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_bhel_csv(os.path.join(tmp, 'bhel.csv'), args.rows)
+        print(f'{args.rows} rows, {mb(os.path.getsize(path)):.1f} MB')
+        print(f"{'mode':>14} {'seconds':>9} {'peak MB':>9} {'columns':>8}")
+        for name, prune in [('all columns', False), ('pruned', True)]:
+            secs = timed(parse_file, path, prune=prune)
+            _, peak, df = measure(parse_file, path, prune=prune)
+            print(f'{name:>14} {secs:>9.2f} {mb(peak):>9.1f} {len(df.columns):>8}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Dashboard Overview figures: full projects load + pandas filters versus the project_kpis view.
+
+Usage: python benchmarks/bench_dashboard_kpis.py --projects 100 10000 1000000
+
+The SQL timings clear the query cache first, so they are the cost of a rerun
+right after a write; unchanged reruns are cheaper still.
+"""
+import argparse
+import os
+import random
+import tempfile
+
+import pandas as pd
+
+from bench_utils import timed
+from dashboard.connection import ConnectionManager
+from dashboard.kpis import category_budget, counts_by, kpi_summary, project_kpis, recent_projects
+from dashboard.migrations import migrate
+
+DOMAINS = ['IT', 'Mechanical', 'Electrical', 'Civil', 'R&D']
+STATUSES = ['pending', 'under_review', 'approved', 'rejected']
+
+def seed(db, projects):
+    rng = random.Random(0)
+    with db.transaction() as conn:
+        conn.executemany('''
+            INSERT INTO projects (tracking_id, project_name, project_description, domain, priority, total_cost,
+                                  status, submitted_at, justification)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', ((f'PRJ{i:08d}', f'Project {i}', 'Upgrade of plant equipment ' * 4, rng.choice(DOMAINS), 'Medium',
+               rng.uniform(1e4, 1e7), rng.choice(STATUSES), f'2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} {i % 24:02d}:00:00',
+               'Needed for the next production cycle')
+              for i in range(projects)))
+        conn.executemany("INSERT INTO project_materials (project_id, category, amount_inr) VALUES (?, ?, ?)",
+                         ((i + 1, f'Category {i % 8}', float(i % 1000)) for i in range(projects)))
+
+def legacy_overview(db):
+    # What the page did before: load everything, then filter the frame per card
+    projects_df = pd.read_sql_query("SELECT * FROM projects ORDER BY submitted_at DESC", db.connection())
+    materials_df = pd.read_sql_query("SELECT * FROM project_materials", db.connection())
+    figures = [len(projects_df[projects_df['status'] == s]) for s in STATUSES]
+    figures += [projects_df['total_cost'].sum(), projects_df['total_cost'].mean(),
+                projects_df['status'].value_counts(), projects_df['domain'].value_counts(),
+                materials_df.groupby('category')['amount_inr'].sum(), projects_df.head(10)]
+    return figures
+
+def sql_overview(db):
+    db.cache.clear()
+    kpis = project_kpis(db)
+    return kpi_summary(kpis), counts_by(kpis, 'status'), counts_by(kpis, 'domain'), category_budget(db), recent_projects(db)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--projects', type=int, nargs='+', default=[100, 10000, 200000])
+    args = parser.parse_args()
+
+    for n in args.projects:
+        with tempfile.TemporaryDirectory() as tmp:
+            db = ConnectionManager(os.path.join(tmp, 'project_management.db'))
+            migrate(db.connection())
+            seed(db, n)
+            db.connection().execute('ANALYZE')
+            legacy = min(timed(legacy_overview, db) for _ in range(3))
+            sql = min(timed(sql_overview, db) for _ in range(3))
+            print(f'{n:>9} projects: load + pandas {legacy * 1000:9.1f} ms   SQL aggregates {sql * 1000:8.1f} ms')
+            db.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""Admin Panel BOQ Excel export: the cell-by-cell workbook versus dashboard/excel_export.py.
+
+Usage: python benchmarks/bench_excel_export.py --rows 1000 10000 100000 --old-max 10000
+
+The frame is shaped like the Admin Panel's BOQ table (12 columns, currency
+pre-formatted as text). The cell-by-cell writer, which also re-read every cell
+for the column widths, is only run up to --old-max rows; it takes minutes beyond.
+Seconds are measured without tracemalloc, peak MB in a second run with it.
+"""
+import argparse
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+from bench_utils import measure, mb, timed
+from dashboard.boq import MATERIAL_STATUSES
+from dashboard.excel_export import dataframe_to_xlsx
+
+def boq_frame(rows):
+    i = np.arange(rows)
+    amount = pd.Series(1000.0 * (i % 10 + 1))
+    return pd.DataFrame({
+        'S.No.': i + 1,
+        'Category': '1. Supply',
+        'Sub-topic': 'Raw Materials',
+        'Description': pd.Series(i).map('Item {} - supply and fit'.format),
+        'Units/Qty': 'Nos',
+        'Nos': i % 10 + 1,
+        'Unit Price (₹)': '₹1,000.00',
+        'Amount (₹)': amount.map('₹{:,.2f}'.format),
+        'Source/Type': 'Vendor Quote',
+        'Payment Schedule': 'Monthly',
+        'Justification': 'Per drawing',
+        'Current Status': pd.Series(MATERIAL_STATUSES).iloc[i % len(MATERIAL_STATUSES)].to_numpy(),
+    })
+
+def cell_by_cell(df):
+    # The export as the Admin Panel wrote it before dashboard/excel_export.py
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "BOQ Data"
+    for col_num, header in enumerate(df.columns, 1):
+        cell = ws.cell(row=1, column=col_num, value=header)
+        cell.font = Font(bold=True, color="FFFFFF")
+        cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        cell.alignment = Alignment(horizontal="center", vertical="center")
+        cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                             top=Side(style='thin'), bottom=Side(style='thin'))
+    for row_num, row_data in enumerate(df.values, 2):
+        for col_num, value in enumerate(row_data, 1):
+            cell = ws.cell(row=row_num, column=col_num, value=value)
+            cell.border = Border(left=Side(style='thin'), right=Side(style='thin'),
+                                 top=Side(style='thin'), bottom=Side(style='thin'))
+    for column in ws.columns:
+        max_length = max(len(str(cell.value)) for cell in column)
+        ws.column_dimensions[column[0].column_letter].width = min(max_length + 2, 50)
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+def write_only(df):
+    return dataframe_to_xlsx(df, "BOQ Data", status_column="Current Status")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--old-max', type=int, default=10000)
+    args = parser.parse_args()
+
+    print(f"{'rows':>7} {'writer':>14} {'seconds':>9} {'peak MB':>9} {'file MB':>9}")
+    for rows in args.rows:
+        df = boq_frame(rows)
+        writers = [('cell-by-cell', cell_by_cell)] if rows <= args.old_max else []
+        for name, fn in writers + [('write-only', write_only)]:
+            secs = timed(fn, df)
+            _, peak, data = measure(fn, df)
+            print(f'{rows:>7} {name:>14} {secs:>9.2f} {mb(peak):>9.1f} {mb(len(data)):>9.1f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""pd.read_excel versus the read-only streaming reader on a generated workbook.
+
+Usage: python benchmarks/bench_excel_reader.py --rows 200000 --chunk-size 10000
+
+The workbook has a title block above the table, like the costing sheets in
+data/uploads, so the streaming reader also has to find the header row.
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+from openpyxl import Workbook
+
+from bench_utils import SAMPLE_HEADER, budget_line, measure, timed, mb
+from etl.excel_reader import iter_excel_chunks, read_excel_streaming
+from etl.preprocess import transform
+
+def _cell(value):
+    try:
+        return float(value) if '.' in value else int(value)
+    except ValueError:
+        return value
+
+def make_budget_xlsx(path, rows):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Budget')
+    ws.append(['BHEL Ranipet - Budget Sheet'])
+    ws.append([])
+    ws.append(SAMPLE_HEADER.strip().split(','))
+    for i in range(1, rows + 1):
+        ws.append([_cell(v) for v in budget_line(i).strip().split(',')])
+    wb.save(path)
+    return path
+
+def pandas_full(path):
+    return transform(pd.read_excel(path, header=2))
+
+def streaming_full(path, chunk_size):
+    return transform(read_excel_streaming(path, chunk_size))
+
+def streaming_chunked(path, chunk_size):
+    rows = 0
+    for chunk in iter_excel_chunks(path, chunk_size):
+        rows += len(transform(chunk))
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--chunk-size', type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = make_budget_xlsx(os.path.join(tmp, 'budget.xlsx'), args.rows)
+        print(f'{args.rows} rows, {mb(os.path.getsize(path)):.1f} MB workbook')
+        print(f"{'reader':>22} {'seconds':>9} {'peak MB':>9}")
+        for name, fn, extra in [('pd.read_excel', pandas_full, ()),
+                                ('read-only, whole file', streaming_full, (args.chunk_size,)),
+                                ('read-only, chunked', streaming_chunked, (args.chunk_size,))]:
+            secs = timed(fn, path, *extra)
+            _, peak, _ = measure(fn, path, *extra)
+            print(f'{name:>22} {secs:>9.2f} {mb(peak):>9.1f}')
+
+if __name__ == '__main__':
+    main()
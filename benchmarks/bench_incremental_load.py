@@ -0,0 +1,73 @@
+"""Full reload versus --incremental upsert when only a few rows changed.
+
+Usage: python benchmarks/bench_incremental_load.py --rows 1000000 --changed 0.001
+
+Runs against a temporary SQLite database in WAL mode with auto-checkpoints
+off, so the -wal file size after each load is the write volume of that load.
+"""
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+import numpy as np
+from sqlalchemy import event, text
+
+from bench_utils import use_temp_database, mb
+from bench_bulk_writer import transformed_frame
+import db.db_operations as db_operations
+
+def wal_bytes(db_path):
+    wal = db_path + '-wal'
+    return os.path.getsize(wal) if os.path.exists(wal) else 0
+
+def checkpoint():
+    with db_operations.engine.begin() as conn:
+        conn.execute(text('PRAGMA wal_checkpoint(TRUNCATE)'))
+
+def timed_load(fn, df, db_path):
+    checkpoint()
+    start = time.perf_counter()
+    result = fn(df, 'bench.csv')
+    return time.perf_counter() - start, wal_bytes(db_path), result
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--changed', type=float, default=0.001, help='fraction of rows edited between loads')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with contextlib.redirect_stdout(io.StringIO()):
+            engine = use_temp_database(tmp)
+        db_path = os.path.join(tmp, 'bench.db')
+
+        @event.listens_for(engine, 'connect')
+        def _wal(dbapi_conn, _):
+            dbapi_conn.execute('PRAGMA journal_mode=WAL')
+            dbapi_conn.execute('PRAGMA wal_autocheckpoint=0')
+        engine.dispose()
+
+        df = transformed_frame(args.rows)
+        db_operations.replace_budget_items(df, 'bench.csv')
+
+        # Edit a random slice of rows, as a re-exported sheet with a few corrections would
+        edited = df.copy()
+        n_changed = max(1, int(args.rows * args.changed))
+        idx = np.random.default_rng(1).choice(args.rows, n_changed, replace=False)
+        edited.loc[idx, 'unit_rate_inr'] = edited.loc[idx, 'unit_rate_inr'].fillna(0) + 1
+
+        full_s, full_wal, _ = timed_load(db_operations.replace_budget_items, edited, db_path)
+        db_operations.replace_budget_items(df, 'bench.csv')
+        inc_s, inc_wal, counts = timed_load(db_operations.upsert_budget_items, edited, db_path)
+
+    print(f'{args.rows} rows, {n_changed} changed')
+    print(f"{'mode':>12} {'seconds':>9} {'WAL MB':>9}")
+    print(f"{'full':>12} {full_s:>9.2f} {mb(full_wal):>9.1f}")
+    print(f"{'incremental':>12} {inc_s:>9.2f} {mb(inc_wal):>9.1f}")
+    print('incremental counts:', counts)
+
+if __name__ == '__main__':
+    main()
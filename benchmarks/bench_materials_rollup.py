@@ -0,0 +1,74 @@
+"""Cumulative cost figures: full project_materials load + pandas groupby versus the rollup tables.
+
+Usage: python benchmarks/bench_materials_rollup.py --rows 1000 100000 1000000
+
+Also reports what the rollup triggers add to a bulk BOQ insert, since every
+written row now updates three small tables as well.
+"""
+import argparse
+import os
+import random
+import tempfile
+
+import pandas as pd
+
+from bench_utils import timed
+from dashboard.connection import ConnectionManager
+from dashboard.kpis import category_budget, material_summary, material_totals
+from dashboard.migrations import migrate
+
+STATUSES = ['pending', 'under_review', 'approved', 'rejected']
+
+def rows(n, rng):
+    return [(i // 20 + 1, f'Category {i % 12}', f'Item {i}', rng.choice(STATUSES), rng.uniform(100, 1e5))
+            for i in range(n)]
+
+def insert(db, data):
+    with db.transaction() as conn:
+        conn.executemany('''
+            INSERT INTO project_materials (project_id, category, description, status, amount_inr)
+            VALUES (?, ?, ?, ?, ?)
+        ''', data)
+
+def drop_rollup_triggers(db):
+    with db.transaction() as conn:
+        for event in ('insert', 'update', 'delete'):
+            conn.execute(f'DROP TRIGGER trg_project_materials_{event}_totals')
+
+def legacy_costs(db):
+    # What the Super User page did before: load every BOQ row, then group in pandas
+    materials_df = pd.read_sql_query("SELECT * FROM project_materials", db.connection())
+    category_costs = materials_df.groupby('category')['amount_inr'].sum().reset_index()
+    return (category_costs.sort_values('amount_inr', ascending=False), materials_df['amount_inr'].sum(),
+            len(materials_df), materials_df.groupby('status')['amount_inr'].sum(),
+            materials_df.groupby('project_id')['amount_inr'].sum())
+
+def rollup_costs(db):
+    db.cache.clear()
+    return (category_budget(db), material_summary(db), material_totals(db, 'status'),
+            material_totals(db, 'project_id'))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 100000, 500000])
+    args = parser.parse_args()
+
+    for n in args.rows:
+        data = rows(n, random.Random(0))
+        inserts = {}
+        for label in ('no triggers', 'rollups'):
+            with tempfile.TemporaryDirectory() as tmp:
+                db = ConnectionManager(os.path.join(tmp, 'project_management.db'))
+                migrate(db.connection())
+                if label == 'no triggers':
+                    drop_rollup_triggers(db)
+                inserts[label] = timed(insert, db, data)
+                if label == 'rollups':
+                    legacy = min(timed(legacy_costs, db) for _ in range(3))
+                    rollup = min(timed(rollup_costs, db) for _ in range(3))
+                db.close()
+        print(f'{n:>8} BOQ rows: load + groupby {legacy * 1000:9.1f} ms   rollups {rollup * 1000:6.1f} ms   '
+              f'insert {inserts["no triggers"]:.2f}s -> {inserts["rollups"]:.2f}s with triggers')
+
+if __name__ == '__main__':
+    main()
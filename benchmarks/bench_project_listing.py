@@ -0,0 +1,45 @@
+"""Admin Panel project list: get_projects() of everything versus one keyset page.
+
+Usage: python benchmarks/bench_project_listing.py --projects 200000
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from bench_utils import timed
+from bench_dashboard_kpis import seed
+from dashboard.connection import ConnectionManager
+from dashboard.listing import list_projects
+from dashboard.migrations import migrate
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--projects', type=int, default=200000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ConnectionManager(os.path.join(tmp, 'project_management.db'))
+        migrate(db.connection())
+        seed(db, args.projects)
+        db.connection().execute('ANALYZE')
+
+        full = timed(pd.read_sql_query, "SELECT * FROM projects ORDER BY submitted_at DESC", db.connection())
+        print(f'{args.projects} projects')
+        print(f'get_projects(), all rows:           {full * 1000:9.1f} ms')
+        for label, filters in (('no filter', None), ("status='pending'", {'status': 'pending'})):
+            db.cache.clear()
+            first = timed(list_projects, db, filters)
+            # Keys for page 100, then time only fetching that page
+            db.cache.clear()
+            df, key = list_projects(db, filters)
+            for _ in range(98):
+                df, key = list_projects(db, filters, after=key)
+            db.cache.clear()
+            deep = timed(list_projects, db, filters, None, key)
+            print(f'{label:18s} page 1: {first * 1000:7.2f} ms   page 100: {deep * 1000:7.2f} ms')
+        db.close()
+
+if __name__ == '__main__':
+    main()
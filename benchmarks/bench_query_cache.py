@@ -0,0 +1,45 @@
+"""get_projects() rerun cost with and without the table_versions query cache.
+
+Usage: python benchmarks/bench_query_cache.py --projects 20000 --reruns 50
+"""
+import argparse
+import os
+import tempfile
+
+import pandas as pd
+
+from bench_utils import timed
+from dashboard.connection import ConnectionManager
+from dashboard.migrations import migrate
+
+QUERY = "SELECT * FROM projects ORDER BY submitted_at DESC"
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--projects', type=int, default=20000)
+    parser.add_argument('--reruns', type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db = ConnectionManager(os.path.join(tmp, 'project_management.db'))
+        migrate(db.connection())
+        with db.transaction() as conn:
+            conn.executemany(
+                "INSERT INTO projects (tracking_id, project_name, domain, status, total_cost) VALUES (?, ?, ?, ?, ?)",
+                [(f'PRJ{i:07d}', f'Project {i}', 'IT', 'pending', float(i)) for i in range(args.projects)])
+
+        uncached = timed(lambda: [pd.read_sql_query(QUERY, db.connection()) for _ in range(args.reruns)])
+        cached = timed(lambda: [db.cached_query(QUERY, ['projects']) for _ in range(args.reruns)])
+        # One write between reruns: the next read must miss and see it
+        with db.transaction() as conn:
+            conn.execute("UPDATE projects SET status = 'approved' WHERE id = 1")
+        fresh = (db.cached_query(QUERY, ['projects'])['status'] == 'approved').sum() == 1
+        db.close()
+
+    print(f'{args.projects} projects, {args.reruns} reruns')
+    print(f'read_sql_query every rerun: {uncached / args.reruns * 1000:8.2f} ms/rerun')
+    print(f'query cache:                {cached / args.reruns * 1000:8.2f} ms/rerun')
+    print(f'write seen after rerun: {fresh}, stats: {db.cache.stats()}')
+
+if __name__ == '__main__':
+    main()
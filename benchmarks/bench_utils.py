@@ -0,0 +1,66 @@
+"""Shared helpers for the scripts in benchmarks/"""
+import sys
+import os
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from sqlalchemy import create_engine
+import db.db_operations as db_operations
+from deploy.init_db import init_db
+
+SAMPLE_HEADER = 'SL.NO,DESCRIPTION,Responsible Agency,Qty,Duration,weight /KG,Total weight /Kg,unit rate in INR,Total Budget\n'
+AGENCIES = ['Sub Contractor', 'SriVidhya Fabricators', 'BHEL Ranipet', 'In-house']
+
+def budget_line(i):
+    # Every 50th row carries the Excel error tokens seen in real exports
+    if i % 50 == 0:
+        return f'{i},Item {i} for ESP,{AGENCIES[i % 4]},{i % 900 + 1},one time,#REF!,#REF!,#REF!,#ERROR!\n'
+    qty = i % 900 + 1
+    rate = 100 + (i % 500) * 1.5
+    return f'{i},Item {i} for ESP,{AGENCIES[i % 4]},{qty},Monthly,{i % 20 + 0.5},{qty * (i % 20 + 0.5):.2f},{rate:.2f},{qty * rate:.2f}\n'
+
+def make_budget_csv(path, rows):
+    """Write a sample_budget.csv-style file of the given size without holding it in memory"""
+    with open(path, 'w', newline='') as f:
+        f.write(SAMPLE_HEADER)
+        block = []
+        for i in range(1, rows + 1):
+            block.append(budget_line(i))
+            if len(block) == 10000:
+                f.writelines(block)
+                block = []
+        f.writelines(block)
+    return path
+
+def use_temp_database(directory):
+    """Point db_operations at a fresh SQLite file with the budget_items table"""
+    engine = create_engine('sqlite:///' + os.path.join(directory, 'bench.db'), echo=False)
+    init_db(engine)
+    db_operations.engine = engine
+    return engine
+
+def measure(fn, *args, **kwargs):
+    """Return (seconds, peak traced bytes, result) for one call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        result = fn(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak, result
+
+def timed(fn, *args, **kwargs):
+    """Wall-clock seconds for one call, without tracemalloc's overhead"""
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+def mb(n_bytes):
+    return n_bytes / (1024 * 1024)
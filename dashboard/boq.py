@@ -0,0 +1,239 @@
+"""BOQ (project_materials) rows: entry options, grouping for display, and bulk review updates"""
+import itertools
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Categories/topics of a BOQ row with their subtopics, shared by the Material Entry and Submit Project forms
+BOQ_TOPICS = {
+    "1. Supply": [
+        "Fabrication (without machining)",
+        "Fabrication (with machining)",
+        "Raw Materials",
+        "Components & Parts",
+        "Equipment Supply",
+        "Tools & Instruments"
+    ],
+    "2. Erection": [
+        "Structural Erection",
+        "Mechanical Erection",
+        "Electrical Erection",
+        "Piping Erection",
+        "Instrumentation Erection",
+        "Civil Works"
+    ],
+    "3. Erection & Commissioning": [
+        "Installation & Testing",
+        "Commissioning Services",
+        "Start-up Support",
+        "Performance Testing",
+        "Training & Documentation",
+        "Warranty Support"
+    ],
+    "4. Running Expenses": [
+        "Fuel & Energy",
+        "Maintenance Materials",
+        "Spare Parts",
+        "Consumables",
+        "Utilities",
+        "Operational Supplies"
+    ],
+    "5. Project Management Service PMC": [
+        "Project Planning",
+        "Quality Control",
+        "Safety Management",
+        "Progress Monitoring",
+        "Coordination Services",
+        "Documentation Management"
+    ],
+    "6. Travels & Others": [
+        "Travel Expenses",
+        "Accommodation",
+        "Transportation",
+        "Communication",
+        "Miscellaneous Expenses",
+        "Contingency"
+    ],
+    "7. Bonds & Guarantee": [
+        "Performance Bond",
+        "Bank Guarantee",
+        "Warranty Bond",
+        "Insurance",
+        "Retention Money",
+        "Security Deposits"
+    ],
+    "8. Statutory expenses": [
+        "Taxes & Duties",
+        "Licenses & Permits",
+        "Regulatory Compliance",
+        "Environmental Clearances",
+        "Safety Certifications",
+        "Legal Fees"
+    ],
+    "9. Over head - Chennai office": [
+        "Office Rent",
+        "Utilities",
+        "Staff Salaries",
+        "Administrative Costs",
+        "IT Infrastructure",
+        "General Expenses"
+    ],
+    "10. Export": [
+        "Export Documentation",
+        "Shipping & Logistics",
+        "Customs Clearance",
+        "International Compliance",
+        "Currency Exchange",
+        "Export Incentives"
+    ],
+    "11. Engineering & PMC Support - Third Party": [
+        "Design Engineering",
+        "Technical Consultancy",
+        "Third Party Inspection",
+        "Testing Services",
+        "Certification Services",
+        "Expert Consultation"
+    ],
+    "12. Service Charges": [
+        "Professional Services",
+        "Consultancy Fees",
+        "Technical Support",
+        "Maintenance Services",
+        "Training Services",
+        "After Sales Support"
+    ],
+    "13. Royaltee": [
+        "Technology License",
+        "Patent Fees",
+        "Intellectual Property",
+        "Software Licenses",
+        "Brand Licensing",
+        "Technical Know-how"
+    ],
+    "14. Contigencies": [
+        "Project Contingency",
+        "Price Escalation",
+        "Scope Changes",
+        "Risk Mitigation",
+        "Unforeseen Events",
+        "Buffer Amount"
+    ],
+    "15. Net Margin": [
+        "Profit Margin",
+        "Overhead Recovery",
+        "Risk Premium",
+        "Company Profit",
+        "Return on Investment",
+        "Financial Returns"
+    ]
+}
+
+BOQ_UNITS = ["kgs", "MT", "mtrs", "Sq.ft", "Sq.Mtr", "Litres", "RMT", "No,s"]
+BOQ_NOS = list(range(1, 21))
+BOQ_SOURCE_TYPES = ["Vendor Quote", "Company Costing", "Free Issue"]
+BOQ_PAYMENT_SCHEDULES = ["Ontime", "Monthly"]
+BOQ_DISPLAY_COLUMNS = ["S.No.", "Sub-topic", "Description", "Units/Qty", "Nos", "Unit Price Total Amount", "Amount INR"]
+
+def group_entries(entries, category=None):
+    """BOQ rows entered in the session, grouped by category for display.
+
+    entries is the list of row dicts the entry forms append to; category
+    keeps only that category. Returns (category, rows, total) per category in
+    sorted order: rows is a pyarrow Table of BOQ_DISPLAY_COLUMNS, numbered by
+    'S.No.' in entry order, and total is the category's 'Amount INR' sum.
+    """
+    # pyarrow (which Streamlit requires) rather than pandas: one table for all rows, sliced
+    # per category without copies, and st.dataframe sends Arrow tables without converting them
+    table = pa.Table.from_pylist(entries)
+    if category is not None:
+        table = table.filter(pc.equal(table['Category'], category))
+    table = table.take(pc.sort_indices(table, sort_keys=[('Category', 'ascending')]))  # stable sort
+    groups, offset = [], 0
+    for cat, run in itertools.groupby(table['Category'].to_pylist()):
+        length = len(list(run))
+        rows = table.slice(offset, length)
+        rows = rows.add_column(0, 'S.No.', pa.array(range(1, length + 1)))
+        groups.append((cat, rows.select(BOQ_DISPLAY_COLUMNS), pc.sum(rows['Amount INR']).as_py()))
+        offset += length
+    return groups
+
+MATERIAL_STATUSES = ['pending', 'under_review', 'approved', 'rejected']
+REVIEW_COLUMNS = ['status', 'review_comments', 'finalized']
+
+# SQLite caps bound parameters per statement; stay well below the oldest limit (999)
+_ID_BATCH = 500
+
+def _review_values(df):
+    # Same normalisation for database rows and form values, so None vs '' or 1 vs True is not a change
+    return pd.DataFrame({
+        'status': df['status'].fillna('pending').astype(str),
+        'review_comments': df['review_comments'].fillna('').astype(str),
+        'finalized': df['finalized'].fillna(0).astype(bool),
+    }, index=df.index)
+
+def review_grid(materials):
+    """The Admin Panel's review grid for materials (as loaded by get_materials_by_project).
+
+    Indexed by material id: 'S.No.' and the descriptive columns are shown
+    read-only next to the editable REVIEW_COLUMNS, normalised as for the diff.
+    """
+    grid = _review_values(materials.set_index('id'))
+    for position, column in enumerate(['category', 'subtopic', 'description', 'amount_inr']):
+        grid.insert(position, column, materials[column].to_numpy())
+    grid.insert(0, 'S.No.', np.arange(1, len(grid) + 1))
+    return grid
+
+def review_changes(current, proposed):
+    """Rows of proposed whose status, comments or finalized flag differ from current.
+
+    Both frames carry an 'id' column plus REVIEW_COLUMNS; ids missing from
+    current count as changed so the update reports them as not found.
+    """
+    cur = _review_values(current.set_index('id'))
+    new = _review_values(proposed.set_index('id'))
+    # Reindexing leaves NaN for unknown ids, which never compares equal
+    changed = (cur.reindex(new.index) != new).any(axis=1)
+    return new[changed.to_numpy()].reset_index()
+
+def _existing_ids(conn, ids):
+    found = set()
+    for start in range(0, len(ids), _ID_BATCH):
+        batch = ids[start:start + _ID_BATCH]
+        placeholders = ','.join('?' * len(batch))
+        found.update(row[0] for row in conn.execute(
+            f'SELECT id FROM project_materials WHERE id IN ({placeholders})', batch))
+    return found
+
+def bulk_update_material_status(db, current, proposed, reviewed_by='Admin'):
+    """Apply the rows of proposed that changed, in one transaction.
+
+    current and proposed are frames with 'id' and REVIEW_COLUMNS (current as
+    loaded by get_materials_by_project). Returns one row per proposed id with
+    a 'result' of 'updated', 'unchanged', 'invalid_status' or 'not_found'.
+    """
+    results = pd.DataFrame({'id': proposed['id'].astype(int).to_numpy(), 'result': 'unchanged'})
+    changes = review_changes(current, proposed)
+    valid = changes['status'].isin(MATERIAL_STATUSES)
+    results.loc[results['id'].isin(changes.loc[~valid, 'id']), 'result'] = 'invalid_status'
+    changes = changes[valid]
+    if changes.empty:
+        return results
+
+    ids = changes['id'].astype(int).tolist()
+    with db.transaction() as conn:
+        found = _existing_ids(conn, ids)
+        changes = changes[changes['id'].isin(found)]
+        rows = zip(changes['status'], changes['review_comments'],
+                   np.where(changes['finalized'], 1, 0).tolist(), changes['id'].astype(int).tolist())
+        conn.executemany('''
+            UPDATE project_materials
+            SET status = ?, review_comments = ?, reviewed_by = ?, reviewed_at = CURRENT_TIMESTAMP, finalized = ?
+            WHERE id = ?
+        ''', ((status, comments, reviewed_by, finalized, material_id)
+              for status, comments, finalized, material_id in rows))
+
+    results.loc[results['id'].isin(ids), 'result'] = 'not_found'
+    results.loc[results['id'].isin(changes['id']), 'result'] = 'updated'
+    return results
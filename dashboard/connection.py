@@ -0,0 +1,91 @@
+"""Shared database connections for the Streamlit app.
+
+Each thread gets one long-lived connection to project_management.db instead of
+a new sqlite3.connect() per helper call. Connections run in WAL mode so page
+reads keep working while another session writes.
+
+Set DASHBOARD_DATABASE_URL to a postgresql:// URL to use the PostgreSQL
+backend (dashboard/postgres.py) instead, e.g. for several app replicas behind
+a load balancer. Both managers offer transaction(), cached_query(), fetchone(),
+migrate(), close(), the query cache and an Error exception class.
+"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+import streamlit as st
+from sqlalchemy.engine import make_url
+
+from db import db_config
+from dashboard.migrations import migrate
+from dashboard.query_cache import QueryCache
+
+DB_PATH = 'project_management.db'
+BUSY_TIMEOUT_SECONDS = 5.0
+
+class ConnectionManager:
+    Error = sqlite3.Error
+
+    def __init__(self, path=DB_PATH, busy_timeout=BUSY_TIMEOUT_SECONDS):
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.cache = QueryCache()
+        self._local = threading.local()
+
+    def _connect(self):
+        # timeout is sqlite's busy handler: wait for a writer instead of failing with "database is locked"
+        conn = sqlite3.connect(self.path, timeout=self.busy_timeout)
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        return conn
+
+    def connection(self):
+        """This thread's connection, opened on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            self._local.conn = conn
+        return conn
+
+    def cached_query(self, sql, tables, params=()):
+        """Run a read through the shared QueryCache; tables are the ones sql reads"""
+        return self.cache.read_sql(self.connection(), sql, tables, params)
+
+    def fetchone(self, sql, params=()):
+        return self.connection().execute(sql, params).fetchone()
+
+    @contextmanager
+    def transaction(self):
+        """Yield this thread's connection; commit on success, roll back on error"""
+        conn = self.connection()
+        with conn:
+            yield conn
+
+    def migrate(self):
+        return migrate(self.connection())
+
+    def close(self):
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+def connection_manager(url=None):
+    """ConnectionManager for a sqlite:/// URL or a plain file path, PostgresConnectionManager
+    for a postgresql:// URL (default DASHBOARD_DATABASE_URL)"""
+    url = url or db_config.DASHBOARD_DB_URL
+    if '://' not in url:
+        return ConnectionManager(url)
+    url = make_url(url)
+    if url.get_backend_name() == 'sqlite':
+        return ConnectionManager(url.database or DB_PATH)
+    # psycopg2 is only needed, and only imported, when PostgreSQL is configured
+    from dashboard.postgres import PostgresConnectionManager
+    return PostgresConnectionManager(url)
+
+@st.cache_resource
+def get_connection_manager(url=None):
+    """One manager per process, shared by every session; brings the schema up to date on creation"""
+    manager = connection_manager(url)
+    manager.migrate()
+    return manager
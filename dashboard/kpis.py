@@ -0,0 +1,95 @@
+"""Dashboard Overview figures computed in SQL.
+
+Each function returns a small frame (one row per status, domain or category).
+Project figures come from project_kpi_totals and BOQ figures from the
+material_totals_by_* tables, which triggers keep current
+(dashboard/migrations.py), so the page cost does not grow with the number of
+projects or BOQ rows. Results go through the connection manager's query cache.
+"""
+from dashboard.listing import STATUSES as PROJECT_STATUSES, project_filters_sql
+from dashboard.migrations import MATERIAL_ROLLUPS
+
+def project_kpis(db):
+    """Counts and cost sums per (status, domain) from the project_kpis view"""
+    return db.cached_query("SELECT * FROM project_kpis", ['projects'])
+
+def kpi_summary(kpis):
+    """Headline numbers for the metric cards, from project_kpis(db)"""
+    by_status = kpis.groupby('status')['projects'].sum()
+    total = int(kpis['projects'].sum())
+    costed = kpis['costed_projects'].sum()
+    summary = {status: int(by_status.get(status, 0)) for status in PROJECT_STATUSES}
+    summary.update(
+        total=total,
+        total_budget=float(kpis['total_cost'].sum()),
+        # Same as pandas mean() over total_cost: projects without a cost are skipped
+        avg_cost=float(kpis['total_cost'].sum() / costed) if costed else 0.0,
+        approval_rate=summary['approved'] / total * 100 if total else 0.0,
+    )
+    return summary
+
+def counts_by(kpis, column):
+    """Project counts by 'status' or 'domain', largest first, like Series.value_counts()"""
+    counts = kpis.dropna(subset=[column]).groupby(column)['projects'].sum()
+    return counts[counts > 0].sort_values(ascending=False)
+
+def material_totals(db, by):
+    """BOQ entry counts and amount_inr sums per 'project_id', 'category' or 'status',
+    largest amount first, from the trigger-maintained material_totals_by_* tables"""
+    if by not in MATERIAL_ROLLUPS:
+        raise ValueError(f'no materials rollup by {by!r}')
+    table, _type, empty = MATERIAL_ROLLUPS[by]
+    return db.cached_query(f'''
+        SELECT NULLIF({by}, {empty}) AS {by}, entries, amount_inr
+        FROM {table}
+        WHERE entries > 0
+        ORDER BY amount_inr DESC
+    ''', ['project_materials'])
+
+def material_summary(db):
+    """Total BOQ entries and amount_inr across all projects"""
+    totals = material_totals(db, 'status')
+    return {'entries': int(totals['entries'].sum()), 'amount_inr': float(totals['amount_inr'].sum())}
+
+def category_budget(db):
+    totals = material_totals(db, 'category')
+    return totals.loc[totals['category'].notna(), ['category', 'amount_inr']].reset_index(drop=True)
+
+def recent_projects(db, limit=10):
+    return db.cached_query('''
+        SELECT tracking_id, project_name, domain, priority, total_cost, status, submitted_at
+        FROM projects
+        ORDER BY submitted_at DESC, id DESC
+        LIMIT ?
+    ''', ['projects'], (limit,))
+
+# Analytics page: the same figures over an optional filter (see dashboard/listing.py)
+
+def project_totals(db, filters=None, search=None):
+    where, params = project_filters_sql(filters, search)
+    return db.cached_query(f'''
+        SELECT COUNT(*) AS projects, SUM(total_cost) AS total_cost, AVG(total_cost) AS avg_cost,
+               COUNT(CASE WHEN status = 'approved' THEN 1 END) AS approved
+        FROM projects{where}
+    ''', ['projects'], params).iloc[0]
+
+def projects_per_day(db, filters=None, search=None):
+    where, params = project_filters_sql(filters, search)
+    return db.cached_query(f'''
+        SELECT date(submitted_at) AS "Date", COUNT(*) AS "Projects Submitted"
+        FROM projects{where}
+        GROUP BY 1
+        ORDER BY 1
+    ''', ['projects'], params)
+
+def budget_by(db, column, filters=None, search=None):
+    """Summed total_cost per 'domain' or 'priority'"""
+    if column not in ('domain', 'priority', 'status'):
+        raise ValueError(f'cannot group projects by {column!r}')
+    where, params = project_filters_sql(filters, search)
+    where += (' AND ' if where else ' WHERE ') + f'{column} IS NOT NULL'
+    return db.cached_query(f'''
+        SELECT {column}, SUM(total_cost) AS total_cost
+        FROM projects{where}
+        GROUP BY {column}
+    ''', ['projects'], params)
@@ -0,0 +1,72 @@
+"""Filtered, keyset-paginated project listing.
+
+Pages are ordered newest first on (submitted_at, id). Instead of an OFFSET,
+each request passes the key of the last row it has already shown, so fetching
+page 500 costs the same as fetching page 1.
+"""
+from datetime import timedelta
+
+import pandas as pd
+
+# Choices offered on the Submit Project form
+DOMAINS = ["Civil Engineering", "Mechanical Engineering", "Electrical Engineering", "Multi-Domain"]
+PRIORITIES = ["Low", "Medium", "High", "Urgent"]
+STATUSES = ['pending', 'under_review', 'approved', 'rejected']
+
+PAGE_SIZE = 50
+
+def _like(text):
+    # Treat the user's text literally inside a LIKE pattern
+    return '%' + text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+
+def project_filters_sql(filters=None, search=None):
+    """WHERE clause (possibly empty) and params for the listing and analytics queries.
+
+    filters may hold 'status', 'domain', 'priority' (a value or a list of values),
+    'department' (text, matched anywhere, any case), 'date_from' and 'date_to'
+    (dates, inclusive). search matches project name or tracking ID.
+    """
+    filters = filters or {}
+    clauses, params = [], []
+    for column in ('status', 'domain', 'priority'):
+        values = filters.get(column)
+        if not values:
+            continue
+        values = [values] if isinstance(values, str) else list(values)
+        clauses.append(f"{column} IN ({','.join('?' * len(values))})")
+        params.extend(values)
+    if filters.get('department'):
+        # LIKE ignores case on SQLite but not on PostgreSQL; LOWER() on both sides behaves the same on each
+        clauses.append("LOWER(department) LIKE LOWER(?) ESCAPE '\\'")
+        params.append(_like(filters['department']))
+    if filters.get('date_from'):
+        clauses.append("submitted_at >= ?")
+        params.append(str(filters['date_from']))
+    if filters.get('date_to'):
+        # Inclusive end date: everything before the start of the next day
+        clauses.append("submitted_at < ?")
+        params.append(str(pd.Timestamp(filters['date_to']).date() + timedelta(days=1)))
+    if search:
+        clauses.append("(LOWER(project_name) LIKE LOWER(?) ESCAPE '\\' OR LOWER(tracking_id) LIKE LOWER(?) ESCAPE '\\')")
+        params.extend([_like(search), _like(search)])
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+def list_projects(db, filters=None, search=None, after=None, limit=PAGE_SIZE):
+    """One page of projects, newest first.
+
+    after is the (submitted_at, id) key returned with the previous page, or None
+    for the first page. Returns (frame, key of the next page or None if this is
+    the last one).
+    """
+    where, params = project_filters_sql(filters, search)
+    if after is not None:
+        where += (' AND ' if where else ' WHERE ') + '(submitted_at, id) < (?, ?)'
+        params.extend(after)
+    # One extra row tells us whether another page exists without a COUNT(*)
+    sql = f'SELECT * FROM projects{where} ORDER BY submitted_at DESC, id DESC LIMIT ?'
+    df = db.cached_query(sql, ['projects'], (*params, limit + 1))
+    if len(df) <= limit:
+        return df, None
+    df = df.iloc[:limit]
+    last = df.iloc[-1]
+    return df, (last['submitted_at'], int(last['id']))
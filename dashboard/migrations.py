@@ -0,0 +1,287 @@
+"""Versioned schema migrations for project_management.db.
+
+The applied version is stored in SQLite's PRAGMA user_version. migrate()
+applies every migration newer than that, each in its own transaction, and
+is a no-op on an up-to-date database. Append new migrations to MIGRATIONS;
+never edit one that has shipped.
+"""
+
+def _create_tables(cursor):
+    # Create projects table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS projects (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            tracking_id TEXT UNIQUE,
+            project_name TEXT NOT NULL,
+            project_description TEXT,
+            domain TEXT,
+            priority TEXT,
+            estimated_budget REAL,
+            manpower_count INTEGER,
+            manpower_cost REAL,
+            material_cost REAL,
+            equipment_cost REAL,
+            other_costs REAL,
+            total_cost REAL,
+            start_date DATE,
+            end_date DATE,
+            department TEXT,
+            contact_email TEXT,
+            contact_phone TEXT,
+            justification TEXT,
+            risk_assessment TEXT,
+            expected_outcome TEXT,
+            status TEXT DEFAULT 'pending',
+            submitted_by TEXT,
+            submitted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            reviewed_by TEXT,
+            review_date TIMESTAMP,
+            review_comments TEXT
+        )
+    ''')
+
+    # Create notifications table
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notifications (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER,
+            notification_type TEXT,
+            title TEXT,
+            message TEXT,
+            is_read BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (project_id) REFERENCES projects (id)
+        )
+    ''')
+    # Create project_materials table if not exists (preserve existing data)
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS project_materials (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            project_id INTEGER,
+            category TEXT,
+            subtopic TEXT,
+            description TEXT,
+            units_qty TEXT,
+            nos INTEGER,
+            source_type TEXT,
+            payment_schedule TEXT,
+            unit_price REAL,
+            amount_inr REAL,
+            justification TEXT,
+            justification_type TEXT,
+            justification_file_path TEXT,
+            status TEXT DEFAULT 'pending',
+            review_comments TEXT,
+            reviewed_by TEXT,
+            reviewed_at TIMESTAMP,
+            finalized BOOLEAN DEFAULT 0,
+            FOREIGN KEY (project_id) REFERENCES projects (id)
+        )
+    ''')
+
+    # Databases created before the review workflow lack these columns
+    cursor.execute("PRAGMA table_info(project_materials)")
+    existing_cols = {row[1] for row in cursor.fetchall()}
+    columns_to_add = [
+        ("status", "TEXT", "'pending'"),
+        ("review_comments", "TEXT", None),
+        ("reviewed_by", "TEXT", None),
+        ("reviewed_at", "TIMESTAMP", None),
+        ("finalized", "BOOLEAN", "0"),
+    ]
+    for col_name, col_type, default_val in columns_to_add:
+        if col_name not in existing_cols:
+            if default_val is not None:
+                cursor.execute(f"ALTER TABLE project_materials ADD COLUMN {col_name} {col_type} DEFAULT {default_val}")
+            else:
+                cursor.execute(f"ALTER TABLE project_materials ADD COLUMN {col_name} {col_type}")
+
+def _add_hot_path_indexes(cursor):
+    # Status filters with newest-first ordering, per-project BOQ lookups, notification feed
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_projects_status_submitted ON projects (status, submitted_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_materials_project_status ON project_materials (project_id, status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_notifications_created ON notifications (created_at)")
+    cursor.execute("ANALYZE")
+
+# Tables whose writes are counted in table_versions (see dashboard/query_cache.py)
+VERSIONED_TABLES = ['projects', 'project_materials', 'notifications']
+
+def _add_table_versions(cursor):
+    # Every insert, update or delete bumps its table's version, whichever connection or process
+    # wrote it, so cached query results can be checked for staleness with one small read
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version INTEGER NOT NULL DEFAULT 0
+        )
+    ''')
+    for table in VERSIONED_TABLES:
+        cursor.execute("INSERT OR IGNORE INTO table_versions (table_name) VALUES (?)", (table,))
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS trg_{table}_{event.lower()}_version AFTER {event} ON {table}
+                BEGIN
+                    UPDATE table_versions SET version = version + 1 WHERE table_name = '{table}';
+                END
+            ''')
+
+_KPI_ADD = '''
+    INSERT INTO project_kpi_totals (status, domain, projects, costed_projects, total_cost)
+    VALUES (IFNULL(NEW.status, ''), IFNULL(NEW.domain, ''), 1, NEW.total_cost IS NOT NULL, IFNULL(NEW.total_cost, 0))
+    ON CONFLICT (status, domain) DO UPDATE SET
+        projects = projects + 1,
+        costed_projects = costed_projects + excluded.costed_projects,
+        total_cost = total_cost + excluded.total_cost;
+'''
+_KPI_REMOVE = '''
+    UPDATE project_kpi_totals SET
+        projects = projects - 1,
+        costed_projects = costed_projects - (OLD.total_cost IS NOT NULL),
+        total_cost = total_cost - IFNULL(OLD.total_cost, 0)
+    WHERE status = IFNULL(OLD.status, '') AND domain = IFNULL(OLD.domain, '');
+'''
+
+def _add_project_kpis(cursor):
+    # Per (status, domain) totals kept current by triggers, so the overview reads a handful of
+    # rows however many projects exist. NULL keys are stored as '' to keep them unique.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS project_kpi_totals (
+            status TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            projects INTEGER NOT NULL,
+            costed_projects INTEGER NOT NULL,
+            total_cost REAL NOT NULL,
+            PRIMARY KEY (status, domain)
+        )
+    ''')
+    cursor.execute("DELETE FROM project_kpi_totals")
+    cursor.execute('''
+        INSERT INTO project_kpi_totals (status, domain, projects, costed_projects, total_cost)
+        SELECT IFNULL(status, ''), IFNULL(domain, ''), COUNT(*), COUNT(total_cost), IFNULL(SUM(total_cost), 0)
+        FROM projects
+        GROUP BY 1, 2
+    ''')
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_projects_insert_kpis AFTER INSERT ON projects BEGIN {_KPI_ADD} END")
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_projects_delete_kpis AFTER DELETE ON projects BEGIN {_KPI_REMOVE} END")
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_projects_update_kpis AFTER UPDATE OF status, domain, total_cost ON projects
+        BEGIN {_KPI_REMOVE} {_KPI_ADD} END
+    ''')
+    cursor.execute('''
+        CREATE VIEW IF NOT EXISTS project_kpis AS
+        SELECT NULLIF(status, '') AS status, NULLIF(domain, '') AS domain,
+               projects, costed_projects, total_cost,
+               CASE WHEN costed_projects > 0 THEN total_cost / costed_projects END AS avg_cost
+        FROM project_kpi_totals
+        WHERE projects > 0
+    ''')
+    # Newest-first listing of recent projects
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_projects_submitted ON projects (submitted_at, id)")
+
+# Rollups of project_materials, one table per grouping key. NULL keys are stored as '' (0 for project_id).
+MATERIAL_ROLLUPS = {
+    'project_id': ('material_totals_by_project', 'INTEGER', 0),
+    'category': ('material_totals_by_category', 'TEXT', "''"),
+    'status': ('material_totals_by_status', 'TEXT', "''"),
+}
+
+def _material_rollup_sql(row):
+    # Statements adding (row='NEW') or removing (row='OLD') one BOQ row from every rollup
+    statements = []
+    for column, (table, _type, empty) in MATERIAL_ROLLUPS.items():
+        key = f'IFNULL({row}.{column}, {empty})'
+        if row == 'NEW':
+            statements.append(f'''
+                INSERT INTO {table} ({column}, entries, amount_inr)
+                VALUES ({key}, 1, IFNULL(NEW.amount_inr, 0))
+                ON CONFLICT ({column}) DO UPDATE SET
+                    entries = entries + 1,
+                    amount_inr = amount_inr + excluded.amount_inr;
+            ''')
+        else:
+            statements.append(f'''
+                UPDATE {table} SET
+                    entries = entries - 1,
+                    amount_inr = amount_inr - IFNULL(OLD.amount_inr, 0)
+                WHERE {column} = {key};
+            ''')
+    return ''.join(statements)
+
+def _add_material_rollups(cursor):
+    # Entry counts and amount_inr sums per project, category and status, kept current by
+    # triggers, so cost charts read tens of rows instead of the whole materials table.
+    # WITHOUT ROWID keeps project_id an ordinary key: older rows hold non-integer ids.
+    for column, (table, column_type, empty) in MATERIAL_ROLLUPS.items():
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {column} {column_type} PRIMARY KEY NOT NULL,
+                entries INTEGER NOT NULL,
+                amount_inr REAL NOT NULL
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f'''
+            INSERT INTO {table} ({column}, entries, amount_inr)
+            SELECT IFNULL({column}, {empty}), COUNT(*), IFNULL(SUM(amount_inr), 0)
+            FROM project_materials
+            GROUP BY 1
+        ''')
+    add, remove = _material_rollup_sql('NEW'), _material_rollup_sql('OLD')
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_project_materials_insert_totals AFTER INSERT ON project_materials BEGIN {add} END")
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_project_materials_delete_totals AFTER DELETE ON project_materials BEGIN {remove} END")
+    cursor.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS trg_project_materials_update_totals
+        AFTER UPDATE OF project_id, category, status, amount_inr ON project_materials
+        BEGIN {remove} {add} END
+    ''')
+
+def _integer_material_project_ids(cursor):
+    # sqlite3 stored numpy.int64 project ids taken from DataFrames as 8-byte blobs, which
+    # never equal the integer ids the app looks rows up by; decode them back to integers
+    rows = cursor.execute('''
+        SELECT id, project_id FROM project_materials
+        WHERE typeof(project_id) = 'blob' AND length(project_id) = 8
+    ''').fetchall()
+    # A blob holds the int64's raw memory, so 'little' assumes the database was written on a
+    # little-endian host (x86, ARM as run in practice); a big-endian writer's ids would decode wrongly
+    cursor.executemany("UPDATE project_materials SET project_id = ? WHERE id = ?",
+                       [(int.from_bytes(project_id, 'little'), row_id) for row_id, project_id in rows])
+    # The update trigger moved their totals to the integer keys; drop the emptied blob keys
+    cursor.execute("DELETE FROM material_totals_by_project WHERE typeof(project_id) = 'blob' AND entries = 0")
+
+# (version, description, function taking a cursor)
+MIGRATIONS = [
+    (1, 'base tables and review columns', _create_tables),
+    (2, 'indexes for status, project and date lookups', _add_hot_path_indexes),
+    (3, 'per-table write counters for the query cache', _add_table_versions),
+    (4, 'trigger-maintained project_kpis for the overview page', _add_project_kpis),
+    (5, 'trigger-maintained project_materials rollups by project, category and status', _add_material_rollups),
+    (6, 'integer project_materials.project_id in rows written with numpy ids', _integer_material_project_ids),
+]
+
+def schema_version(conn):
+    return conn.execute('PRAGMA user_version').fetchone()[0]
+
+def migrate(conn):
+    """Apply pending migrations to conn and return the resulting schema version"""
+    version = schema_version(conn)
+    for target, _description, apply in MIGRATIONS:
+        if target <= version:
+            continue
+        # sqlite3 does not open a transaction for DDL on its own, so do it explicitly;
+        # the version bump commits or rolls back together with the migration
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            # Another process may have migrated while we waited for the write lock
+            if schema_version(conn) >= target:
+                conn.execute('COMMIT')
+                version = schema_version(conn)
+                continue
+            apply(conn.cursor())
+            conn.execute(f'PRAGMA user_version = {target}')
+            conn.execute('COMMIT')
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        version = target
+    return version
@@ -0,0 +1,521 @@
+"""Admin Panel: project listing, BOQ review and exports"""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.boq import MATERIAL_STATUSES, REVIEW_COLUMNS, bulk_update_material_status, review_grid
+from dashboard.kpis import kpi_summary, project_kpis
+from dashboard.listing import PAGE_SIZE, list_projects
+from dashboard.pages.common import (db, get_materials_by_project, project_filter_controls,
+                                    update_project_status)
+
+def render():
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Admin Panel (Detailed Review)</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">👨‍💼 Admin Panel</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Comprehensive BOQ/Materials review and project validation</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    admin_password = st.text_input("Admin Password", type="password", placeholder="Enter admin password")
+
+    if admin_password == "admin123":
+        st.success("✅ Admin access granted!")
+        kpi = kpi_summary(project_kpis(db))
+
+        if kpi['total'] > 0:
+            # Admin Dashboard Overview
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 📊 Admin Dashboard Overview")
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                pending_count = kpi['pending']
+                card_class = "has-data" if pending_count > 0 else "no-data"
+                st.markdown(f"""
+                <div class="metric-card {card_class}" style="border-left-color: #ffc107;">
+                    <div class="metric-value" style="color: #ffc107;">{pending_count}</div>
+                    <div class="metric-label">⏳ Pending Review</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col2:
+                under_review_count = kpi['under_review']
+                card_class = "has-data" if under_review_count > 0 else "no-data"
+                st.markdown(f"""
+                <div class="metric-card {card_class}" style="border-left-color: #6f42c1;">
+                    <div class="metric-value" style="color: #6f42c1;">{under_review_count}</div>
+                    <div class="metric-label">🔍 Under Review</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col3:
+                approved_count = kpi['approved']
+                card_class = "has-data" if approved_count > 0 else "no-data"
+                st.markdown(f"""
+                <div class="metric-card {card_class}" style="border-left-color: #28a745;">
+                    <div class="metric-value" style="color: #28a745;">{approved_count}</div>
+                    <div class="metric-label">✅ Approved</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            with col4:
+                rejected_count = kpi['rejected']
+                card_class = "has-data" if rejected_count > 0 else "no-data"
+                st.markdown(f"""
+                <div class="metric-card {card_class}" style="border-left-color: #dc3545;">
+                    <div class="metric-value" style="color: #dc3545;">{rejected_count}</div>
+                    <div class="metric-label">❌ Rejected</div>
+                </div>
+                """, unsafe_allow_html=True)
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # Project Selection for BOQ Review
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 🔍 Select Project for BOQ Review")
+
+            # Filtered, paginated listing; only the current page is loaded
+            filters, search = project_filter_controls("admin")
+
+            # Keyset cursors for the pages visited so far; start over when the filters change
+            filter_signature = repr((sorted(filters.items()), search))
+            if st.session_state.get("admin_filter_signature") != filter_signature:
+                st.session_state["admin_filter_signature"] = filter_signature
+                st.session_state["admin_page_keys"] = [None]
+            page_keys = st.session_state["admin_page_keys"]
+            projects_df, next_key = list_projects(db, filters, search, after=page_keys[-1])
+
+            # No COUNT(*) on every rerun: the extra row list_projects fetches says whether more follow
+            first_shown = (len(page_keys) - 1) * PAGE_SIZE + 1
+            shown = f"{first_shown}–{first_shown + len(projects_df) - 1}" if len(projects_df) else "none"
+            nav_col1, nav_col2, nav_col3 = st.columns([1, 2, 1])
+            with nav_col1:
+                if st.button("⬅️ Previous", disabled=len(page_keys) == 1, key="admin_prev_page"):
+                    page_keys.pop()
+                    st.rerun()
+            with nav_col2:
+                st.caption(f"Page {len(page_keys)} · projects {shown}{' · more…' if next_key is not None else ''}")
+            with nav_col3:
+                if st.button("Next ➡️", disabled=next_key is None, key="admin_next_page"):
+                    page_keys.append(next_key)
+                    st.rerun()
+
+            # Create a clean dropdown for project selection
+            status_emoji = {
+                'pending': '⏳',
+                'under_review': '🔍',
+                'approved': '✅',
+                'rejected': '❌'
+            }
+            project_options = [
+                f"{status_emoji.get(status, '📋')} [{tracking_id}] {name} - {str(status).title()}"
+                for tracking_id, name, status in zip(projects_df['tracking_id'], projects_df['project_name'], projects_df['status'])
+            ]
+
+            if project_options:
+                selected_project_idx = st.selectbox(
+                    "Choose a project to review:",
+                    range(len(project_options)),
+                    format_func=lambda x: project_options[x],
+                    key="project_selector"
+                )
+            else:
+                st.warning("No projects match the current filters.")
+                selected_project_idx = None
+
+            if selected_project_idx is not None:
+                selected_project = projects_df.iloc[selected_project_idx]
+
+                # Project Basic Information
+                st.markdown("---")
+                st.markdown("### 📋 Project Basic Information")
+
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); padding: 1.5rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #90caf9; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                        <p style="color: #1565c0; margin: 0.5rem 0;"><strong>Tracking ID:</strong> <code style="background: rgba(255,255,255,0.8); padding: 0.2rem 0.5rem; border-radius: 4px;">{selected_project['tracking_id']}</code></p>
+                        <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Project Name:</strong> {selected_project['project_name']}</p>
+                        <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Domain:</strong> {selected_project['domain']}</p>
+                        <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Priority:</strong> {selected_project['priority']}</p>
+                        <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Total Cost:</strong> ₹{selected_project['total_cost']:,.2f}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                with col2:
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); padding: 1.5rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #81c784; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Submitted By:</strong> {selected_project['submitted_by']}</p>
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Department:</strong> {selected_project.get('department', 'N/A')}</p>
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Contact:</strong> {selected_project.get('contact_email', 'N/A')}</p>
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Submitted On:</strong> {selected_project['submitted_at']}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                # Project Description and Justification
+                st.markdown("### 📄 Project Details")
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #fff3e0 0%, #ffcc02 100%); padding: 1.5rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #ffb74d; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                    <p style="color: #e65100; margin: 0.5rem 0;"><strong>Description:</strong></p>
+                    <p style="color: #bf360c; margin: 0.5rem 0;">{selected_project['project_description']}</p>
+                    <p style="color: #e65100; margin: 0.5rem 0;"><strong>Justification:</strong></p>
+                    <p style="color: #bf360c; margin: 0.5rem 0;">{selected_project.get('justification', 'No justification provided')}</p>
+                </div>
+                """, unsafe_allow_html=True)
+
+                # BOQ/Materials Review Section
+                st.markdown("---")
+                st.markdown("### 📦 BOQ/Materials Data Submitted by User")
+
+                materials_df = get_materials_by_project(selected_project['id'])
+
+                if not materials_df.empty:
+                    st.markdown(f"**Project:** {selected_project['project_name']} | **Tracking ID:** {selected_project['tracking_id']}")
+                    st.markdown(f"**Total Material Entries:** {len(materials_df)}")
+
+                    # Create clean BOQ table for admin review
+                    boq_display_df = materials_df.copy()
+
+                    # Add row numbers
+                    boq_display_df['S.No.'] = range(1, len(boq_display_df) + 1)
+
+                    # Select and rename columns for admin review
+                    column_order = [
+                        'S.No.', 'category', 'subtopic', 'description', 'units_qty', 'nos',
+                        'unit_price', 'amount_inr', 'source_type', 'payment_schedule',
+                        'justification', 'status'
+                    ]
+
+                    # Select and rename columns
+                    boq_display_df = boq_display_df[column_order]
+                    boq_display_df.columns = [
+                        'S.No.', 'Category', 'Sub-topic', 'Description', 'Units/Qty', 'Nos',
+                        'Unit Price (₹)', 'Amount (₹)', 'Source/Type', 'Payment Schedule',
+                        'Justification', 'Current Status'
+                    ]
+
+                    # Format currency columns
+                    boq_display_df['Unit Price (₹)'] = boq_display_df['Unit Price (₹)'].apply(lambda x: f"₹{x:,.2f}")
+                    boq_display_df['Amount (₹)'] = boq_display_df['Amount (₹)'].apply(lambda x: f"₹{x:,.2f}")
+
+                    # Display the BOQ table
+                    st.markdown("#### 📊 BOQ Data Table")
+                    st.dataframe(
+                        boq_display_df,
+                        use_container_width=True,
+                        height=min(500, (len(boq_display_df) + 1) * 35 + 3),
+                        hide_index=True
+                    )
+
+                    # Row review: one editable grid instead of a status, comments and finalize widget per row
+                    st.markdown("---")
+                    st.markdown("#### ⚖️ Row Status Review")
+                    # The outcome of the last save, kept in session state across the rerun that followed it
+                    for kind, text in st.session_state.pop("boq_review_messages", []):
+                        getattr(st, kind)(text)
+
+                    review_df = review_grid(materials_df)
+                    row_categories = sorted(review_df['category'].dropna().unique())
+                    fcol1, fcol2 = st.columns(2)
+                    with fcol1:
+                        category_filter = st.multiselect("Filter rows by Category", row_categories,
+                                                         key=f"boq_category_filter_{selected_project['id']}")
+                    with fcol2:
+                        status_filter = st.multiselect("Filter rows by Status", MATERIAL_STATUSES,
+                                                       key=f"boq_status_filter_{selected_project['id']}")
+                    shown = pd.Series(True, index=review_df.index)
+                    if category_filter:
+                        shown &= review_df['category'].isin(category_filter)
+                    if status_filter:
+                        shown &= review_df['status'].isin(status_filter)
+
+                    # In a form, so editing cells does not rerun the page until a button is pressed
+                    grid_key = f"boq_review_grid_{selected_project['id']}"
+                    with st.form("row_status_form"):
+                        st.caption(f"{shown.sum()} of {len(review_df)} rows shown. Edit Status, Comments and "
+                                   "Finalize in the grid, then save. Changing a filter discards unsaved edits.")
+                        edited = st.data_editor(
+                            review_df[shown],
+                            key=grid_key,
+                            hide_index=True,
+                            use_container_width=True,
+                            height=min(500, int(shown.sum() + 1) * 35 + 3),
+                            disabled=['S.No.', 'category', 'subtopic', 'description', 'amount_inr'],
+                            column_config={
+                                'category': "Category",
+                                'subtopic': "Sub-topic",
+                                'description': "Description",
+                                'amount_inr': st.column_config.NumberColumn("Amount (₹)", format="%.2f"),
+                                'status': st.column_config.SelectboxColumn("Status", options=MATERIAL_STATUSES, required=True),
+                                'review_comments': st.column_config.TextColumn("Comments"),
+                                'finalized': st.column_config.CheckboxColumn("Finalize"),
+                            },
+                        )
+
+                        bcol1, bcol2, bcol3 = st.columns([1, 2, 1])
+                        with bcol1:
+                            save_rows = st.form_submit_button("💾 Save Row Changes", use_container_width=True)
+                        with bcol2:
+                            bulk_category = st.selectbox("Category", row_categories, label_visibility="collapsed",
+                                                         key=f"boq_bulk_category_{selected_project['id']}")
+                            approve_category = st.form_submit_button("✅ Approve All in Category", use_container_width=True)
+                        with bcol3:
+                            # Without a filter every row is "filtered"; only offer it once a filter narrows the rows
+                            reject_filtered = st.form_submit_button(f"❌ Reject Filtered ({shown.sum()})", key="boq_reject_filtered",
+                                                                    disabled=not (category_filter or status_filter),
+                                                                    help="Pick a category or status filter first",
+                                                                    use_container_width=True)
+
+                    if save_rows or approve_category or reject_filtered:
+                        # The loaded rows with the grid's edits on top; bulk actions set status on the
+                        # chosen rows, keeping their edited comments. Only rows that then differ are written.
+                        proposed = review_df[REVIEW_COLUMNS].copy()
+                        proposed.loc[edited.index, REVIEW_COLUMNS] = edited[REVIEW_COLUMNS]
+                        if approve_category:
+                            proposed.loc[(review_df['category'] == bulk_category).to_numpy(), 'status'] = 'approved'
+                        elif reject_filtered:
+                            proposed.loc[shown.to_numpy(), 'status'] = 'rejected'
+                        results = bulk_update_material_status(db, materials_df, proposed.rename_axis('id').reset_index(), 'Admin')
+                        outcome = results['result'].value_counts()
+
+                        messages = []
+                        if outcome.get('not_found', 0):
+                            messages.append(('warning', f"⚠️ {outcome['not_found']} row(s) no longer exist and were skipped."))
+                        if outcome.get('updated', 0) > 0:
+                            messages.append(('success', f"✅ Updated {outcome['updated']} row status(es)."))
+                            st.session_state["boq_review_messages"] = messages
+                            # The saved values are now the loaded ones; drop the grid's edits
+                            st.session_state.pop(grid_key, None)
+                            st.rerun()
+                        for kind, text in messages + [('info', "ℹ️ No changes detected.")]:
+                            getattr(st, kind)(text)
+
+                    # Show overall project status based on individual rows
+                    st.markdown("---")
+                    st.markdown("#### 📊 Overall Project Status Summary")
+
+                    # Count statuses
+                    status_counts = materials_df['status'].value_counts().to_dict()
+                    approved_count = status_counts.get('approved', 0)
+                    pending_count = status_counts.get('pending', 0)
+                    under_review_count = status_counts.get('under_review', 0)
+                    rejected_count = status_counts.get('rejected', 0)
+                    total_rows = len(materials_df)
+
+                    # Show status summary
+                    col1, col2, col3, col4, col5 = st.columns(5)
+                    with col1:
+                        st.metric("Total Rows", total_rows)
+                    with col2:
+                        st.metric("✅ Approved", approved_count)
+                    with col3:
+                        st.metric("⏳ Pending", pending_count)
+                    with col4:
+                        st.metric("🔍 Under Review", under_review_count)
+                    with col5:
+                        st.metric("❌ Rejected", rejected_count)
+
+                    # Determine overall project status
+                    if approved_count == total_rows:
+                        overall_status = "All Approved"
+                        status_color = "green"
+                    elif rejected_count > 0:
+                        overall_status = "Has Rejections"
+                        status_color = "red"
+                    elif under_review_count > 0:
+                        overall_status = "Under Review"
+                        status_color = "orange"
+                    else:
+                        overall_status = "Pending Review"
+                        status_color = "yellow"
+
+                    st.markdown(f"**Overall Project Status:** <span style='color: {status_color}; font-weight: bold;'>{overall_status}</span>", unsafe_allow_html=True)
+
+                    # Admin Action Buttons
+                    st.markdown("---")
+                    st.markdown("#### ⚖️ Final Project Decision")
+
+                    # Review comments
+                    review_comments = st.text_area(
+                        "Final Review Comments",
+                        placeholder="Enter your final review comments here...",
+                        height=100,
+                        key=f"final_review_{selected_project['id']}"
+                    )
+
+                    # Action buttons based on overall status
+                    col1, col2, col3, col4 = st.columns(4)
+
+                    with col1:
+                        # Approve button - only enabled if all rows are approved
+                        approve_disabled = approved_count != total_rows
+                        if st.button("✅ Approve Project", key=f"approve_{selected_project['id']}", use_container_width=True, disabled=approve_disabled):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'approved', review_comments, 'Admin')
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'approved', 'Approved by admin', 'Admin')
+                            st.success("✅ Project approved!")
+                            st.rerun()
+                        if approve_disabled:
+                            st.caption("All rows must be approved first")
+
+                    with col2:
+                        # Reject button - always available
+                        if st.button("❌ Reject Project", key=f"reject_{selected_project['id']}", use_container_width=True):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'rejected', review_comments, 'Admin')
+                                st.error("❌ Project rejected with comments!")
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'rejected', 'Rejected by admin', 'Admin')
+                                st.error("❌ Project rejected!")
+                            st.rerun()
+
+                    with col3:
+                        # Mark under review - only if there are under_review items
+                        review_disabled = under_review_count == 0
+                        if st.button("🔍 Mark Under Review", key=f"review_{selected_project['id']}", use_container_width=True, disabled=review_disabled):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'under_review', review_comments, 'Admin')
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'under_review', 'Marked under review by admin', 'Admin')
+                            st.info("🔍 Project marked under review!")
+                            st.rerun()
+                        if review_disabled:
+                            st.caption("No items under review")
+
+                    with col4:
+                        # Request more info - only if there are pending items
+                        info_disabled = pending_count == 0
+                        if st.button("📋 Request More Info", key=f"info_{selected_project['id']}", use_container_width=True, disabled=info_disabled):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'pending', f"More information requested: {review_comments}", 'Admin')
+                                st.warning("📋 More information requested!")
+                            else:
+                                st.warning("Please provide comments when requesting more information.")
+                        if info_disabled:
+                            st.caption("No pending items")
+
+                    # Export options
+                    col_export1, col_export2, col_export3 = st.columns(3)
+                    with col_export1:
+                        # Export to CSV
+                        csv_data = boq_display_df.to_csv(index=False)
+                        st.download_button(
+                            label="📊 Export to CSV",
+                            data=csv_data,
+                            file_name=f"BOQ_{selected_project['tracking_id']}.csv",
+                            mime="text/csv",
+                            use_container_width=True
+                        )
+
+                    with col_export2:
+                        # Export to Excel (if openpyxl is available)
+                        try:
+                            from dashboard.excel_export import dataframe_to_xlsx
+
+                            # Built only when the button is clicked, off the script thread, so the
+                            # workbook no longer adds to every render of this page
+                            st.download_button(
+                                label="📈 Export to Excel",
+                                data=lambda: dataframe_to_xlsx(boq_display_df, "BOQ Data", status_column="Current Status"),
+                                file_name=f"BOQ_{selected_project['tracking_id']}.xlsx",
+                                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                on_click="ignore",
+                                use_container_width=True
+                            )
+                        except ImportError:
+                            st.info("📈 Excel export requires openpyxl package")
+
+                    with col_export3:
+                        # Print-friendly view
+                        if st.button("🖨️ Print View", use_container_width=True):
+                            st.markdown("### 🖨️ Print-Friendly BOQ View")
+                            st.markdown(f"**Project:** {selected_project['project_name']} ({selected_project['tracking_id']})")
+                            st.markdown(f"**Date:** {datetime.now().strftime('%Y-%m-%d %H:%M')}")
+                            st.markdown("---")
+                            st.dataframe(boq_display_df, use_container_width=True, hide_index=True)
+
+                    # Project Cost Summary
+                    total_project_cost = materials_df['amount_inr'].sum()
+                    st.markdown("---")
+                    st.markdown("### 💰 Project Cost Summary")
+
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Total Material Cost", f"₹{total_project_cost:,.2f}")
+                    with col2:
+                        st.metric("Total Material Items", len(materials_df))
+                    with col3:
+                        categories_count = len(materials_df['category'].unique())
+                        st.metric("Number of Categories", categories_count)
+
+                else:
+                    st.warning("⚠️ No BOQ/Materials data found for this project.")
+                    st.info("This project may have been submitted without material details.")
+
+                    # Show project review actions even without BOQ data
+                    st.markdown("#### 📋 Project Review Actions")
+
+                    # Review comments
+                    review_comments = st.text_area(
+                        "Review Comments",
+                        placeholder="Enter your review comments here...",
+                        height=100,
+                        key=f"review_comments_no_boq_{selected_project['id']}"
+                    )
+
+                    col1, col2, col3, col4 = st.columns(4)
+                    with col1:
+                        if st.button("✅ Approve Project", key=f"approve_no_materials_{selected_project['id']}", use_container_width=True):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'approved', review_comments, 'Admin')
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'approved', 'Approved by admin', 'Admin')
+                            st.success("✅ Project approved!")
+                            st.rerun()
+
+                    with col2:
+                        if st.button("❌ Reject Project", key=f"reject_no_materials_{selected_project['id']}", use_container_width=True):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'rejected', review_comments, 'Admin')
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'rejected', 'Rejected by admin', 'Admin')
+                            st.error("❌ Project rejected!")
+                            st.rerun()
+
+                    with col3:
+                        if st.button("🔍 Mark Under Review", key=f"review_no_materials_{selected_project['id']}", use_container_width=True):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'under_review', review_comments, 'Admin')
+                            else:
+                                update_project_status(selected_project['tracking_id'], 'under_review', 'Marked under review by admin', 'Admin')
+                            st.info("🔍 Project marked under review!")
+                            st.rerun()
+
+                    with col4:
+                        if st.button("📋 Request More Info", key=f"info_no_materials_{selected_project['id']}", use_container_width=True):
+                            if review_comments.strip():
+                                update_project_status(selected_project['tracking_id'], 'pending', f"More information requested: {review_comments}", 'Admin')
+                                st.warning("📋 More information requested!")
+                            else:
+                                st.warning("Please provide comments when requesting more information.")
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        else:
+            st.info("📋 No projects found for review.")
+            st.markdown("**To test the admin panel:**")
+            st.markdown("1. Go to '📝 Submit Project' page")
+            st.markdown("2. Fill in project details and add BOQ materials")
+            st.markdown("3. Submit the project")
+            st.markdown("4. Return here to review it")
+
+    elif admin_password:
+        st.error("❌ Invalid admin password.")
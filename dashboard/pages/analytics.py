@@ -0,0 +1,58 @@
+"""Analytics: filtered project figures and charts"""
+import plotly.express as px
+import streamlit as st
+
+from dashboard.kpis import budget_by, project_totals, projects_per_day
+from dashboard.pages.common import db, project_filter_controls
+
+def render():
+    st.header("📊 Advanced Analytics")
+
+    # Every figure below is aggregated in SQL over the selected projects
+    filters, search = project_filter_controls("analytics")
+    totals = project_totals(db, filters, search)
+
+    if totals['projects'] > 0:
+        # Time series analysis
+        st.subheader("📈 Project Timeline Analysis")
+        timeline_df = projects_per_day(db, filters, search)
+
+        fig_timeline = px.line(timeline_df, x='Date', y='Projects Submitted', title='Projects Submitted Over Time')
+        st.plotly_chart(fig_timeline, use_container_width=True)
+
+        # Budget analysis
+        st.subheader("💰 Budget Analysis")
+        col1, col2 = st.columns(2)
+
+        with col1:
+            budget_by_domain = budget_by(db, 'domain', filters, search)
+            fig_budget = px.bar(budget_by_domain, x='domain', y='total_cost', title='Total Budget by Domain')
+            st.plotly_chart(fig_budget, use_container_width=True)
+
+        with col2:
+            budget_by_priority = budget_by(db, 'priority', filters, search)
+            fig_priority = px.pie(budget_by_priority, values='total_cost', names='priority', title='Budget Distribution by Priority')
+            st.plotly_chart(fig_priority, use_container_width=True)
+
+        # Performance metrics
+        st.subheader("📊 Performance Metrics")
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            avg_project_cost = totals['avg_cost'] or 0
+            st.metric("Average Project Cost", f"₹{avg_project_cost:,.2f}")
+
+        with col2:
+            approval_rate = totals['approved'] / totals['projects'] * 100
+            st.metric("Approval Rate", f"{approval_rate:.1f}%")
+
+        with col3:
+            avg_review_time = "N/A"  # Would need more complex calculation
+            st.metric("Avg Review Time", avg_review_time)
+
+        with col4:
+            total_budget = totals['total_cost'] or 0
+            st.metric("Total Budget", f"₹{total_budget:,.2f}")
+
+    else:
+        st.info("No data available for analytics.")
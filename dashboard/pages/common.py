@@ -0,0 +1,56 @@
+"""Database helpers and widgets shared by the page modules.
+
+Imported on the first rerun of each server process, which is also when the
+connection manager is created and the schema migrated.
+"""
+import streamlit as st
+
+from dashboard.connection import get_connection_manager
+from dashboard.listing import (DOMAINS as LIST_DOMAINS, PRIORITIES as LIST_PRIORITIES,
+                               STATUSES as LIST_STATUSES)
+
+# project_management.db (one connection per thread) or PostgreSQL when DASHBOARD_DATABASE_URL
+# says so; shared by every session of this process
+db = get_connection_manager()
+
+def get_projects():
+    return db.cached_query("SELECT * FROM projects ORDER BY submitted_at DESC", ['projects'])
+
+def get_project_by_tracking_id(tracking_id):
+    return db.fetchone("SELECT * FROM projects WHERE tracking_id = ?", (tracking_id,))
+
+def update_project_status(tracking_id, status, review_comments, reviewed_by):
+    with db.transaction() as conn:
+        conn.execute('''
+            UPDATE projects
+            SET status = ?, review_comments = ?, reviewed_by = ?, review_date = CURRENT_TIMESTAMP
+            WHERE tracking_id = ?
+        ''', (status, review_comments, reviewed_by, tracking_id))
+
+def get_materials_by_project(project_id):
+    # Ids read from a DataFrame are numpy.int64, which sqlite3 would bind as a blob
+    return db.cached_query('SELECT * FROM project_materials WHERE project_id = ?', ['project_materials'],
+                           (int(project_id),))
+
+def delete_boq_category(state_key, category):
+    """on_click callback for the BOQ tables: drop one category's rows from a session list"""
+    # As a callback the table redraws once without them, instead of rendering and rerunning
+    st.session_state[state_key] = [item for item in st.session_state[state_key] if item["Category"] != category]
+
+def project_filter_controls(key):
+    """Filter and search widgets for the project listing; returns (filters, search)"""
+    with st.expander("🔎 Filter projects", expanded=False):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            status = st.multiselect("Status", LIST_STATUSES, key=f"{key}_status")
+            department = st.text_input("Department", key=f"{key}_department")
+        with col2:
+            domain = st.multiselect("Domain", LIST_DOMAINS, key=f"{key}_domain")
+            date_from = st.date_input("Submitted from", value=None, key=f"{key}_date_from")
+        with col3:
+            priority = st.multiselect("Priority", LIST_PRIORITIES, key=f"{key}_priority")
+            date_to = st.date_input("Submitted to", value=None, key=f"{key}_date_to")
+        search = st.text_input("Search project name or tracking ID", key=f"{key}_search")
+    filters = {'status': status, 'domain': domain, 'priority': priority,
+               'department': department.strip(), 'date_from': date_from, 'date_to': date_to}
+    return filters, search.strip()
@@ -0,0 +1,81 @@
+"""File Upload: preview uploaded Excel/CSV files"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from etl.cache import load_parsed
+
+def _same_content(path, data):
+    if not os.path.exists(path) or os.path.getsize(path) != len(data):
+        return False
+    with open(path, 'rb') as f:
+        return f.read() == data
+
+def render():
+    st.header("📁 File Upload & ETL Processing")
+
+    # File upload
+    uploaded_file = st.file_uploader("Choose a file", type=['csv', 'xlsx', 'xls'])
+
+    if uploaded_file:
+        try:
+            # Save uploaded file
+            save_path = os.path.join('data', 'uploads', uploaded_file.name)
+            os.makedirs('data/uploads', exist_ok=True)
+
+            # Every rerun hands the same upload back; only write it when the content is new
+            data = uploaded_file.getbuffer()
+            if not _same_content(save_path, data):
+                with open(save_path, 'wb') as f:
+                    f.write(data)
+
+            st.success(f"✅ File uploaded: {uploaded_file.name}")
+
+            # Parse through the ETL cache so reruns on an unchanged upload skip parsing
+            df = load_parsed(save_path)
+
+            st.subheader("📊 File Preview")
+            st.dataframe(df.head(), use_container_width=True)
+
+            # Basic analysis
+            st.subheader("📈 Quick Analysis")
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                st.metric("Total Rows", len(df))
+
+            with col2:
+                st.metric("Total Columns", len(df.columns))
+
+            with col3:
+                numeric_cols = df.select_dtypes(include=['number']).columns
+                st.metric("Numeric Columns", len(numeric_cols))
+
+            # ETL processing button
+            if st.button("🔄 Run ETL Processing"):
+                with st.spinner("Processing file..."):
+                    try:
+                        # Simple ETL processing
+                        processed_df = df.copy()
+
+                        # Clean numeric columns
+                        for col in numeric_cols:
+                            processed_df[col] = pd.to_numeric(processed_df[col], errors='coerce').fillna(0)
+
+                        # Save processed data
+                        processed_path = os.path.join('data', 'processed', f'processed_{uploaded_file.name}')
+                        os.makedirs('data/processed', exist_ok=True)
+                        processed_df.to_csv(processed_path, index=False)
+
+                        st.success("✅ ETL processing completed!")
+                        st.info(f"Processed file saved to: {processed_path}")
+
+                    except Exception as e:
+                        st.error(f"❌ ETL processing failed: {str(e)}")
+
+        except Exception as e:
+            st.error(f"❌ Error processing file: {str(e)}")
+
+        # Footer
+        st.markdown("---")
@@ -0,0 +1,182 @@
+"""Material Entry: BOQ rows kept in the session"""
+import os
+
+import pandas as pd
+import streamlit as st
+
+from dashboard.boq import (BOQ_NOS, BOQ_PAYMENT_SCHEDULES, BOQ_SOURCE_TYPES, BOQ_TOPICS,
+                           BOQ_UNITS, group_entries)
+from dashboard.pages.common import delete_boq_category
+
+def render():
+    # Page Header with Breadcrumb
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Material Entry</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">📦 Material Entry Form</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Manage project materials and Bill of Quantities (BOQ)</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if "materials_data" not in st.session_state:
+        st.session_state["materials_data"] = []
+
+    # Filter by category option
+    if "selected_category_filter" not in st.session_state:
+        st.session_state["selected_category_filter"] = "All Categories"
+
+    st.markdown('<div class="form-container">', unsafe_allow_html=True)
+    st.markdown("### ➕ Add New Material Entry")
+    st.markdown('<div class="form-section">', unsafe_allow_html=True)
+
+    _material_entry_editor()
+
+# Adding a row reruns only the form and the table below it, not the whole app;
+# filtering or deleting reruns only the table
+@st.fragment
+def _material_entry_editor():
+    categories = list(BOQ_TOPICS.keys())
+
+    with st.form("material_entry_form"):
+        # First select the category/topic
+        category = st.selectbox("Select Category/Topic", categories, key="category_select")
+
+        # Then select subtopic based on the selected category
+        subtopics = BOQ_TOPICS[category]
+        subtopic = st.selectbox("Select Sub-topic", subtopics, key="subtopic_select")
+
+        # Then enter additional description details
+        description = st.text_input("Additional Description (Optional)", placeholder="Add more details if needed")
+
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col1:
+            units = st.selectbox("Units/Qty", BOQ_UNITS)
+        with col2:
+            nos = st.selectbox("Nos", BOQ_NOS)
+        with col3:
+            unit_price = st.number_input("Unit Price Total Amount", min_value=0.0, step=0.01, format="%.2f")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            source_type = st.selectbox("Source/Type", BOQ_SOURCE_TYPES)
+        with col2:
+            payment_schedule = st.selectbox("Payment Schedule", BOQ_PAYMENT_SCHEDULES)
+
+        amount_inr = nos * unit_price
+        st.markdown(f"##### Amount INR: <span style='color: #3973ac; font-size: 22px;'>₹{amount_inr:,.2f}</span>", unsafe_allow_html=True)
+
+        # Justification section
+        st.markdown("#### 📄 Justification for this Material Entry")
+        justification_type = st.radio("Justification Type:", ["Text Input", "File Upload"], horizontal=True, key="mat_justification_type")
+
+        if justification_type == "Text Input":
+            material_justification = st.text_area("Justification *", height=80, placeholder="Provide justification for this material entry...", key="mat_justification_text")
+        else:
+            material_justification_file = st.file_uploader("Upload Justification Document *", type=['pdf', 'docx', 'txt'], help="Upload PDF, DOCX, or TXT file", key="mat_justification_file")
+            material_justification = material_justification_file.name if material_justification_file else ""
+
+        submit = st.form_submit_button("Add Entry")
+
+    if submit:
+        # Combine subtopic and additional description
+        full_description = f"{subtopic}"
+        if description:
+            full_description += f" - {description}"
+
+        # Handle justification
+        justification_content = material_justification
+        justification_file_path = ""
+
+        if justification_type == "File Upload" and material_justification_file:
+            # Save uploaded file
+            upload_dir = "data/uploads/material_justifications"
+            os.makedirs(upload_dir, exist_ok=True)
+            file_path = os.path.join(upload_dir, material_justification_file.name)
+            with open(file_path, "wb") as f:
+                f.write(material_justification_file.getbuffer())
+            justification_file_path = file_path
+            justification_content = f"File uploaded: {material_justification_file.name}"
+
+        # Validate required fields
+        required_fields = [subtopic, units, nos, source_type, payment_schedule]
+        if justification_type == "Text Input":
+            required_fields.append(material_justification)
+        else:
+            required_fields.append(material_justification_file)
+
+        if all(required_fields) and unit_price > 0:
+            entry = {
+                "Category": category,
+                "Sub-topic": subtopic,
+                "Description": full_description,
+                "Units/Qty": units,
+                "Nos": nos,
+                "Source/Type": source_type,
+                "Payment Schedule": payment_schedule,
+                "Unit Price Total Amount": unit_price,
+                "Amount INR": amount_inr,
+                "Justification": justification_content,
+                "Justification Type": justification_type,
+                "Justification File Path": justification_file_path
+            }
+            st.session_state["materials_data"].append(entry)
+            st.success(f"Entry added to category: {category} - {subtopic}")
+        else:
+            st.error("❌ Please fill all required fields and enter Unit Price > 0.")
+
+    _material_entries_table()
+
+@st.fragment
+def _material_entries_table():
+    # Display entries with filtering option
+    if not st.session_state["materials_data"]:
+        return
+    categories = list(BOQ_TOPICS.keys())
+    st.markdown("---")
+    st.subheader("Your Material Entries")
+
+    # Add category filter
+    filter_options = ["All Categories"] + categories
+    selected_filter = st.selectbox(
+        "Filter by Category",
+        filter_options,
+        index=filter_options.index(st.session_state["selected_category_filter"])
+    )
+    st.session_state["selected_category_filter"] = selected_filter
+
+    groups = group_entries(
+        st.session_state["materials_data"], None if selected_filter == "All Categories" else selected_filter)
+
+    if not groups:
+        st.info(f"No entries found for the selected category: {selected_filter}")
+        return
+
+    for cat, cat_rows, total_amount in groups:
+        with st.expander(f"{cat}", expanded=True):
+            # Display the data table with subtopic information
+            st.dataframe(cat_rows, use_container_width=True, hide_index=True)
+
+            st.markdown(f"**Total for {cat}: ₹{total_amount:,.2f}**")
+
+            # Add delete buttons for each entry in this category
+            st.button(f"Delete All Entries in {cat}", key=f"del_cat_{cat}",
+                      on_click=delete_boq_category, args=("materials_data", cat))
+
+    # Show grand total
+    grand_total = sum(total for _, _, total in groups)
+    st.markdown(f"### Grand Total: ₹{grand_total:,.2f}")
+
+    # Export options
+    if st.button("Export to CSV"):
+        export_df = pd.DataFrame(st.session_state["materials_data"])
+        csv = export_df.to_csv(index=False)
+        st.download_button(
+            label="Download CSV",
+            data=csv,
+            file_name="material_entries.csv",
+            mime="text/csv"
+        )
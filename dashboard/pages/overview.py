@@ -0,0 +1,229 @@
+"""Dashboard Overview: KPI cards, charts and the most recent projects"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dashboard.kpis import category_budget, counts_by, kpi_summary, project_kpis, recent_projects
+from dashboard.pages.common import db
+
+def render():
+    # Page Header with Breadcrumb
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Overview</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">📊 Dashboard Overview</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Real-time project insights and performance metrics</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Get project figures, aggregated in SQL by status and domain
+    kpis = project_kpis(db)
+    kpi = kpi_summary(kpis)
+
+    if kpi['total'] > 0:
+        # Enhanced Statistics Cards
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            total_projects = kpi['total']
+            card_class = "has-data" if total_projects > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value">{total_projects}</div>
+                <div class="metric-label">📊 Total Projects</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            pending_projects = kpi['pending']
+            card_class = "has-data" if pending_projects > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #ffc107;">{pending_projects}</div>
+                <div class="metric-label">⏳ Pending Review</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            approved_projects = kpi['approved']
+            card_class = "has-data" if approved_projects > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #28a745;">{approved_projects}</div>
+                <div class="metric-label">✅ Approved</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col4:
+            total_budget = kpi['total_budget']
+            card_class = "has-data" if total_budget > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #17a2b8;">₹{total_budget:,.0f}</div>
+                <div class="metric-label">💰 Total Budget</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Additional Metrics Row
+        st.markdown("<br>", unsafe_allow_html=True)
+        col1, col2, col3, col4 = st.columns(4)
+
+        with col1:
+            rejected_projects = kpi['rejected']
+            card_class = "has-data" if rejected_projects > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #dc3545;">{rejected_projects}</div>
+                <div class="metric-label">❌ Rejected</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col2:
+            under_review = kpi['under_review']
+            card_class = "has-data" if under_review > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #6f42c1;">{under_review}</div>
+                <div class="metric-label">🔍 Under Review</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col3:
+            avg_cost = kpi['avg_cost']
+            card_class = "has-data" if avg_cost > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #fd7e14;">₹{avg_cost:,.0f}</div>
+                <div class="metric-label">📈 Avg Project Cost</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        with col4:
+            approval_rate = kpi['approval_rate']
+            card_class = "has-data" if approval_rate > 0 else "no-data"
+            st.markdown(f"""
+            <div class="metric-card {card_class}">
+                <div class="metric-value" style="color: #20c997;">{approval_rate:.1f}%</div>
+                <div class="metric-label">📊 Approval Rate</div>
+            </div>
+            """, unsafe_allow_html=True)
+
+        # Enhanced Charts Section
+        st.markdown("<br>", unsafe_allow_html=True)
+        st.markdown("### 📈 Project Analytics")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            # Status distribution with enhanced colors
+            status_counts = counts_by(kpis, 'status')
+            status_colors = {
+                'pending': '#ffc107',
+                'approved': '#28a745',
+                'rejected': '#dc3545',
+                'under_review': '#6f42c1'
+            }
+
+            fig_status = px.pie(
+                values=status_counts.values,
+                names=status_counts.index,
+                title="📊 Project Status Distribution",
+                color_discrete_map=status_colors,
+                hole=0.4
+            )
+            fig_status.update_layout(
+                title_font_size=18,
+                legend_title_font_size=14,
+                legend_font_size=12,
+                font=dict(size=12),
+                showlegend=True,
+                legend=dict(
+                    orientation="v",
+                    yanchor="middle",
+                    y=0.5,
+                    xanchor="left",
+                    x=1.01
+                )
+            )
+            st.plotly_chart(fig_status, use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        with col2:
+            st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+            # Domain distribution with enhanced styling
+            domain_counts = counts_by(kpis, 'domain')
+            fig_domain = px.bar(
+                x=domain_counts.index,
+                y=domain_counts.values,
+                title="🏗️ Projects by Domain",
+                color=domain_counts.values,
+                color_continuous_scale='Blues',
+                text=domain_counts.values
+            )
+            fig_domain.update_traces(
+                texttemplate='%{text}',
+                textposition='outside',
+                marker_line_color='white',
+                marker_line_width=1
+            )
+            fig_domain.update_layout(
+                title_font_size=18,
+                xaxis_title="Domain",
+                yaxis_title="Number of Projects",
+                font=dict(size=12),
+                xaxis_tickangle=-45
+            )
+            st.plotly_chart(fig_domain, use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Budget by category analysis
+        st.markdown('<div class="chart-container">', unsafe_allow_html=True)
+        st.subheader("💰 Budget by Category")
+
+        # Budget per category, summed in SQL
+        category_totals = category_budget(db)
+
+        if not category_totals.empty:
+            fig_category = px.bar(
+                category_totals,
+                x='category',
+                y='amount_inr',
+                title="Budget Distribution by Category",
+                color='amount_inr',
+                color_continuous_scale='Blues',
+                labels={'amount_inr': 'Amount (₹)', 'category': 'Category'}
+            )
+            fig_category.update_layout(
+                title_font_size=20,
+                xaxis_title="Category",
+                yaxis_title="Budget (₹)",
+                xaxis_tickangle=-45
+            )
+            st.plotly_chart(fig_category, use_container_width=True)
+        else:
+            st.info("No category budget data available yet.")
+        st.markdown('</div>', unsafe_allow_html=True)
+
+        # Recent projects table with enhanced styling
+        st.markdown('<div class="dashboard-card">', unsafe_allow_html=True)
+        st.subheader("📋 Recent Projects")
+        display_df = recent_projects(db, 10)
+
+        # Format the dataframe for better display
+        display_df['total_cost'] = display_df['total_cost'].apply(lambda x: f"₹{x:,.2f}")
+        display_df['status'] = display_df['status'].apply(lambda x: x.title())
+        display_df['submitted_at'] = pd.to_datetime(display_df['submitted_at']).dt.strftime('%Y-%m-%d %H:%M')
+
+        # Rename columns for better display
+        display_df.columns = ['Tracking ID', 'Project Name', 'Domain', 'Priority', 'Total Cost', 'Status', 'Submitted At']
+
+        st.dataframe(display_df, use_container_width=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    else:
+        st.info("No projects found. Submit your first project to get started!")
@@ -0,0 +1,261 @@
+"""Submit Project: project details, BOQ entry and submission"""
+import os
+from datetime import date
+
+import streamlit as st
+
+from dashboard.boq import (BOQ_NOS, BOQ_PAYMENT_SCHEDULES, BOQ_SOURCE_TYPES, BOQ_TOPICS, BOQ_UNITS,
+                           group_entries)
+from dashboard.pages.common import db, delete_boq_category
+from dashboard.submission import submit_project
+
+def render():
+    # Page Header with Breadcrumb
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Submit Project</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">📝 Submit New Project</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Create and submit a new project for review and approval</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Step 1: Project Basic Details
+    if "project_info_submitted" not in st.session_state:
+        st.session_state["project_info_submitted"] = False
+    if "project_basic" not in st.session_state:
+        st.session_state["project_basic"] = {}
+    if "project_materials_data" not in st.session_state:
+        st.session_state["project_materials_data"] = []
+
+    if not st.session_state["project_info_submitted"]:
+        st.markdown('<div class="form-container">', unsafe_allow_html=True)
+        st.markdown("### 📋 Step 1: Project Basic Information")
+        st.markdown('<div class="form-section">', unsafe_allow_html=True)
+
+        with st.form("project_form_step1"):
+            col1, col2 = st.columns(2)
+            with col1:
+                st.markdown('<div class="topic-section">', unsafe_allow_html=True)
+                st.markdown("#### 🏗️ Project Details")
+                project_name = st.text_input("Project Name *", placeholder="Enter project name")
+                domain = st.selectbox("Domain *", ["Civil Engineering", "Mechanical Engineering", "Electrical Engineering", "Multi-Domain"])
+                priority = st.selectbox("Priority *", ["Low", "Medium", "High", "Urgent"])
+                project_description = st.text_area("Project Description *", height=100)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+                st.markdown('<div class="topic-section">', unsafe_allow_html=True)
+                st.markdown("#### 📅 Timeline")
+                start_date = st.date_input("Start Date *", value=date.today())
+                end_date = st.date_input("End Date *", value=date.today())
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown('<div class="topic-section">', unsafe_allow_html=True)
+                st.markdown("#### 👤 Contact Information")
+                department = st.text_input("Department", placeholder="Your department")
+                contact_email = st.text_input("Contact Email", placeholder="your.email@company.com")
+                contact_phone = st.text_input("Contact Phone", placeholder="+91 9876543210")
+            submitted_by = st.text_input("Submitted By *", placeholder="Your name")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown('<div class="topic-section">', unsafe_allow_html=True)
+            st.markdown("#### 📄 Justification")
+            justification_type = st.radio("Justification Type:", ["Text Input", "File Upload"], horizontal=True)
+
+            if justification_type == "Text Input":
+                    justification = st.text_area("Justification *", height=100, placeholder="Provide justification for this project...")
+            else:
+                    uploaded_file = st.file_uploader("Upload Justification Document *", type=['pdf', 'docx', 'txt'], help="Upload PDF, DOCX, or TXT file")
+                    justification = uploaded_file.name if uploaded_file else ""
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            col1, col2, col3 = st.columns([1, 1, 1])
+            with col2:
+                go_next = st.form_submit_button("🚀 Proceed to BOM/Material Entry →", use_container_width=True)
+
+            if go_next:
+                required = [project_name, project_description, submitted_by]
+                if justification_type == "Text Input":
+                    required.append(justification)
+                else:
+                    required.append(uploaded_file)
+
+                if all(required):
+                    # Handle file upload if applicable
+                    justification_content = justification
+                    if justification_type == "File Upload" and uploaded_file:
+                        # Save uploaded file
+                        upload_dir = "data/uploads/justifications"
+                        os.makedirs(upload_dir, exist_ok=True)
+                        file_path = os.path.join(upload_dir, uploaded_file.name)
+                        with open(file_path, "wb") as f:
+                            f.write(uploaded_file.getbuffer())
+                        justification_content = f"File uploaded: {uploaded_file.name}"
+
+                    st.session_state["project_basic"] = {
+                        'project_name': project_name,
+                        'project_description': project_description,
+                        'domain': domain,
+                        'priority': priority,
+                        'start_date': start_date,
+                        'end_date': end_date,
+                        'department': department,
+                        'contact_email': contact_email,
+                        'contact_phone': contact_phone,
+                        'justification': justification_content,
+                        'justification_type': justification_type,
+                        'submitted_by': submitted_by
+                    }
+                    st.session_state["project_info_submitted"] = True
+                    st.success("✅ Basic project info saved. Now add BOM/Material details.")
+                else:
+                    st.error("❌ Please fill all required fields.")
+
+        st.markdown('</div>', unsafe_allow_html=True)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Step 2: BOM/Materials Entry
+    if st.session_state["project_info_submitted"]:
+        st.markdown('<div class="form-container">', unsafe_allow_html=True)
+        st.markdown("### 📦 Step 2: BOM/Material Items Entry")
+        st.markdown('<div class="form-section">', unsafe_allow_html=True)
+
+        _project_materials_editor()
+
+        submitted = st.button("Submit Full Project (with BOM)")
+        if submitted:
+            if not st.session_state["project_materials_data"]:
+                st.error("At least one material/BOM entry is required.")
+            else:
+                # Project, materials and the admin notification are written in one transaction
+                project_data = st.session_state["project_basic"]
+                try:
+                    new_proj_id, tracking_id = submit_project(db, project_data, st.session_state["project_materials_data"])
+                except db.Error as e:
+                    st.error(f"❌ Project could not be submitted, nothing was saved: {e}")
+                else:
+                    st.success(f"✅ Project and Materials submitted successfully!")
+                    st.success(f"📋 Tracking ID: **{tracking_id}**")
+                    st.info("💡 Use this tracking ID to monitor your project status.")
+                    st.session_state["project_info_submitted"] = False
+                    st.session_state["project_materials_data"] = []
+                    st.session_state["project_basic"] = {}
+
+# Adding a material reruns only the form and the review table below it, not the whole app
+# (Step 1 and the submit button stay as they are); deleting reruns only the table
+@st.fragment
+def _project_materials_editor():
+    categories = list(BOQ_TOPICS.keys())
+
+    with st.form("material_entry_proj_form_step2"):
+        # First select the category/topic
+        category = st.selectbox("Select Category/Topic", categories, key="category_proj2")
+
+        # Then select subtopic based on the selected category
+        subtopics = BOQ_TOPICS[category]
+        subtopic = st.selectbox("Select Sub-topic", subtopics, key="subtopic_proj2")
+
+        # Then enter additional description details
+        description = st.text_input("Additional Description (Optional)", placeholder="Add more details if needed", key="desc_proj2")
+
+        mcol1, mcol2, mcol3 = st.columns([3, 1, 1])
+        with mcol1:
+            units = st.selectbox("Units/Qty", BOQ_UNITS, key='units_proj2')
+        with mcol2:
+            nos = st.selectbox("Nos", BOQ_NOS, key='nos_proj2')
+        with mcol3:
+            unit_price = st.number_input("Unit Price Total Amount", min_value=0.0, step=0.01, format="%.2f", key='unit_price_proj2')
+        row2_col1, row2_col2, row2_col3 = st.columns([2,2,2])
+        with row2_col1:
+            source_type = st.selectbox("Source/Type", BOQ_SOURCE_TYPES, key='stype_proj2')
+        with row2_col2:
+            payment_schedule = st.selectbox("Payment Schedule", BOQ_PAYMENT_SCHEDULES, key='pay_sched_proj2')
+        with row2_col3:
+            st.empty()  # Empty column for alignment
+        amount_inr = nos * unit_price
+        st.markdown(f"##### Amount INR: <span style='color: #3973ac; font-size: 22px;'>₹{amount_inr:,.2f}</span>", unsafe_allow_html=True)
+
+        # Justification section for project materials
+        st.markdown("#### 📄 Justification for this Material Entry")
+        proj_justification_type = st.radio("Justification Type:", ["Text Input", "File Upload"], horizontal=True, key="proj_mat_justification_type")
+
+        if proj_justification_type == "Text Input":
+            proj_material_justification = st.text_area("Justification *", height=80, placeholder="Provide justification for this material entry...", key="proj_mat_justification_text")
+        else:
+            proj_material_justification_file = st.file_uploader("Upload Justification Document *", type=['pdf', 'docx', 'txt'], help="Upload PDF, DOCX, or TXT file", key="proj_mat_justification_file")
+            proj_material_justification = proj_material_justification_file.name if proj_material_justification_file else ""
+
+        add_mat = st.form_submit_button("Add Material to Project")
+    if add_mat:
+        # Combine subtopic and additional description
+        full_description = f"{subtopic}"
+        if description:
+            full_description += f" - {description}"
+
+        # Handle justification
+        justification_content = proj_material_justification
+        justification_file_path = ""
+
+        if proj_justification_type == "File Upload" and proj_material_justification_file:
+            # Save uploaded file
+            upload_dir = "data/uploads/project_material_justifications"
+            os.makedirs(upload_dir, exist_ok=True)
+            file_path = os.path.join(upload_dir, proj_material_justification_file.name)
+            with open(file_path, "wb") as f:
+                f.write(proj_material_justification_file.getbuffer())
+            justification_file_path = file_path
+            justification_content = f"File uploaded: {proj_material_justification_file.name}"
+
+        required = [subtopic, units, nos, source_type, payment_schedule]
+        if proj_justification_type == "Text Input":
+            required.append(proj_material_justification)
+        else:
+            required.append(proj_material_justification_file)
+
+        if all(required) and unit_price > 0:
+            entry = {
+                "Category": category,
+                "Sub-topic": subtopic,
+                "Description": full_description,
+                "Units/Qty": units,
+                "Nos": nos,
+                "Source/Type": source_type,
+                "Payment Schedule": payment_schedule,
+                "Unit Price Total Amount": unit_price,
+                "Amount INR": amount_inr,
+                "Justification": justification_content,
+                "Justification Type": proj_justification_type,
+                "Justification File Path": justification_file_path
+            }
+            st.session_state["project_materials_data"].append(entry)
+            st.success(f"Material entry added to project: {category} - {subtopic}!")
+        else:
+            st.error("❌ Please fill all required fields and enter Unit Price > 0.")
+
+    _project_materials_table()
+
+@st.fragment
+def _project_materials_table():
+    # Show review table with categories and row numbers
+    if not st.session_state["project_materials_data"]:
+        return
+    st.markdown("#### Added Material Details (Please Review)")
+
+    for cat, cat_rows, total_amount in group_entries(st.session_state["project_materials_data"]):
+        with st.expander(f"{cat}", expanded=True):
+            # Display the data table with subtopic information
+            st.dataframe(cat_rows, use_container_width=True, hide_index=True)
+
+            st.markdown(f"**Total for {cat}: ₹{total_amount:,.2f}**")
+
+            # Add delete buttons for entries in this category
+            st.button(f"Delete All in {cat}", key=f"del_proj_cat_{cat}",
+                      on_click=delete_boq_category, args=("project_materials_data", cat))
+
+    # Show grand total
+    grand_total = sum(item["Amount INR"] for item in st.session_state["project_materials_data"])
+    st.markdown(f"### Grand Total: ₹{grand_total:,.2f}")
@@ -0,0 +1,232 @@
+"""Super User Dashboard: cumulative costs, performance analysis and exports"""
+import pandas as pd
+import plotly.express as px
+import streamlit as st
+
+from dashboard.kpis import category_budget, material_summary
+from dashboard.pages.common import db, get_projects
+
+def render():
+    # Page Header with Breadcrumb
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Super User Dashboard</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">👑 Super User Dashboard</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Advanced analytics, cumulative calculations, and detailed project insights</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Super User authentication
+    super_password = st.text_input("Super User Password", type="password", placeholder="Enter super user password")
+
+    if super_password == "super123":  # Super user password
+        st.success("✅ Super User access granted!")
+        cache_stats = db.cache.stats()
+        st.caption(f"Query cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                   f"({cache_stats['hit_rate']:.0%} hit rate, {cache_stats['entries']} cached results)")
+
+        # Get comprehensive data
+        projects_df = get_projects()
+
+        if not projects_df.empty:
+            # Cumulative Cost Analysis
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 💰 Cumulative Cost Analysis")
+
+            # Cumulative costs by category from the materials rollups (largest first)
+            material_totals = material_summary(db)
+            category_costs = category_budget(db)
+
+            if material_totals['entries']:
+
+                col1, col2 = st.columns(2)
+
+            with col1:
+                    st.markdown("#### 📊 Cost Distribution by Category")
+                    fig_category = px.pie(
+                        category_costs,
+                        values='amount_inr',
+                        names='category',
+                        title="Material Cost Distribution",
+                        color_discrete_sequence=px.colors.qualitative.Set3
+                    )
+                    fig_category.update_layout(height=400)
+                    st.plotly_chart(fig_category, use_container_width=True)
+
+            with col2:
+                    st.markdown("#### 📈 Top Categories by Cost")
+                    fig_bar = px.bar(
+                        category_costs.head(10),
+                        x='amount_inr',
+                        y='category',
+                        orientation='h',
+                        title="Top 10 Categories by Cost",
+                        color='amount_inr',
+                        color_continuous_scale='Blues'
+                    )
+                    fig_bar.update_layout(height=400)
+                    st.plotly_chart(fig_bar, use_container_width=True)
+
+                # Detailed cost breakdown
+            st.markdown("#### 📋 Detailed Cost Breakdown")
+            st.dataframe(category_costs, use_container_width=True)
+
+                # Total cumulative costs
+            total_material_cost = material_totals['amount_inr']
+            total_projects = len(projects_df)
+            avg_cost_per_project = total_material_cost / total_projects if total_projects > 0 else 0
+
+            col1, col2, col3, col4 = st.columns(4)
+            with col1:
+                    st.metric("Total Material Cost", f"₹{total_material_cost:,.2f}")
+            with col2:
+                    st.metric("Total Projects", total_projects)
+            with col3:
+                    st.metric("Avg Cost per Project", f"₹{avg_cost_per_project:,.2f}")
+            with col4:
+                    st.metric("Material Entries", material_totals['entries'])
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # Project Performance Analysis
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 📊 Project Performance Analysis")
+
+            # Status analysis
+            status_analysis = projects_df.groupby('status').agg({
+                'id': 'count',
+                'total_cost': ['sum', 'mean']
+            }).round(2)
+            status_analysis.columns = ['Count', 'Total Cost', 'Average Cost']
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("#### 📈 Status Distribution")
+                fig_status = px.pie(
+                    values=projects_df['status'].value_counts().values,
+                    names=projects_df['status'].value_counts().index,
+                    title="Project Status Distribution",
+                    color_discrete_map={
+                        'pending': '#ffc107',
+                        'approved': '#28a745',
+                        'rejected': '#dc3545',
+                        'under_review': '#6f42c1'
+                    }
+                )
+                st.plotly_chart(fig_status, use_container_width=True)
+
+                with col2:
+                    st.markdown("#### 💰 Cost by Status")
+                status_costs = projects_df.groupby('status')['total_cost'].sum().reset_index()
+                fig_cost = px.bar(
+                    status_costs,
+                    x='status',
+                    y='total_cost',
+                    title="Total Cost by Status",
+                    color='total_cost',
+                    color_continuous_scale='Blues'
+                )
+                st.plotly_chart(fig_cost, use_container_width=True)
+
+            st.markdown("#### 📋 Status Analysis Summary")
+            st.dataframe(status_analysis, use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # Domain Analysis
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 🏗️ Domain Analysis")
+
+            domain_analysis = projects_df.groupby('domain').agg({
+                'id': 'count',
+                'total_cost': ['sum', 'mean']
+            }).round(2)
+            domain_analysis.columns = ['Project Count', 'Total Cost', 'Average Cost']
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown("#### 📊 Projects by Domain")
+                domain_counts = projects_df['domain'].value_counts().reset_index()
+                domain_counts.columns = ['Domain', 'Count']
+                fig_domain = px.bar(
+                    domain_counts,
+                    x='Domain',
+                    y='Count',
+                    title="Project Count by Domain",
+                    color='Count',
+                    color_continuous_scale='Blues'
+                )
+                st.plotly_chart(fig_domain, use_container_width=True)
+
+                with col2:
+                    st.markdown("#### 💰 Cost by Domain")
+                domain_costs = projects_df.groupby('domain')['total_cost'].sum().reset_index()
+                fig_domain_cost = px.pie(
+                    domain_costs,
+                    values='total_cost',
+                    names='domain',
+                    title="Cost Distribution by Domain"
+                )
+                st.plotly_chart(fig_domain_cost, use_container_width=True)
+
+            st.markdown("#### 📋 Domain Analysis Summary")
+            st.dataframe(domain_analysis, use_container_width=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+
+            # Export functionality
+            st.markdown('<div class="form-container">', unsafe_allow_html=True)
+            st.markdown("### 📤 Export Data")
+
+            col1, col2, col3 = st.columns(3)
+
+            with col1:
+                if st.button("📊 Export Projects Data"):
+                    csv = projects_df.to_csv(index=False)
+                    st.download_button(
+                        label="Download Projects CSV",
+                        data=csv,
+                        file_name="projects_data.csv",
+                        mime="text/csv"
+                    )
+
+            with col2:
+                if st.button("📦 Export Materials Data"):
+                    # The only place the full materials table is needed
+                    materials_df = db.cached_query("SELECT * FROM project_materials", ['project_materials'])
+                    csv = materials_df.to_csv(index=False)
+                    st.download_button(
+                        label="Download Materials CSV",
+                        data=csv,
+                        file_name="materials_data.csv",
+                        mime="text/csv"
+                    )
+
+                    with col3:
+                        if st.button("📈 Export Analytics Summary"):
+                            summary_data = {
+                        'Total Projects': len(projects_df),
+                        'Total Material Cost': material_totals['amount_inr'],
+                        'Average Project Cost': projects_df['total_cost'].mean(),
+                        'Approval Rate': len(projects_df[projects_df['status'] == 'approved']) / len(projects_df) * 100
+                    }
+                    summary_df = pd.DataFrame(list(summary_data.items()), columns=['Metric', 'Value'])
+                    csv = summary_df.to_csv(index=False)
+                    st.download_button(
+                        label="Download Summary CSV",
+                        data=csv,
+                        file_name="analytics_summary.csv",
+                        mime="text/csv"
+                    )
+
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        else:
+            st.info("No projects found for analysis.")
+
+    elif super_password:
+        st.error("❌ Invalid super user password.")
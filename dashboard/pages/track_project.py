@@ -0,0 +1,94 @@
+"""Track Project: status and timeline for one tracking ID"""
+import pandas as pd
+import streamlit as st
+
+from dashboard.pages.common import get_project_by_tracking_id
+
+def render():
+    # Page Header with Breadcrumb
+    st.markdown("""
+    <div style="margin-bottom: 2rem;">
+        <nav style="margin-bottom: 1rem;">
+            <span style="color: #6c757d;">🏠 Dashboard</span>
+            <span style="color: #6c757d;">›</span>
+            <span style="color: #2c3e50; font-weight: 600;">Track Project</span>
+        </nav>
+        <h1 style="color: #2c3e50; margin: 0;">🔍 Track Project Status</h1>
+        <p style="color: #6c757d; margin: 0.5rem 0 0 0;">Monitor your project progress and status updates</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    tracking_id = st.text_input("Enter Tracking ID", placeholder="e.g., PRJ251019A1B2")
+
+    if tracking_id:
+        project = get_project_by_tracking_id(tracking_id)
+
+        if project:
+            st.markdown(f"""
+            <div class="alert alert-success">
+                <strong>✅ Project Found:</strong> {project[2]}
+            </div>
+            """, unsafe_allow_html=True)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.markdown('<div class="form-container">', unsafe_allow_html=True)
+                st.markdown("### 📋 Project Information")
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%); padding: 1.5rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #90caf9; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                    <p style="color: #1565c0; margin: 0.5rem 0;"><strong>Tracking ID:</strong> <code style="background: rgba(255,255,255,0.8); padding: 0.2rem 0.5rem; border-radius: 4px;">{project[1]}</code></p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Project Name:</strong> {project[2]}</p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Domain:</strong> {project[4]}</p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Priority:</strong> {project[5]}</p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Total Cost:</strong> ₹{project[12]:,.2f}</p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Submitted By:</strong> {project[22]}</p>
+                    <p style="color: #2c3e50; margin: 0.5rem 0;"><strong>Submitted On:</strong> {project[23]}</p>
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown('<div class="form-container">', unsafe_allow_html=True)
+                st.markdown("### 📊 Current Status")
+                status = project[21]
+
+                # Status badge
+                status_badge_class = f"status-{status.replace('_', '-')}"
+                st.markdown(f"""
+                <div style="margin: 1rem 0;">
+                    <span class="status-badge {status_badge_class}">{status.replace('_', ' ').title()}</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+                # Additional info
+                if len(project) > 25 and project[25]:  # reviewed_by
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #e8f5e8 0%, #c8e6c9 100%); padding: 1.5rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #81c784; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Reviewed By:</strong> {project[25]}</p>
+                        <p style="color: #2e7d32; margin: 0.5rem 0;"><strong>Review Date:</strong> {project[26]}</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+                if len(project) > 27 and project[27]:  # review_comments
+                    st.markdown(f"""
+                    <div style="background: linear-gradient(135deg, #fff3e0 0%, #ffcc02 100%); padding: 1rem; border-radius: 8px; margin: 1rem 0; border: 1px solid #ffb74d; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+                        <strong style="color: #e65100;">Review Comments:</strong><br>
+                        <em style="color: #bf360c;">{project[27]}</em>
+                    </div>
+                    """, unsafe_allow_html=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            # Timeline
+            st.subheader("📅 Project Timeline")
+            timeline_data = [
+                {"Event": "Project Submitted", "Date": project[23], "Status": "Completed"},
+                {"Event": "Under Review", "Date": project[26] if project[26] else "Pending", "Status": "In Progress" if status == 'pending' else "Completed"},
+                {"Event": "Decision Made", "Date": project[26] if project[26] else "Pending", "Status": "Completed" if status in ['approved', 'rejected'] else "Pending"}
+            ]
+
+            timeline_df = pd.DataFrame(timeline_data)
+            st.dataframe(timeline_df, use_container_width=True)
+
+        else:
+            st.error("❌ Project not found. Please check your tracking ID.")
@@ -0,0 +1,254 @@
+"""Schema migrations for the PostgreSQL backend (dashboard/postgres.py).
+
+Same versions and objects as dashboard/migrations.py, written for PostgreSQL:
+SERIAL keys, plpgsql trigger functions, and statement-level triggers for the
+write counters. The applied version is kept in schema_migrations. A
+transaction-scoped advisory lock makes app replicas that start together
+migrate one at a time.
+"""
+from dashboard.migrations import MATERIAL_ROLLUPS, VERSIONED_TABLES
+
+# Any constant works as long as every replica uses the same one
+_MIGRATION_LOCK = 0x6D696772  # 'migr'
+
+def _create_tables(cursor):
+    # Column order matches the SQLite tables: the Track Project page reads rows by position.
+    # finalized stays an integer flag (0/1) as in SQLite, where the app writes 1 and 0.
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS projects (
+            id SERIAL PRIMARY KEY,
+            tracking_id TEXT UNIQUE,
+            project_name TEXT NOT NULL,
+            project_description TEXT,
+            domain TEXT,
+            priority TEXT,
+            estimated_budget DOUBLE PRECISION,
+            manpower_count INTEGER,
+            manpower_cost DOUBLE PRECISION,
+            material_cost DOUBLE PRECISION,
+            equipment_cost DOUBLE PRECISION,
+            other_costs DOUBLE PRECISION,
+            total_cost DOUBLE PRECISION,
+            start_date DATE,
+            end_date DATE,
+            department TEXT,
+            contact_email TEXT,
+            contact_phone TEXT,
+            justification TEXT,
+            risk_assessment TEXT,
+            expected_outcome TEXT,
+            status TEXT DEFAULT 'pending',
+            submitted_by TEXT,
+            submitted_at TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP,
+            reviewed_by TEXT,
+            review_date TIMESTAMP(0),
+            review_comments TEXT
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notifications (
+            id SERIAL PRIMARY KEY,
+            project_id INTEGER REFERENCES projects (id),
+            notification_type TEXT,
+            title TEXT,
+            message TEXT,
+            is_read BOOLEAN DEFAULT FALSE,
+            created_at TIMESTAMP(0) DEFAULT CURRENT_TIMESTAMP
+        )
+    ''')
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS project_materials (
+            id SERIAL PRIMARY KEY,
+            project_id INTEGER REFERENCES projects (id),
+            category TEXT,
+            subtopic TEXT,
+            description TEXT,
+            units_qty TEXT,
+            nos INTEGER,
+            source_type TEXT,
+            payment_schedule TEXT,
+            unit_price DOUBLE PRECISION,
+            amount_inr DOUBLE PRECISION,
+            justification TEXT,
+            justification_type TEXT,
+            justification_file_path TEXT,
+            status TEXT DEFAULT 'pending',
+            review_comments TEXT,
+            reviewed_by TEXT,
+            reviewed_at TIMESTAMP(0),
+            finalized INTEGER DEFAULT 0
+        )
+    ''')
+
+def _add_hot_path_indexes(cursor):
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_projects_status_submitted ON projects (status, submitted_at)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_materials_project_status ON project_materials (project_id, status)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_notifications_created ON notifications (created_at)")
+    cursor.execute("ANALYZE")
+
+def _add_table_versions(cursor):
+    # One bump per statement rather than per row: a 5,000-row executemany still
+    # invalidates the cache, without 5,000 updates of the same counter row
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS table_versions (
+            table_name TEXT PRIMARY KEY,
+            version BIGINT NOT NULL DEFAULT 0
+        )
+    ''')
+    cursor.execute('''
+        CREATE OR REPLACE FUNCTION bump_table_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE table_versions SET version = version + 1 WHERE table_name = TG_TABLE_NAME;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    ''')
+    for table in VERSIONED_TABLES:
+        cursor.execute("INSERT INTO table_versions (table_name) VALUES (%s) ON CONFLICT DO NOTHING", (table,))
+        cursor.execute(f'''
+            CREATE OR REPLACE TRIGGER trg_{table}_version AFTER INSERT OR UPDATE OR DELETE ON {table}
+            FOR EACH STATEMENT EXECUTE FUNCTION bump_table_version()
+        ''')
+
+def _add_project_kpis(cursor):
+    cursor.execute('''
+        CREATE TABLE IF NOT EXISTS project_kpi_totals (
+            status TEXT NOT NULL,
+            domain TEXT NOT NULL,
+            projects INTEGER NOT NULL,
+            costed_projects INTEGER NOT NULL,
+            total_cost DOUBLE PRECISION NOT NULL,
+            PRIMARY KEY (status, domain)
+        )
+    ''')
+    cursor.execute("DELETE FROM project_kpi_totals")
+    cursor.execute('''
+        INSERT INTO project_kpi_totals (status, domain, projects, costed_projects, total_cost)
+        SELECT COALESCE(status, ''), COALESCE(domain, ''), COUNT(*), COUNT(total_cost), COALESCE(SUM(total_cost), 0)
+        FROM projects
+        GROUP BY 1, 2
+    ''')
+    cursor.execute('''
+        CREATE OR REPLACE FUNCTION project_kpis_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN
+                UPDATE project_kpi_totals SET
+                    projects = projects - 1,
+                    costed_projects = costed_projects - (OLD.total_cost IS NOT NULL)::int,
+                    total_cost = total_cost - COALESCE(OLD.total_cost, 0)
+                WHERE status = COALESCE(OLD.status, '') AND domain = COALESCE(OLD.domain, '');
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN
+                INSERT INTO project_kpi_totals AS t (status, domain, projects, costed_projects, total_cost)
+                VALUES (COALESCE(NEW.status, ''), COALESCE(NEW.domain, ''), 1,
+                        (NEW.total_cost IS NOT NULL)::int, COALESCE(NEW.total_cost, 0))
+                ON CONFLICT (status, domain) DO UPDATE SET
+                    projects = t.projects + 1,
+                    costed_projects = t.costed_projects + excluded.costed_projects,
+                    total_cost = t.total_cost + excluded.total_cost;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    ''')
+    cursor.execute('''
+        CREATE OR REPLACE TRIGGER trg_projects_kpis
+        AFTER INSERT OR DELETE OR UPDATE OF status, domain, total_cost ON projects
+        FOR EACH ROW EXECUTE FUNCTION project_kpis_apply()
+    ''')
+    cursor.execute('''
+        CREATE OR REPLACE VIEW project_kpis AS
+        SELECT NULLIF(status, '') AS status, NULLIF(domain, '') AS domain,
+               projects, costed_projects, total_cost,
+               CASE WHEN costed_projects > 0 THEN total_cost / costed_projects END AS avg_cost
+        FROM project_kpi_totals
+        WHERE projects > 0
+    ''')
+    cursor.execute("CREATE INDEX IF NOT EXISTS ix_projects_submitted ON projects (submitted_at, id)")
+
+def _add_material_rollups(cursor):
+    removes, adds = [], []
+    for column, (table, column_type, empty) in MATERIAL_ROLLUPS.items():
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table} (
+                {column} {column_type} PRIMARY KEY,
+                entries INTEGER NOT NULL,
+                amount_inr DOUBLE PRECISION NOT NULL
+            )
+        ''')
+        cursor.execute(f"DELETE FROM {table}")
+        cursor.execute(f'''
+            INSERT INTO {table} ({column}, entries, amount_inr)
+            SELECT COALESCE({column}, {empty}), COUNT(*), COALESCE(SUM(amount_inr), 0)
+            FROM project_materials
+            GROUP BY 1
+        ''')
+        removes.append(f'''
+                UPDATE {table} SET
+                    entries = entries - 1,
+                    amount_inr = amount_inr - COALESCE(OLD.amount_inr, 0)
+                WHERE {column} = COALESCE(OLD.{column}, {empty});''')
+        adds.append(f'''
+                INSERT INTO {table} AS t ({column}, entries, amount_inr)
+                VALUES (COALESCE(NEW.{column}, {empty}), 1, COALESCE(NEW.amount_inr, 0))
+                ON CONFLICT ({column}) DO UPDATE SET
+                    entries = t.entries + 1,
+                    amount_inr = t.amount_inr + excluded.amount_inr;''')
+    cursor.execute(f'''
+        CREATE OR REPLACE FUNCTION material_rollups_apply() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') THEN{''.join(removes)}
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') THEN{''.join(adds)}
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+    ''')
+    cursor.execute('''
+        CREATE OR REPLACE TRIGGER trg_project_materials_totals
+        AFTER INSERT OR DELETE OR UPDATE OF project_id, category, status, amount_inr ON project_materials
+        FOR EACH ROW EXECUTE FUNCTION material_rollups_apply()
+    ''')
+
+def _integer_material_project_ids(cursor):
+    # Only SQLite can hold blob ids (see dashboard/migrations.py); project_id is INTEGER here
+    pass
+
+# (version, description, function taking a cursor); versions match dashboard/migrations.py
+MIGRATIONS = [
+    (1, 'base tables and review columns', _create_tables),
+    (2, 'indexes for status, project and date lookups', _add_hot_path_indexes),
+    (3, 'per-table write counters for the query cache', _add_table_versions),
+    (4, 'trigger-maintained project_kpis for the overview page', _add_project_kpis),
+    (5, 'trigger-maintained project_materials rollups by project, category and status', _add_material_rollups),
+    (6, 'integer project_materials.project_id in rows written with numpy ids', _integer_material_project_ids),
+]
+
+def schema_version(cursor):
+    cursor.execute("SELECT COALESCE(MAX(version), 0) FROM schema_migrations")
+    return cursor.fetchone()[0]
+
+def migrate(conn):
+    """Apply pending migrations on a psycopg2 connection and return the resulting schema version"""
+    cursor = conn.cursor()
+    try:
+        # DDL is transactional in PostgreSQL: each migration commits together with its version row
+        cursor.execute("CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER PRIMARY KEY)")
+        conn.commit()
+        for target, _description, apply in MIGRATIONS:
+            cursor.execute("SELECT pg_advisory_xact_lock(%s)", (_MIGRATION_LOCK,))
+            if schema_version(cursor) >= target:
+                conn.commit()
+                continue
+            apply(cursor)
+            cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (target,))
+            conn.commit()
+        version = schema_version(cursor)
+        conn.commit()
+        return version
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
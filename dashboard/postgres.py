@@ -0,0 +1,128 @@
+"""PostgreSQL backend for the Streamlit app.
+
+Same interface as dashboard.connection.ConnectionManager, so the page helpers,
+dashboard/boq.py and dashboard/submission.py run unchanged. Connections come
+from the pooled engine in db/engine.py and are held only for one read or one
+transaction. Several app replicas can therefore share one database without
+each replica pinning a connection per session thread. Query results are
+fetched through server-side cursors in DASHBOARD_FETCH_SIZE batches, so a
+large read does not buffer the whole result in the driver first.
+
+The app's SQL uses sqlite3's ? placeholders; they are rewritten to psycopg2's
+%s here.
+"""
+import itertools
+from contextlib import contextmanager
+
+import numpy as np
+import pandas as pd
+import psycopg2
+from sqlalchemy.engine import make_url
+
+from db import db_config
+from db.engine import make_engine
+from dashboard import pg_migrations
+from dashboard.query_cache import QueryCache
+
+_cursor_names = itertools.count()
+
+def _pg_sql(sql):
+    # psycopg2 formats every statement that has parameters, so literal % must be doubled
+    return sql.replace('%', '%%').replace('?', '%s')
+
+def _pg_params(params):
+    # Ids and keys often come straight out of a DataFrame; psycopg2 cannot adapt numpy scalars
+    return tuple(value.item() if isinstance(value, np.generic) else value for value in params)
+
+class _PgConnection:
+    """The bits of sqlite3.Connection the app uses, on a pooled psycopg2 connection"""
+
+    def __init__(self, raw):
+        self.raw = raw
+
+    def execute(self, sql, params=()):
+        cursor = self.raw.cursor()
+        cursor.execute(_pg_sql(sql), _pg_params(params))
+        return cursor
+
+    def executemany(self, sql, seq_of_params):
+        cursor = self.raw.cursor()
+        cursor.executemany(_pg_sql(sql), [_pg_params(params) for params in seq_of_params])
+        return cursor
+
+    def cursor(self):
+        return self.raw.cursor()
+
+    def read_frame(self, sql, params=()):
+        """Run a SELECT through a server-side cursor and return a DataFrame"""
+        cursor = self.raw.cursor(name=f'dashboard_read_{next(_cursor_names)}')
+        try:
+            cursor.execute(_pg_sql(sql), _pg_params(params))
+            rows = []
+            while True:
+                batch = cursor.fetchmany(db_config.DASHBOARD_FETCH_SIZE)
+                if not batch:
+                    break
+                rows.extend(batch)
+            columns = [desc[0] for desc in cursor.description]
+        finally:
+            cursor.close()
+        # coerce_float turns NUMERIC results (e.g. SUM over integers) into floats, as pd.read_sql_query does
+        return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+def _read_frame(sql, conn, params=()):
+    # QueryCache's reader signature, matching pd.read_sql_query(sql, con, params=...)
+    return conn.read_frame(sql, params)
+
+class PostgresConnectionManager:
+    Error = psycopg2.Error
+
+    def __init__(self, url):
+        url = make_url(url)
+        if url.drivername == 'postgresql':
+            # requirements.txt ships psycopg2; newer SQLAlchemy would otherwise pick psycopg 3
+            url = url.set(drivername='postgresql+psycopg2')
+        # UTC sessions, so CURRENT_TIMESTAMP matches what SQLite stores
+        self.engine = make_engine(url, connect_args={'options': '-c timezone=UTC'})
+        self.cache = QueryCache()
+
+    @contextmanager
+    def _reading(self):
+        # A pooled connection for reads; the pool rolls it back when it is returned
+        raw = self.engine.raw_connection()
+        try:
+            yield _PgConnection(raw)
+        finally:
+            raw.close()
+
+    @contextmanager
+    def transaction(self):
+        """A pooled connection; commit on success, roll back on error"""
+        raw = self.engine.raw_connection()
+        try:
+            yield _PgConnection(raw)
+            raw.commit()
+        except BaseException:
+            raw.rollback()
+            raise
+        finally:
+            raw.close()
+
+    def cached_query(self, sql, tables, params=()):
+        """Run a read through the shared QueryCache; tables are the ones sql reads"""
+        with self._reading() as conn:
+            return self.cache.read_sql(conn, sql, tables, params, read=_read_frame)
+
+    def fetchone(self, sql, params=()):
+        with self._reading() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def migrate(self):
+        raw = self.engine.raw_connection()
+        try:
+            return pg_migrations.migrate(raw)
+        finally:
+            raw.close()
+
+    def close(self):
+        self.engine.dispose()
@@ -0,0 +1,56 @@
+"""Shared cache of query results, invalidated by the table_versions write counters.
+
+A cached frame is returned only while the versions of every table the query
+reads are unchanged, so a write from any session or process is visible on the
+next rerun. Checking costs one primary-key read instead of the full query.
+"""
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+class QueryCache:
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # (sql, params) -> (versions, frame)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def table_versions(conn, tables):
+        placeholders = ','.join('?' * len(tables))
+        rows = conn.execute(
+            f'SELECT table_name, version FROM table_versions WHERE table_name IN ({placeholders})', tables)
+        return tuple(sorted(rows))
+
+    def read_sql(self, conn, sql, tables, params=(), read=pd.read_sql_query):
+        """read(sql, conn, params) served from memory while tables are unchanged"""
+        key = (sql, tuple(params))
+        versions = self.table_versions(conn, tuple(tables))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == versions:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                # Callers add and overwrite columns; with copy-on-write a shallow copy keeps the cached frame intact
+                return entry[1].copy(deep=False)
+            self.misses += 1
+
+        df = read(sql, conn, params=params)
+        with self._lock:
+            self._entries[key] = (versions, df)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return df.copy(deep=False)
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {'hits': self.hits, 'misses': self.misses, 'entries': len(self._entries),
+                    'hit_rate': self.hits / total if total else 0.0}
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
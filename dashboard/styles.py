@@ -0,0 +1,434 @@
+"""Theme for every page, injected once per rerun by streamlit_app.py"""
+
+APP_CSS = """
+    <style>
+    /* Main Theme Colors */
+    :root {
+        --primary-color: #1f77b4;
+        --secondary-color: #ff7f0e;
+        --success-color: #2ca02c;
+        --warning-color: #d62728;
+        --info-color: #17a2b8;
+        --light-bg: #f8f9fa;
+        --dark-text: #2c3e50;
+        --border-color: #dee2e6;
+    }
+
+    /* Main Container */
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem 1rem;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        color: white;
+        text-align: center;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+    }
+
+    .main-header h1 {
+        font-size: 2.5rem;
+        font-weight: 700;
+        margin: 0;
+        text-shadow: 2px 2px 4px rgba(0,0,0,0.3);
+    }
+
+    .main-header p {
+        font-size: 1.2rem;
+        margin: 0.5rem 0 0 0;
+        opacity: 0.9;
+    }
+
+    /* Cards */
+    .metric-card {
+        background: white;
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.08);
+        border-left: 4px solid var(--primary-color);
+        transition: transform 0.2s ease;
+    }
+
+    .metric-card:hover {
+        transform: translateY(-2px);
+        box-shadow: 0 4px 20px rgba(0,0,0,0.12);
+    }
+
+    .metric-value {
+        font-size: 2rem;
+        font-weight: 700;
+        color: var(--primary-color);
+        margin: 0;
+    }
+
+    .metric-label {
+        font-size: 0.9rem;
+        color: #6c757d;
+        margin: 0.5rem 0 0 0;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    /* Status Badges */
+    .status-badge {
+        padding: 0.5rem 1rem;
+        border-radius: 20px;
+        font-weight: 600;
+        font-size: 0.8rem;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    .status-pending {
+        background-color: #fff3cd;
+        color: #856404;
+        border: 1px solid #ffeaa7;
+    }
+
+    .status-approved {
+        background-color: #d4edda;
+        color: #155724;
+        border: 1px solid #c3e6cb;
+    }
+
+    .status-rejected {
+        background-color: #f8d7da;
+        color: #721c24;
+        border: 1px solid #f5c6cb;
+    }
+
+    .status-under-review {
+        background-color: #d1ecf1;
+        color: #0c5460;
+        border: 1px solid #bee5eb;
+    }
+
+    /* Forms */
+    .form-container {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        padding: 2rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        margin-bottom: 2rem;
+        border: 1px solid #dee2e6;
+    }
+
+    .form-section {
+        background: rgba(255, 255, 255, 0.8);
+        padding: 1.5rem;
+        margin-bottom: 1.5rem;
+        border-radius: 8px;
+        border-bottom: 2px solid #e9ecef;
+        border-left: 4px solid var(--primary-color);
+    }
+
+    .topic-section {
+        background: rgba(255, 255, 255, 0.9);
+        padding: 1rem;
+        margin-bottom: 1rem;
+        border-radius: 6px;
+        border-bottom: 1px solid #dee2e6;
+        border-left: 3px solid var(--info-color);
+    }
+
+    .topic-section h3 {
+        margin-bottom: 0.5rem;
+        padding-bottom: 0.5rem;
+        border-bottom: 2px solid var(--primary-color);
+        color: var(--primary-color);
+        font-weight: 600;
+    }
+
+    /* Buttons */
+    .stButton > button {
+        background: linear-gradient(45deg, var(--primary-color), #4a90e2);
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 0.5rem 1.5rem;
+        font-weight: 600;
+        transition: all 0.3s ease;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.15);
+    }
+
+    .stButton > button:hover {
+        transform: translateY(-1px);
+        box-shadow: 0 4px 15px rgba(0,0,0,0.2);
+    }
+
+    /* Sidebar */
+    .sidebar .sidebar-content {
+        background: linear-gradient(180deg, #f8f9fa 0%, #e9ecef 100%);
+    }
+
+    /* Progress Bars */
+    .progress-container {
+        background: #e9ecef;
+        border-radius: 10px;
+        padding: 0.5rem;
+        margin: 1rem 0;
+    }
+
+    .progress-bar {
+        background: linear-gradient(90deg, var(--success-color), #4caf50);
+        height: 8px;
+        border-radius: 5px;
+        transition: width 0.3s ease;
+    }
+
+    /* Tables */
+    .dataframe {
+        border-radius: 8px;
+        overflow: hidden;
+        box-shadow: 0 4px 15px rgba(0,0,0,0.1);
+        background: rgba(255, 255, 255, 0.95);
+        border: 1px solid #dee2e6;
+    }
+
+    /* Data display improvements */
+    .stDataFrame {
+        background: rgba(255, 255, 255, 0.95);
+        border-radius: 8px;
+        border: 1px solid #dee2e6;
+    }
+
+    /* Enhanced table styling */
+    .stDataFrame table {
+        border-collapse: collapse;
+        width: 100%;
+        font-size: 14px;
+    }
+
+    .stDataFrame th {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        font-weight: 600;
+        padding: 12px 8px;
+        text-align: left;
+        border-bottom: 2px solid #5a67d8;
+    }
+
+    .stDataFrame td {
+        padding: 10px 8px;
+        border-bottom: 1px solid #e2e8f0;
+        background: rgba(255, 255, 255, 0.9);
+    }
+
+    .stDataFrame tr:nth-child(even) td {
+        background: rgba(248, 250, 252, 0.9);
+    }
+
+    .stDataFrame tr:hover td {
+        background: rgba(237, 242, 247, 0.9);
+        transition: background-color 0.2s ease;
+    }
+
+    /* BOQ Review Table Styling */
+    .boq-review-table {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        border-radius: 12px;
+        padding: 1.5rem;
+        margin: 1rem 0;
+        border: 2px solid #dee2e6;
+        box-shadow: 0 6px 25px rgba(0,0,0,0.1);
+    }
+
+    .boq-category-header {
+        background: linear-gradient(135deg, #17a2b8 0%, #138496 100%);
+        color: white;
+        padding: 1rem;
+        border-radius: 8px;
+        margin-bottom: 1rem;
+        font-weight: 600;
+        font-size: 1.1rem;
+        box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+    }
+
+    /* Excel-like Table Styling */
+    .excel-table-container {
+        background: white;
+        border: 2px solid #d1d5db;
+        border-radius: 8px;
+        overflow: hidden;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        margin: 1rem 0;
+    }
+
+    .excel-table-container .stDataFrame {
+        border: none;
+        background: white;
+    }
+
+    .excel-table-container .stDataFrame table {
+        border-collapse: collapse;
+        width: 100%;
+        font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+        font-size: 13px;
+    }
+
+    .excel-table-container .stDataFrame th {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        color: #2c3e50;
+        font-weight: 700;
+        padding: 12px 8px;
+        text-align: left;
+        border: 1px solid #dee2e6;
+        border-bottom: 2px solid #adb5bd;
+        font-size: 12px;
+        text-transform: uppercase;
+        letter-spacing: 0.5px;
+    }
+
+    .excel-table-container .stDataFrame td {
+        padding: 10px 8px;
+        border: 1px solid #dee2e6;
+        background: white;
+        font-size: 13px;
+        vertical-align: top;
+    }
+
+    .excel-table-container .stDataFrame tr:nth-child(even) td {
+        background: #f8f9fa;
+    }
+
+    .excel-table-container .stDataFrame tr:hover td {
+        background: #e3f2fd;
+        transition: background-color 0.2s ease;
+    }
+
+    /* Status-specific row coloring */
+    .excel-table-container .stDataFrame tr[data-status="approved"] td {
+        background: #d4edda !important;
+        border-left: 4px solid #28a745;
+    }
+
+    .excel-table-container .stDataFrame tr[data-status="pending"] td {
+        background: #fff3cd !important;
+        border-left: 4px solid #ffc107;
+    }
+
+    .excel-table-container .stDataFrame tr[data-status="under_review"] td {
+        background: #d1ecf1 !important;
+        border-left: 4px solid #17a2b8;
+    }
+
+    .excel-table-container .stDataFrame tr[data-status="rejected"] td {
+        background: #f8d7da !important;
+        border-left: 4px solid #dc3545;
+    }
+
+    /* Excel-like cell formatting */
+    .excel-table-container .stDataFrame td[data-type="currency"] {
+        text-align: right;
+        font-weight: 600;
+        color: #2e7d32;
+    }
+
+    .excel-table-container .stDataFrame td[data-type="number"] {
+        text-align: right;
+    }
+
+    .excel-table-container .stDataFrame td[data-type="status"] {
+        text-align: center;
+        font-weight: 600;
+        text-transform: uppercase;
+        font-size: 11px;
+        letter-spacing: 0.5px;
+    }
+
+    /* Metric cards enhancement */
+    .metric-card {
+        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        border-left: 4px solid var(--primary-color);
+        border: 1px solid #dee2e6;
+        transition: transform 0.2s ease;
+        min-height: 120px;
+    }
+
+    /* Dynamic metric card styling based on content */
+    .metric-card.has-data {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        border: 2px solid #dee2e6;
+        box-shadow: 0 6px 25px rgba(0,0,0,0.15);
+    }
+
+    .metric-card.no-data {
+        background: linear-gradient(135deg, #ffffff 0%, #f8f9fa 100%);
+        border: 1px solid #e9ecef;
+        box-shadow: 0 2px 8px rgba(0,0,0,0.05);
+        min-height: 80px;
+        padding: 1rem;
+    }
+
+    /* Info boxes */
+    .info-box {
+        background: linear-gradient(135deg, #e3f2fd 0%, #bbdefb 100%);
+        padding: 1rem;
+        border-radius: 8px;
+        border-left: 4px solid var(--info-color);
+        margin: 1rem 0;
+        border: 1px solid #90caf9;
+    }
+
+    /* Alerts */
+    .alert {
+        padding: 1rem 1.5rem;
+        border-radius: 8px;
+        margin: 1rem 0;
+        border-left: 4px solid;
+    }
+
+    .alert-success {
+        background-color: #d4edda;
+        border-color: var(--success-color);
+        color: #155724;
+    }
+
+    .alert-warning {
+        background-color: #fff3cd;
+        border-color: var(--warning-color);
+        color: #856404;
+    }
+
+    .alert-info {
+        background-color: #d1ecf1;
+        border-color: var(--info-color);
+        color: #0c5460;
+    }
+
+    /* Charts */
+    .chart-container {
+        background: linear-gradient(135deg, #f8f9fa 0%, #e9ecef 100%);
+        padding: 1.5rem;
+        border-radius: 12px;
+        box-shadow: 0 4px 20px rgba(0,0,0,0.1);
+        margin-bottom: 2rem;
+        border: 1px solid #dee2e6;
+    }
+
+    /* Navigation */
+    .nav-item {
+        padding: 0.75rem 1rem;
+        margin: 0.25rem 0;
+        border-radius: 8px;
+        transition: all 0.2s ease;
+        cursor: pointer;
+    }
+
+    .nav-item:hover {
+        background-color: rgba(31, 119, 180, 0.1);
+    }
+
+    /* Responsive Design */
+    @media (max-width: 768px) {
+        .main-header h1 {
+            font-size: 2rem;
+        }
+        .metric-value {
+            font-size: 1.5rem;
+        }
+    }
+    </style>
+"""
@@ -0,0 +1,96 @@
+"""Project submission: the project row, its BOQ rows and the admin notification"""
+import random
+import string
+from datetime import datetime
+
+# Generate tracking ID
+def generate_tracking_id():
+    prefix = "PRJ"
+    timestamp = datetime.now().strftime("%y%m%d")
+    random_suffix = ''.join(random.choices(string.ascii_uppercase + string.digits, k=4))
+    return f"{prefix}{timestamp}{random_suffix}"
+
+def insert_project(conn, project_data, materials):
+    """Insert the project row and return (project id, tracking id)"""
+    tracking_id = generate_tracking_id()
+
+    # Calculate cumulative costs from materials
+    material_cost = sum(item.get("Amount INR", 0) for item in materials)
+
+    # Set default values for simplified form
+    estimated_budget = material_cost  # Auto-calculated from materials
+    manpower_count = 0
+    manpower_cost = 0
+    equipment_cost = 0
+    other_costs = 0
+    total_cost = material_cost
+
+    # Safely get optional fields
+    risk_assessment = project_data.get('risk_assessment', '')
+    expected_outcome = project_data.get('expected_outcome', '')
+
+    # RETURNING works on SQLite (3.35+) and PostgreSQL alike, unlike cursor.lastrowid
+    cursor = conn.execute('''
+        INSERT INTO projects (
+            tracking_id, project_name, project_description, domain, priority,
+            estimated_budget, manpower_count, manpower_cost, material_cost,
+            equipment_cost, other_costs, total_cost, start_date, end_date,
+            department, contact_email, contact_phone, justification,
+            risk_assessment, expected_outcome, submitted_by
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        RETURNING id
+    ''', (
+        tracking_id, project_data['project_name'], project_data['project_description'],
+        project_data['domain'], project_data['priority'], estimated_budget,
+        manpower_count, manpower_cost, material_cost,
+        equipment_cost, other_costs, total_cost,
+        project_data['start_date'], project_data['end_date'], project_data['department'],
+        project_data['contact_email'], project_data['contact_phone'], project_data['justification'],
+        risk_assessment, expected_outcome, project_data['submitted_by']
+    ))
+    return cursor.fetchone()[0], tracking_id
+
+def insert_materials(conn, project_id, materials):
+    """Insert BOQ entries (as built on the Submit Project page) with one executemany"""
+    conn.executemany('''
+        INSERT INTO project_materials (
+            project_id, category, subtopic, description, units_qty, nos, source_type, payment_schedule, unit_price, amount_inr,
+            justification, justification_type, justification_file_path, status, finalized
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''', [(
+        project_id,
+        entry['Category'],
+        entry['Sub-topic'],
+        entry['Description'],
+        entry['Units/Qty'],
+        entry['Nos'],
+        entry['Source/Type'],
+        entry['Payment Schedule'],
+        entry['Unit Price Total Amount'],
+        entry['Amount INR'],
+        entry.get('Justification', ''),
+        entry.get('Justification Type', ''),
+        entry.get('Justification File Path', ''),
+        'pending',
+        0
+    ) for entry in materials])
+
+def insert_notification(conn, project_id, notification_type, title, message):
+    conn.execute('''
+        INSERT INTO notifications (project_id, notification_type, title, message)
+        VALUES (?, ?, ?, ?)
+    ''', (project_id, notification_type, title, message))
+
+def submit_project(db, project_data, materials):
+    """Write the project, its BOQ rows and the admin notification in one transaction.
+
+    Returns (project id, tracking id). On any error nothing is written, so a
+    project can never exist without its materials.
+    """
+    with db.transaction() as conn:
+        project_id, tracking_id = insert_project(conn, project_data, materials)
+        insert_materials(conn, project_id, materials)
+        insert_notification(
+            conn, project_id, "project_submitted", f"Project Submitted: {tracking_id}",
+            f"Project '{project_data['project_name']}' submitted with {len(materials)} BOQ rows.")
+    return project_id, tracking_id
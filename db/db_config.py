@@ -1,2 +1,24 @@
-# SQLite configuration
-DB_URL = "sqlite:///budget.db"
+import os
+
+# PostgreSQL when DATABASE_URL is set (see docker-compose.yml), otherwise the local SQLite file
+DB_URL = os.environ.get('DATABASE_URL', 'sqlite:///budget.db')
+
+# Connection pool (db/engine.py)
+DB_POOL_SIZE = int(os.environ.get('DB_POOL_SIZE', '5'))
+DB_MAX_OVERFLOW = int(os.environ.get('DB_MAX_OVERFLOW', '10'))
+DB_POOL_TIMEOUT = int(os.environ.get('DB_POOL_TIMEOUT', '30'))
+# Seconds before a pooled connection is replaced; keeps ahead of server/firewall idle timeouts
+DB_POOL_RECYCLE = int(os.environ.get('DB_POOL_RECYCLE', '1800'))
+DB_POOL_PRE_PING = os.environ.get('DB_POOL_PRE_PING', '1') != '0'
+
+# SQLite pragmas applied to every new connection
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_SYNCHRONOUS = os.environ.get('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_CACHE_MB = int(os.environ.get('SQLITE_CACHE_MB', '64'))
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', '5000'))
+
+# Streamlit app database (dashboard/connection.py): the local SQLite file unless a
+# postgresql:// URL is given, which lets several app replicas share one database
+DASHBOARD_DB_URL = os.environ.get('DASHBOARD_DATABASE_URL', 'sqlite:///project_management.db')
+# Rows per round trip when reading through a PostgreSQL server-side cursor
+DASHBOARD_FETCH_SIZE = int(os.environ.get('DASHBOARD_FETCH_SIZE', '5000'))
@@ -1,41 +1,209 @@
-from sqlalchemy import create_engine, text
+import io
+import numpy as np
+from sqlalchemy import inspect, text
 import pandas as pd
-from db.db_config import DB_URL
+from db.engine import get_engine
 
-engine = create_engine(DB_URL, echo=False)
+engine = get_engine()
+
+BUDGET_COLUMNS = ['project_id', 'sl_no', 'description', 'responsible_agency', 'qty', 'duration_text',
+                  'weight_kg', 'total_weight_kg', 'unit_rate_inr', 'total_budget', 'computed_total',
+                  'needs_review', 'raw_file', 'created_at', 'row_hash']
+TEXT_COLUMNS = ['description', 'responsible_agency', 'duration_text']
+FLOAT_COLUMNS = ['qty', 'weight_kg', 'total_weight_kg', 'unit_rate_inr', 'total_budget', 'computed_total']
+# Columns that define a row's content; raw_file and created_at change on every load
+HASH_COLUMNS = ['sl_no'] + TEXT_COLUMNS + FLOAT_COLUMNS + ['needs_review']
+
+# Rows per executemany / COPY batch, so the Python tuples never cover the whole frame
+WRITE_BATCH_SIZE = 50000
 
 def read_budget_items():
     with engine.begin() as conn:
         return pd.read_sql('SELECT * FROM budget_items ORDER BY sl_no', conn)
 
+def _format_timestamps(series):
+    # Loads stamp every row with the same created_at, so format each distinct value once
+    codes, uniques = pd.factorize(pd.to_datetime(series))
+    if len(uniques) == 0:
+        return pd.Series(None, index=series.index, dtype=object)
+    values = np.asarray(pd.Index(uniques).strftime('%Y-%m-%d %H:%M:%S'), dtype=object)[codes]
+    values[codes < 0] = None
+    return pd.Series(values, index=series.index, dtype=object)
+
+def budget_frame(df, raw_file):
+    """Cast a transformed frame to the budget_items layout, one whole column at a time"""
+    out = pd.DataFrame(index=df.index)
+    out['project_id'] = 1
+    out['sl_no'] = pd.to_numeric(df['sl_no'], errors='coerce').astype('Int64')
+    for col in TEXT_COLUMNS:
+        out[col] = df[col].astype('string')
+    for col in FLOAT_COLUMNS:
+        out[col] = pd.to_numeric(df[col], errors='coerce').astype('float64')
+    out['needs_review'] = df['needs_review'].fillna(False).astype(bool)
+    out['raw_file'] = raw_file
+    if 'created_at' in df.columns:
+        out['created_at'] = _format_timestamps(df['created_at'])
+    else:
+        out['created_at'] = None
+    # Stored as a signed 64-bit integer so it fits SQLite INTEGER and PostgreSQL BIGINT
+    out['row_hash'] = pd.util.hash_pandas_object(out[HASH_COLUMNS], index=False).to_numpy().view('int64')
+    return out[BUDGET_COLUMNS]
+
+def ensure_budget_schema(conn):
+    """Add the row_hash column and (project_id, sl_no) index to older budget_items tables"""
+    existing_cols = {c['name'] for c in inspect(conn).get_columns('budget_items')}
+    if 'row_hash' not in existing_cols:
+        conn.execute(text("ALTER TABLE budget_items ADD COLUMN row_hash BIGINT"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_budget_items_project_sl ON budget_items (project_id, sl_no)"))
+
+def _iter_batches(frame, batch_size):
+    for start in range(0, len(frame), batch_size):
+        yield frame.iloc[start:start + batch_size]
+
+def _copy_budget_frame(conn, frame, batch_size):
+    # PostgreSQL: stream CSV batches through the driver's COPY FROM STDIN
+    copy_sql = f"COPY budget_items ({', '.join(BUDGET_COLUMNS)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        for batch in _iter_batches(frame, batch_size):
+            buf = io.StringIO()
+            batch.to_csv(buf, header=False, index=False, na_rep='\\N')
+            buf.seek(0)
+            cursor.copy_expert(copy_sql, buf)
+    finally:
+        cursor.close()
+
+def _executemany(conn, sql, frame, columns, batch_size=WRITE_BATCH_SIZE):
+    # sql is written with ? placeholders; swap them for drivers using format style
+    if conn.dialect.paramstyle != 'qmark':
+        sql = sql.replace('?', '%s')
+    # NA becomes None for the whole column at once instead of a pd.notna per field
+    arrays = [frame[col].to_numpy(dtype=object, na_value=None) for col in columns]
+    for start in range(0, len(frame), batch_size):
+        rows = list(zip(*(a[start:start + batch_size] for a in arrays)))
+        conn.exec_driver_sql(sql, rows)
+
+def _executemany_budget_frame(conn, frame, batch_size):
+    insert_sql = (f"INSERT INTO budget_items ({', '.join(BUDGET_COLUMNS)}) "
+                  f"VALUES ({', '.join('?' * len(BUDGET_COLUMNS))})")
+    _executemany(conn, insert_sql, frame, BUDGET_COLUMNS, batch_size)
+
+def insert_budget_frame(conn, frame, batch_size=WRITE_BATCH_SIZE):
+    """Append a frame already cast by budget_frame() inside the caller's transaction"""
+    if frame.empty:
+        return 0
+    if conn.dialect.name == 'postgresql' and conn.dialect.driver == 'psycopg2':
+        _copy_budget_frame(conn, frame, batch_size)
+    else:
+        _executemany_budget_frame(conn, frame, batch_size)
+    return len(frame)
+
+def write_budget_frame(conn, df, raw_file, batch_size=WRITE_BATCH_SIZE):
+    """Append a transformed frame to budget_items inside the caller's transaction"""
+    return insert_budget_frame(conn, budget_frame(df, raw_file), batch_size)
+
 def replace_budget_items(df, raw_file):
     with engine.begin() as conn:
+        ensure_budget_schema(conn)
+        conn.execute(text("DELETE FROM budget_items WHERE project_id=1"))
+        return write_budget_frame(conn, df, raw_file)
+
+def replace_budget_items_chunked(chunks, raw_file):
+    """Replace budget_items from an iterable of transformed DataFrames.
+
+    All chunks are written in one transaction, so readers see either the old
+    load or the complete new one, while only one chunk is held in memory.
+    """
+    count = 0
+    with engine.begin() as conn:
+        ensure_budget_schema(conn)
         conn.execute(text("DELETE FROM budget_items WHERE project_id=1"))
-        insert_stmt = text("""INSERT INTO budget_items
-        (project_id, sl_no, description, responsible_agency, qty, duration_text,
-        weight_kg, total_weight_kg, unit_rate_inr, total_budget, computed_total, needs_review, raw_file, created_at)
-        VALUES
-        (:project_id, :sl_no, :description, :responsible_agency, :qty, :duration_text,
-         :weight_kg, :total_weight_kg, :unit_rate_inr, :total_budget, :computed_total, :needs_review, :raw_file, :created_at)
-        """)
-        rows = []
-        for _, r in df.iterrows():
-            # Handle NA values by converting them to None
-            rows.append({
-                'project_id': 1,
-                'sl_no': int(r.sl_no) if pd.notna(r.sl_no) else None,
-                'description': str(r.description) if pd.notna(r.description) else None,
-                'responsible_agency': str(r.responsible_agency) if pd.notna(r.responsible_agency) else None,
-                'qty': float(r.qty) if pd.notna(r.qty) else None,
-                'duration_text': str(r.duration_text) if pd.notna(r.duration_text) else None,
-                'weight_kg': float(r.weight_kg) if pd.notna(r.weight_kg) else None,
-                'total_weight_kg': float(r.total_weight_kg) if pd.notna(r.total_weight_kg) else None,
-                'unit_rate_inr': float(r.unit_rate_inr) if pd.notna(r.unit_rate_inr) else None,
-                'total_budget': float(r.total_budget) if pd.notna(r.total_budget) else None,
-                'computed_total': float(r.computed_total) if pd.notna(r.computed_total) else None,
-                'needs_review': bool(r.needs_review),
-                'raw_file': raw_file,
-                'created_at': r.get('created_at').strftime('%Y-%m-%d %H:%M:%S') if pd.notna(r.get('created_at')) else None
-            })
-        conn.execute(insert_stmt, rows)
-        return len(rows)
+        for chunk in chunks:
+            count += write_budget_frame(conn, chunk, raw_file)
+    return count
+
+def replace_budget_items_many(frames):
+    """Replace budget_items with several files' budget_frame() output, in order.
+
+    Everything is written in one transaction by the calling process. The old
+    rows are only deleted once the first frame arrives, so a batch where every
+    file failed upstream leaves the table untouched.
+    """
+    count = 0
+    with engine.begin() as conn:
+        ensure_budget_schema(conn)
+        deleted = False
+        for frame in frames:
+            if not deleted:
+                conn.execute(text("DELETE FROM budget_items WHERE project_id=1"))
+                deleted = True
+            count += insert_budget_frame(conn, frame)
+    return count
+
+def _existing_budget_keys(conn):
+    """Return (keyed, unkeyed) frames of id/sl_no/existing_hash for project 1"""
+    # Plain driver cursors and one int64 array: this read is most of an incremental
+    # load's cost, and COALESCE keeps row_hash integral so no bits are lost to floats
+    result = conn.exec_driver_sql(
+        "SELECT id, sl_no, COALESCE(row_hash, 0) FROM budget_items "
+        "WHERE project_id=1 AND sl_no IS NOT NULL ORDER BY id"
+    )
+    keys = np.array(result.cursor.fetchall(), dtype='int64').reshape(-1, 3)
+    keyed = pd.DataFrame(keys, columns=['id', 'sl_no', 'existing_hash'])
+    unkeyed = conn.execute(text("SELECT id FROM budget_items WHERE project_id=1 AND sl_no IS NULL")).fetchall()
+    return keyed, pd.DataFrame(unkeyed, columns=['id'], dtype='int64')
+
+def upsert_budget_items_chunked(chunks, raw_file):
+    """Apply a load incrementally, keyed on (project_id, sl_no).
+
+    Only rows whose content hash changed are updated, new sl_no values are
+    inserted and sl_no values missing from the file are deleted. Rows without
+    an sl_no cannot be matched, so they are replaced on every load. Returns a
+    dict with inserted/updated/deleted/unchanged counts.
+    """
+    counts = {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    update_cols = [c for c in BUDGET_COLUMNS if c not in ('project_id', 'sl_no')]
+    update_sql = f"UPDATE budget_items SET {', '.join(c + ' = ?' for c in update_cols)} WHERE id = ?"
+    delete_sql = "DELETE FROM budget_items WHERE id = ?"
+
+    with engine.begin() as conn:
+        ensure_budget_schema(conn)
+        keyed, unkeyed = _existing_budget_keys(conn)
+        # Earlier full loads may have stored the same sl_no twice; keep the first
+        extra = keyed[keyed['sl_no'].duplicated()]
+        stale = pd.concat([extra[['id']], unkeyed])
+        if not stale.empty:
+            _executemany(conn, delete_sql, stale, ['id'])
+            counts['deleted'] += len(stale)
+        existing = keyed.drop_duplicates('sl_no').set_index('sl_no')
+
+        seen = set()
+        for chunk in chunks:
+            frame = budget_frame(chunk, raw_file)
+            has_key = frame['sl_no'].notna()
+            counts['inserted'] += insert_budget_frame(conn, frame[~has_key])
+
+            frame = frame[has_key]
+            sl_no = frame['sl_no'].astype('int64')
+            if sl_no.duplicated().any() or sl_no.isin(seen).any():
+                raise ValueError('SL.NO values repeat within the file; use a full load instead of --incremental')
+            seen.update(sl_no)
+
+            matched = frame.assign(_key=sl_no).join(existing, on='_key')
+            is_new = matched['id'].isna()
+            changed = ~is_new & (matched['existing_hash'] != matched['row_hash'])
+            counts['inserted'] += insert_budget_frame(conn, frame[is_new])
+            if changed.any():
+                updates = matched[changed].astype({'id': 'int64'})
+                _executemany(conn, update_sql, updates, update_cols + ['id'])
+            counts['updated'] += int(changed.sum())
+            counts['unchanged'] += int((~is_new & ~changed).sum())
+
+        gone = existing[~existing.index.isin(list(seen))]
+        if not gone.empty:
+            _executemany(conn, delete_sql, gone, ['id'])
+            counts['deleted'] += len(gone)
+    return counts
+
+def upsert_budget_items(df, raw_file):
+    return upsert_budget_items_chunked([df], raw_file)
@@ -0,0 +1,54 @@
+"""Engine factory: pooled connections, SQLite pragmas and fork safety"""
+import os
+import weakref
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+
+from db import db_config
+
+# Every engine made here, so a forked child can drop the parent's pooled connections
+_engines = weakref.WeakSet()
+_default_engine = None
+
+def _sqlite_pragmas(dbapi_conn, _record):
+    cursor = dbapi_conn.cursor()
+    cursor.execute(f'PRAGMA journal_mode={db_config.SQLITE_JOURNAL_MODE}')
+    cursor.execute(f'PRAGMA synchronous={db_config.SQLITE_SYNCHRONOUS}')
+    # Negative cache_size is in KiB rather than pages
+    cursor.execute(f'PRAGMA cache_size=-{db_config.SQLITE_CACHE_MB * 1024}')
+    cursor.execute(f'PRAGMA busy_timeout={db_config.SQLITE_BUSY_TIMEOUT_MS}')
+    cursor.close()
+
+def make_engine(url=None, echo=False, **overrides):
+    """create_engine() for url (default DATABASE_URL / db_config.DB_URL) with the configured pool.
+
+    Keyword overrides are passed straight to create_engine, e.g. pool_size=1.
+    """
+    url = make_url(url or db_config.DB_URL)
+    options = {'echo': echo, 'pool_pre_ping': db_config.DB_POOL_PRE_PING}
+    in_memory = url.get_backend_name() == 'sqlite' and url.database in (None, '', ':memory:')
+    if not in_memory:
+        # In-memory SQLite gets a single shared connection from SQLAlchemy; pool sizing does not apply
+        options.update(pool_size=db_config.DB_POOL_SIZE, max_overflow=db_config.DB_MAX_OVERFLOW,
+                       pool_timeout=db_config.DB_POOL_TIMEOUT, pool_recycle=db_config.DB_POOL_RECYCLE)
+    options.update(overrides)
+    engine = create_engine(url, **options)
+    if url.get_backend_name() == 'sqlite' and not in_memory:
+        event.listen(engine, 'connect', _sqlite_pragmas)
+    _engines.add(engine)
+    return engine
+
+def get_engine():
+    """The process-wide engine for db_config.DB_URL, created on first use"""
+    global _default_engine
+    if _default_engine is None:
+        _default_engine = make_engine()
+    return _default_engine
+
+def _after_fork_in_child():
+    # close=False leaves the parent's sockets alone; the child just starts a fresh pool
+    for engine in list(_engines):
+        engine.dispose(close=False)
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -0,0 +1,4 @@
+-- Run once by the postgres image on an empty data volume (docker-compose.yml).
+-- The Streamlit app gets its own database: its projects table (dashboard/pg_migrations.py)
+-- is not the ETL's projects table in schema.sql.
+CREATE DATABASE dashboard_db;
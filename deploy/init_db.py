@@ -6,12 +6,13 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from sqlalchemy import create_engine, MetaData, Table, Column, Integer, String, Float, Boolean, DateTime
-from db.db_config import DB_URL
+from sqlalchemy import MetaData, Table, Column, Index, Integer, BigInteger, String, Float, Boolean, DateTime
+from db.engine import make_engine
 import datetime
 
-def init_db():
-    engine = create_engine(DB_URL, echo=True)
+def init_db(engine=None):
+    if engine is None:
+        engine = make_engine(echo=True)
     metadata = MetaData()
 
     # Define the budget_items table
@@ -30,8 +31,10 @@ def init_db():
         Column('computed_total', Float),
         Column('needs_review', Boolean),
         Column('raw_file', String),
-        Column('created_at', DateTime, default=datetime.datetime.utcnow)
+        Column('created_at', DateTime, default=datetime.datetime.utcnow),
+        Column('row_hash', BigInteger)
     )
+    Index('ix_budget_items_project_sl', budget_items.c.project_id, budget_items.c.sl_no)
 
     # Create all tables
     metadata.create_all(engine)
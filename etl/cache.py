@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from etl.preprocess import parse_file, TRANSFORM_VERSION
+from etl.metrics import RunMetrics, parse_and_transform
+
+project_root = Path(__file__).parent.parent
+
+CACHE_DIR = Path(os.environ.get('ETL_CACHE_DIR', project_root / 'data' / 'processed' / 'cache'))
+# Least recently used entries are evicted once the cache grows past this size
+CACHE_MAX_BYTES = int(os.environ.get('ETL_CACHE_MAX_MB', '512')) * 1024 * 1024
+# Temp files older than this are left over from a writer that died mid-write
+STALE_TMP_SECONDS = 3600
+
+def file_digest(path, block_size=1024 * 1024):
+    h = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(block_size), b''):
+            h.update(block)
+    return h.hexdigest()
+
+def _entry_path(digest, kind):
+    return CACHE_DIR / f'{digest}-{kind}-v{TRANSFORM_VERSION}.parquet'
+
+def _stat(path):
+    try:
+        return path.stat()
+    except FileNotFoundError:
+        # Replaced or evicted by another process since the glob
+        return None
+
+def evict(max_bytes=CACHE_MAX_BYTES, stale_tmp_seconds=STALE_TMP_SECONDS):
+    """Delete stale temp files, then least recently used entries until the cache fits in max_bytes"""
+    if not CACHE_DIR.exists():
+        return
+    now = time.time()
+    for p in CACHE_DIR.glob('*.tmp'):
+        st = _stat(p)
+        if st is not None and now - st.st_mtime > stale_tmp_seconds:
+            p.unlink(missing_ok=True)
+    entries = []
+    for p in CACHE_DIR.glob('*.parquet'):
+        st = _stat(p)
+        if st is not None:
+            entries.append((st.st_mtime, st.st_size, p))
+    total = sum(size for _, size, _ in entries)
+    for _, size, p in sorted(entries):
+        if total <= max_bytes:
+            break
+        p.unlink(missing_ok=True)
+        total -= size
+
+def _parquet_safe(df):
+    # Excel columns often mix numbers with text such as '#REF!', which parquet can't
+    # store; keep them as strings, which is how transform() reads them anyway
+    mixed = [c for c in df.columns
+             if df[c].dtype == object and pd.api.types.infer_dtype(df[c], skipna=True).startswith('mixed')]
+    if not mixed:
+        return df
+    return df.astype({c: 'string' for c in mixed})
+
+def _cached(path, kind, build, metrics=None):
+    if metrics is None:
+        metrics = RunMetrics(path)
+    entry = _entry_path(file_digest(path), kind)
+    if entry.exists():
+        try:
+            with metrics.stage('cache_read'):
+                df = pd.read_parquet(entry)
+                metrics.count('cache_read', len(df), entry.stat().st_size)
+            os.utime(entry)  # mark as recently used for eviction
+            return df
+        except Exception:
+            entry.unlink(missing_ok=True)
+
+    df = _parquet_safe(build())
+    tmp = None
+    try:
+        with metrics.stage('cache_write'):
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # A temp file of its own: batch workers and the watcher can build the same entry at once
+            with tempfile.NamedTemporaryFile(dir=CACHE_DIR, prefix=entry.stem + '.', suffix='.tmp',
+                                             delete=False) as f:
+                tmp = Path(f.name)
+                df.to_parquet(f, index=False)
+            os.replace(tmp, entry)
+            evict()
+    except Exception as e:
+        # A failed write only costs the cache entry, never the load itself
+        print(f'ETL cache: not caching {os.path.basename(path)} ({type(e).__name__})')
+        if tmp is not None:
+            tmp.unlink(missing_ok=True)
+    return df
+
+def load_parsed(path):
+    """parse_file(path) with every column kept, from the cache when the file is unchanged"""
+    return _cached(path, 'parsed', lambda: parse_file(path, prune=False))
+
+def load_transformed(path, metrics=None):
+    """transform(parse_file(path)) from the cache when the file content is unchanged.
+
+    The raw file's missing required columns are kept in df.attrs['missing_columns'].
+    Stage timings are recorded on metrics (an etl.metrics.RunMetrics) when given.
+    """
+    def build():
+        df, missing, df_t = parse_and_transform(path, metrics)
+        df_t = df_t.reset_index(drop=True)
+        df_t.attrs['missing_columns'] = missing
+        return df_t
+    return _cached(path, 'transformed', build, metrics)
@@ -1,64 +1,239 @@
 import argparse, os
 import sys
 import os
+import glob
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from etl.preprocess import parse_file, transform
+from etl.preprocess import parse_file, iter_chunks, transform
 from etl.validator import validate_columns
-from etl.summarizer_llm import summarize_change
-import pandas as pd
-from db.db_operations import replace_budget_items
+from etl.summarizer_llm import summarize_change, ChangeSummary
+from etl.cache import load_transformed
+from etl.metrics import RunMetrics, frame_bytes, parse_and_transform, profile_run
+from db.db_operations import (budget_frame, replace_budget_items, replace_budget_items_chunked,
+                              replace_budget_items_many, upsert_budget_items, upsert_budget_items_chunked)
+from sqlalchemy.exc import SQLAlchemyError
+import db.db_operations as db_operations
+from db.engine import make_engine
 from datetime import datetime, timezone  # Modified import
 
+INPUT_EXTENSIONS = ('.csv', '.xlsx', '.xlsm', '.xls')
+
 def main():
     parser = argparse.ArgumentParser()
-    parser.add_argument('path', help='path to csv or excel file')
-    parser.add_argument('--db', default=None, help='DB URL (optional)')
+    parser.add_argument('path', help='path to a csv or excel file, a directory of them, or a glob')
+    parser.add_argument('--db', default=None, help='DB URL (optional, overrides DATABASE_URL)')
+    parser.add_argument('--chunk-size', type=int, default=None,
+                        help='stream the file in chunks of this many rows to bound memory')
+    parser.add_argument('--incremental', action='store_true',
+                        help='only insert, update or delete rows that changed, keyed on SL.NO')
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help='processes used to parse and transform files when loading several')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-parse instead of reusing data/processed/cache for unchanged files')
+    parser.add_argument('--profile', action='store_true',
+                        help='write a cProfile/tracemalloc report for this run to logs/ (main process only)')
     args = parser.parse_args()
+    if args.db:
+        db_operations.engine = make_engine(args.db)
+
+    if args.profile:
+        with profile_run():
+            run(args)
+    else:
+        run(args)
+
+def run(args):
+    """Load args.path and append the run's stage timings to logs/etl_metrics_*.jsonl"""
+    use_cache = not args.no_cache
 
     path = args.path
+    if os.path.isdir(path) or glob.has_magic(path):
+        paths = resolve_inputs(path)
+        if not paths:
+            raise SystemExit('No csv or excel files match: ' + path)
+        if args.incremental or args.chunk_size:
+            raise SystemExit('--incremental and --chunk-size take a single file')
+        if args.workers < 1:
+            raise SystemExit('--workers must be at least 1')
+        metrics = RunMetrics(path, mode='batch')
+        code = run_batch(paths, args.workers, use_cache, metrics)
+        metrics.write('ok' if code == 0 else 'partial')
+        raise SystemExit(code)
+
     if not os.path.exists(path):
         raise SystemExit('File not found: ' + path)
 
-    df = parse_file(path)
-    missing = validate_columns(df)
+    if args.chunk_size and args.chunk_size < 1:
+        raise SystemExit('--chunk-size must be a positive number of rows')
+
+    metrics = RunMetrics(path, mode='chunked' if args.chunk_size else 'file')
+    try:
+        if args.chunk_size:
+            run_streaming(path, args.chunk_size, args.incremental, metrics)
+        else:
+            run_file(path, use_cache, args.incremental, metrics)
+    except BaseException:
+        metrics.write('failed')
+        raise
+    metrics.write()
+
+def run_file(path, use_cache, incremental, metrics):
+    missing, df_t = load_file(path, use_cache, metrics)
     if missing:
         print('Missing columns:', missing)
+    print_coerced(df_t.attrs.get('coerced_values', {}))
 
-    df_t = transform(df)
     df_t['created_at'] = datetime.now(timezone.utc)  # Modified line
 
     # Persist
-    count = replace_budget_items(df_t, os.path.basename(path))
-    print(f'Persisted {count} rows.')
+    with metrics.stage('persist', len(df_t)):
+        if incremental:
+            report_incremental(upsert_budget_items, df_t, os.path.basename(path))
+        else:
+            count = replace_budget_items(df_t, os.path.basename(path))
+            print(f'Persisted {count} rows.')
 
     # Summarize & notify
-    summary = summarize_change(df_t)
+    with metrics.stage('summarize', len(df_t)):
+        summary = summarize_change(df_t)
     print(summary)
 
-def process_file(file_path):
-    """Process uploaded file and load into database"""
-    # Read file based on extension
-    if file_path.endswith('.csv'):
-        df = pd.read_csv(file_path)
+def print_coerced(coerced):
+    coerced = {col: n for col, n in coerced.items() if n}
+    if coerced:
+        print('Values that were not numbers, loaded as NA:', coerced)
+
+def report_incremental(upsert, data, raw_file):
+    try:
+        counts = upsert(data, raw_file)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    print('Inserted {inserted}, updated {updated}, deleted {deleted}, unchanged {unchanged} rows.'.format(**counts))
+
+def run_streaming(path, chunk_size, incremental=False, metrics=None):
+    """Parse, transform and persist the file chunk by chunk in one load"""
+    if metrics is None:
+        metrics = RunMetrics(path, mode='chunked')
+    loaded_at = datetime.now(timezone.utc)
+    summary = ChangeSummary()
+    coerced = {}
+
+    def transformed_chunks():
+        metrics.count('parse', bytes=os.path.getsize(path))
+        for i, chunk in enumerate(metrics.timed_iter('parse', iter_chunks(path, chunk_size))):
+            if i == 0:
+                with metrics.stage('validate'):
+                    missing = validate_columns(chunk)
+                if missing:
+                    print('Missing columns:', missing)
+            with metrics.stage('transform', len(chunk)):
+                chunk_t = transform(chunk)
+            metrics.count('transform', bytes=frame_bytes(chunk_t))
+            for col, n in chunk_t.attrs['coerced_values'].items():
+                coerced[col] = coerced.get(col, 0) + n
+            chunk_t['created_at'] = loaded_at
+            with metrics.stage('summarize', len(chunk_t)):
+                summary.update(chunk_t)
+            yield chunk_t
+
+    # Parsing and transforming run inside the writer as it pulls chunks; their time is
+    # recorded under their own stages and excluded from 'persist'
+    with metrics.stage('persist'):
+        if incremental:
+            report_incremental(upsert_budget_items_chunked, transformed_chunks(), os.path.basename(path))
+        else:
+            count = replace_budget_items_chunked(transformed_chunks(), os.path.basename(path))
+            print(f'Persisted {count} rows.')
+    metrics.count('persist', summary.items)
+    print_coerced(coerced)
+    print(summary.render())
+
+def resolve_inputs(path):
+    """Expand a directory or glob into the sorted list of csv/excel files it names"""
+    if os.path.isdir(path):
+        candidates = [os.path.join(path, name) for name in os.listdir(path)]
     else:
-        df = pd.read_excel(file_path)
-    
-    # Basic data cleaning
-    df = df.fillna('')
-    
-    # Add metadata
-    df['created_at'] = datetime.datetime.now()
-    df['needs_review'] = False
-    
-    # Load into database
-    replace_budget_items(df, os.path.basename(file_path))
-    
-    return True
+        candidates = glob.glob(path)
+    return sorted(p for p in candidates if os.path.isfile(p) and p.lower().endswith(INPUT_EXTENSIONS))
+
+def load_file(path, use_cache=True, metrics=None):
+    """Return (missing required columns, transformed frame) for one file"""
+    if use_cache:
+        df_t = load_transformed(path, metrics)
+        return df_t.attrs.get('missing_columns', []), df_t
+    _, missing, df_t = parse_and_transform(path, metrics)
+    return missing, df_t
+
+def prepare_file(path, loaded_at, use_cache=True):
+    """Parse, validate, transform and cast one file; runs in a worker process.
+
+    Returns (missing columns, coerced value count, budget frame, stage metrics).
+    """
+    metrics = RunMetrics(path)
+    missing, df_t = load_file(path, use_cache, metrics)
+    coerced = sum(df_t.attrs.get('coerced_values', {}).values())
+    df_t['created_at'] = loaded_at
+    with metrics.stage('cast', len(df_t)):
+        frame = budget_frame(df_t, os.path.basename(path))
+    metrics.count('cast', bytes=frame_bytes(frame))
+    return missing, coerced, frame, metrics.stages
+
+def run_batch(paths, workers, use_cache=True, metrics=None):
+    """Prepare files in parallel and write them from this process, in input order.
+
+    Worker stage times are summed into metrics, so for a parallel batch they can
+    exceed the run's wall time. Returns the process exit code: 0 when every file
+    was loaded, 1 otherwise.
+    """
+    if metrics is None:
+        metrics = RunMetrics(paths[0], mode='batch')
+    loaded_at = datetime.now(timezone.utc)
+    summary = ChangeSummary()
+    results = {}
+
+    def prepared_frames():
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths))) as pool:
+            futures = [(p, pool.submit(prepare_file, p, loaded_at, use_cache)) for p in paths]
+            # Consume in submission order so the writer commits files in input order
+            for p, future in futures:
+                try:
+                    # Waiting on workers is its own stage so 'persist' is only the writer's time
+                    with metrics.stage('wait_workers'):
+                        missing, coerced, frame, stages = future.result()
+                except Exception as e:
+                    results[p] = f'FAILED  {type(e).__name__}: {e}'
+                    continue
+                metrics.merge(stages)
+                if missing:
+                    print(f'{os.path.basename(p)}: missing columns {missing}')
+                with metrics.stage('summarize', len(frame)):
+                    summary.update(frame)
+                results[p] = f'OK      {len(frame)} rows, {coerced} values loaded as NA'
+                yield frame
+
+    try:
+        with metrics.stage('persist'):
+            count = replace_budget_items_many(prepared_frames())
+        metrics.count('persist', count)
+    except SQLAlchemyError as e:
+        print(f'Write failed, nothing was committed: {e}')
+        for p in paths:
+            if results.get(p, '').startswith('OK'):
+                results[p] = 'FAILED  not written (batch rolled back)'
+        count = 0
+
+    for p in paths:
+        print(f"{results.get(p, 'FAILED  not processed')}  {p}")
+    failed = sum(1 for p in paths if not results.get(p, '').startswith('OK'))
+    print(f'Persisted {count} rows from {len(paths) - failed} of {len(paths)} files.')
+    if count:
+        print(summary.render())
+    return 1 if failed else 0
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,85 @@
+import pandas as pd
+from openpyxl import load_workbook
+
+from etl.headers import resolve_headers
+
+HEADER_SCAN_ROWS = 50
+
+def _header_score(row):
+    # Number of distinct canonical headers the row resolves to
+    return len(resolve_headers(v for v in row if v is not None))
+
+def _column_names(header_row):
+    names, seen = [], {}
+    for i, v in enumerate(header_row):
+        name = str(v).strip() if v is not None and str(v).strip() else f'Unnamed: {i}'
+        if name in seen:
+            seen[name] += 1
+            name = f'{name}.{seen[name]}'
+        else:
+            seen[name] = 0
+        names.append(name)
+    return names
+
+def detect_header(wb, scan_rows=HEADER_SCAN_ROWS):
+    """Return (sheet name, 1-based header row) of the best-matching table header.
+
+    Every sheet's first scan_rows rows are scored by how many cells resolve to
+    known headers (see etl/headers.py). Falls back to the first non-empty row of the first sheet.
+    """
+    best = (0, None, None)
+    fallback = None
+    for ws in wb.worksheets:
+        for row_idx, row in enumerate(ws.iter_rows(max_row=scan_rows, values_only=True), 1):
+            if fallback is None and any(v is not None for v in row):
+                fallback = (ws.title, row_idx)
+            score = _header_score(row)
+            if score > best[0]:
+                best = (score, ws.title, row_idx)
+    if best[1] is not None:
+        return best[1], best[2]
+    return fallback or (wb.worksheets[0].title, 1)
+
+def iter_excel_chunks(path, chunk_size, sheet=None, prune=True):
+    """Yield DataFrames of at most chunk_size rows from an .xlsx workbook.
+
+    The workbook is opened read-only with cached cell values, so styles and
+    formulas are never loaded and rows are streamed from the file. Known
+    headers are renamed to their canonical names; with prune, other columns
+    are dropped before any frame is built.
+    """
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        if sheet is None:
+            sheet, header_row = detect_header(wb)
+        else:
+            header_row = 1
+        ws = wb[sheet]
+        rows = ws.iter_rows(min_row=header_row, values_only=True)
+        raw_columns = _column_names(next(rows, ()))
+        mapping = resolve_headers(raw_columns)
+        if prune and mapping:
+            keep = [i for i, c in enumerate(raw_columns) if c in mapping]
+        else:
+            keep = list(range(len(raw_columns)))
+        columns = [mapping.get(raw_columns[i], raw_columns[i]) for i in keep]
+        batch, start = [], 0
+        for r in rows:
+            values = tuple(r[i] if i < len(r) else None for i in keep)
+            if not any(v is not None for v in values):
+                continue
+            batch.append(values)
+            if len(batch) == chunk_size:
+                yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+                start += len(batch)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns, index=range(start, start + len(batch)))
+    finally:
+        wb.close()
+
+def read_excel_streaming(path, chunk_size=50000, prune=True):
+    chunks = list(iter_excel_chunks(path, chunk_size, prune=prune))
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
@@ -0,0 +1,37 @@
+import re
+
+# Canonical header (as transform() expects it) -> spellings seen in agency exports.
+# Matching ignores case, spaces and punctuation, so 'SL_NO', 'Sl. No.' and 'SL.NO' are one alias.
+HEADER_ALIASES = {
+    'SL.NO': ['SL.NO', 'S.NO', 'Serial No'],
+    'DESCRIPTION': ['DESCRIPTION', 'Item', 'Item Description'],
+    'Responsible Agency': ['Responsible Agency', 'RESPONSIBLE_AGENCY', 'Agency'],
+    'Qty': ['Qty', 'Quantity', 'Nos'],
+    'Duration': ['Duration', 'Duration Text'],
+    'weight /KG': ['weight /KG', 'WEIGHT_KG', 'Weight'],
+    'Total weight /Kg': ['Total weight /Kg', 'TOTAL_WEIGHT_KG', 'Total Weight'],
+    'unit rate in INR': ['unit rate in INR', 'UNIT_RATE_INR', 'Unit Rate', 'Unit Cost (in Rs)', 'Unit Price total mt'],
+    'Total Budget': ['Total Budget', 'TOTAL_BUDGET', 'Total Cost (in Rs.)', 'Amount INR'],
+}
+
+# Free-text columns; everything else is numeric and left to the cleaning step
+TEXT_HEADERS = ['DESCRIPTION', 'Responsible Agency', 'Duration']
+
+def normalize_header(value):
+    return re.sub(r'[^0-9a-z]', '', str(value).lower())
+
+_ALIAS_LOOKUP = {normalize_header(alias): canonical
+                 for canonical, aliases in HEADER_ALIASES.items()
+                 for alias in aliases}
+
+def resolve_headers(columns):
+    """Map raw header names to canonical ones; the first column wins a canonical name"""
+    mapping, taken = {}, set()
+    for col in columns:
+        if col is None:
+            continue
+        canonical = _ALIAS_LOOKUP.get(normalize_header(col))
+        if canonical is not None and canonical not in taken:
+            mapping[col] = canonical
+            taken.add(canonical)
+    return mapping
@@ -0,0 +1,152 @@
+"""Per-stage timings and row/byte counts for ETL runs, written as JSON lines to logs/"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from etl.preprocess import parse_file, transform
+from etl.validator import validate_columns
+
+project_root = Path(__file__).parent.parent
+
+LOG_DIR = Path(os.environ.get('ETL_LOG_DIR', project_root / 'logs'))
+
+def frame_bytes(df):
+    # Shallow size: cheap enough to take on every chunk, unlike deep=True on text columns
+    return int(df.memory_usage(index=False).sum())
+
+class RunMetrics:
+    """Accumulates time, rows and bytes per stage for one ETL run.
+
+    Stages may nest (e.g. parsing happens inside the writer while it pulls
+    chunks); each stage reports its own time with nested stages subtracted,
+    so the stage seconds add up to the run's wall time.
+    """
+
+    def __init__(self, source, mode='file'):
+        self.run_id = uuid.uuid4().hex[:12]
+        self.source = source
+        self.mode = mode
+        self.started = time.perf_counter()
+        self.stages = {}
+        self._stack = []
+
+    def _entry(self, name):
+        return self.stages.setdefault(name, {'seconds': 0.0, 'calls': 0, 'rows': 0, 'bytes': 0})
+
+    @contextmanager
+    def stage(self, name, rows=0, bytes=0):
+        """Time the block as stage `name`; counts can also be added later with count()"""
+        self._stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            nested = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            entry = self._entry(name)
+            entry['seconds'] += elapsed - nested
+            entry['calls'] += 1
+            self.count(name, rows, bytes)
+
+    def count(self, name, rows=0, bytes=0):
+        entry = self._entry(name)
+        entry['rows'] += int(rows)
+        entry['bytes'] += int(bytes)
+
+    def timed_iter(self, name, iterable):
+        """Yield from iterable, timing each next() as stage `name` and counting frame rows"""
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+                self.count(name, rows=len(item))
+            yield item
+
+    def merge(self, stages):
+        """Fold in stage totals recorded elsewhere, e.g. by a worker process"""
+        for name, values in stages.items():
+            entry = self._entry(name)
+            for key in entry:
+                entry[key] += values[key]
+
+    def records(self, status='ok'):
+        ts = datetime.now(timezone.utc).isoformat(timespec='milliseconds')
+        base = {'ts': ts, 'run_id': self.run_id, 'source': self.source, 'mode': self.mode}
+        lines = [dict(base, stage=name, seconds=round(v['seconds'], 6), calls=v['calls'],
+                      rows=v['rows'], bytes=v['bytes'])
+                 for name, v in self.stages.items()]
+        lines.append(dict(base, stage='total', status=status,
+                          seconds=round(time.perf_counter() - self.started, 6)))
+        return lines
+
+    def write(self, status='ok', log_dir=None):
+        """Append this run's records to logs/etl_metrics_YYYYMMDD.jsonl and return the path"""
+        log_dir = Path(log_dir or LOG_DIR)
+        path = log_dir / f"etl_metrics_{datetime.now().strftime('%Y%m%d')}.jsonl"
+        try:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            with open(path, 'a') as f:
+                for record in self.records(status):
+                    f.write(json.dumps(record) + '\n')
+        except OSError as e:
+            # Metrics must never fail a load that has already been committed
+            print(f'ETL metrics: could not write {path} ({e})')
+            return None
+        return path
+
+def parse_and_transform(path, metrics=None):
+    """Return (parsed, missing columns, transformed) with each step timed on metrics"""
+    if metrics is None:
+        metrics = RunMetrics(path)
+    with metrics.stage('parse', bytes=os.path.getsize(path)):
+        df = parse_file(path)
+    metrics.count('parse', rows=len(df))
+    with metrics.stage('validate'):
+        missing = validate_columns(df)
+    with metrics.stage('transform'):
+        df_t = transform(df)
+    metrics.count('transform', len(df_t), frame_bytes(df_t))
+    return df, missing, df_t
+
+@contextmanager
+def profile_run(log_dir=None, top=40):
+    """cProfile and tracemalloc the block; writes logs/etl_profile_<time>.prof and .txt"""
+    log_dir = Path(log_dir or LOG_DIR)
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        log_dir.mkdir(parents=True, exist_ok=True)
+        prof_path = log_dir / f'etl_profile_{stamp}.prof'
+        profiler.dump_stats(prof_path)
+        out = io.StringIO()
+        out.write(f'Peak traced memory: {peak / 1024 / 1024:.1f} MB (still allocated at end: {current / 1024 / 1024:.1f} MB)\n\n')
+        out.write(f'Top {top} functions by cumulative time:\n')
+        pstats.Stats(profiler, stream=out).sort_stats('cumulative').print_stats(top)
+        out.write(f'Top {top} allocation sites still held at end of run:\n')
+        for stat in snapshot.statistics('lineno')[:top]:
+            out.write(f'  {stat}\n')
+        report_path = log_dir / f'etl_profile_{stamp}.txt'
+        report_path.write_text(out.getvalue())
+        print(f'Profile written to {report_path} (open {prof_path.name} with snakeviz or pstats)')
@@ -1,24 +1,92 @@
 import pandas as pd
+from etl.excel_reader import iter_excel_chunks, read_excel_streaming
+from etl.headers import resolve_headers, TEXT_HEADERS
+
+# Formats openpyxl can stream in read-only mode; legacy .xls still goes through pandas
+STREAMING_EXCEL_EXTENSIONS = ('.xlsx', '.xlsm')
+
+# Error values Excel writes into cells whose formula failed
+EXCEL_ERROR_TOKENS = ['#REF!', '#ERROR!', '#VALUE!', '#DIV/0!', '#N/A', '#NAME?', '#NUM!', '#NULL!',
+                      '#SPILL!', '#CALC!', '#GETTING_DATA']
+
+def clean_numeric(series):
+    """Return (float64 series, number of non-empty values coerced to NA).
+
+    Columns the reader already typed as numbers are only cast. Object and string
+    columns have Excel error tokens masked out in one pass before to_numeric.
+    """
+    if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        return series.astype('float64'), 0
+    present = series.notna()
+    values = series.mask(series.isin(EXCEL_ERROR_TOKENS))
+    cleaned = pd.to_numeric(values, errors='coerce').astype('float64')
+    return cleaned, int((present & cleaned.isna()).sum())
 
 def clean_numeric_column(series):
-    return pd.to_numeric(series.replace({'#REF!': pd.NA, '#ERROR!': pd.NA}), errors='coerce')
+    return clean_numeric(series)[0]
+
+def _csv_options(path, prune):
+    """Resolve the header row once and build read_csv usecols/dtype from it"""
+    mapping = resolve_headers(pd.read_csv(path, nrows=0).columns)
+    options = {'dtype': {raw: 'string' for raw, canonical in mapping.items() if canonical in TEXT_HEADERS}}
+    # An unrecognised layout is read whole so validate_columns can report what's missing
+    if prune and mapping:
+        options['usecols'] = list(mapping)
+    return mapping, options
+
+def _canonical(df, prune):
+    mapping = resolve_headers(df.columns)
+    if prune and mapping:
+        df = df[list(mapping)]
+    return df.rename(columns=mapping)
+
+def parse_file(path, prune=True):
+    """Read an upload with its headers renamed to the names transform() expects.
 
-def parse_file(path):
+    With prune, columns that don't map to a known header are never materialised.
+    """
     if path.lower().endswith('.csv'):
-        df = pd.read_csv(path)
+        mapping, options = _csv_options(path, prune)
+        df = pd.read_csv(path, **options).rename(columns=mapping)
+    elif path.lower().endswith(STREAMING_EXCEL_EXTENSIONS):
+        df = read_excel_streaming(path, prune=prune)
     else:
-        df = pd.read_excel(path)
+        df = _canonical(pd.read_excel(path), prune)
     return df
 
+def iter_chunks(path, chunk_size, prune=True):
+    """Yield the upload as DataFrames of at most chunk_size rows"""
+    if path.lower().endswith('.csv'):
+        mapping, options = _csv_options(path, prune)
+        for chunk in pd.read_csv(path, chunksize=chunk_size, **options):
+            yield chunk.rename(columns=mapping)
+    elif path.lower().endswith(STREAMING_EXCEL_EXTENSIONS):
+        yield from iter_excel_chunks(path, chunk_size, prune=prune)
+    else:
+        # read_excel has no chunked mode, so the workbook is sliced after loading
+        df = _canonical(pd.read_excel(path), prune)
+        for start in range(0, len(df), chunk_size):
+            yield df.iloc[start:start + chunk_size].copy()
+
+# Part of the etl/cache.py key: bump whenever parse_file or transform output changes
+TRANSFORM_VERSION = 3
+
 def transform(df):
+    """Clean and rename an upload to the budget_items layout.
+
+    df.attrs['coerced_values'] on the result maps each numeric source column
+    to the number of non-empty cells that could not be read as a number.
+    """
     # create cleaned columns
+    coerced = {}
     for col in ['weight /KG','Total weight /Kg','unit rate in INR','Total Budget']:
         if col in df.columns:
-            df[col + '_clean'] = clean_numeric_column(df[col].astype(str))
+            df[col + '_clean'], coerced[col] = clean_numeric(df[col])
         else:
             df[col + '_clean'] = pd.NA
 
-    df['computed_total'] = pd.to_numeric(df.get('Qty', pd.Series([pd.NA]*len(df))), errors='coerce') * df['unit rate in INR_clean']
+    # Index the fallback like df so chunks that don't start at row 0 still align
+    df['computed_total'] = pd.to_numeric(df.get('Qty', pd.Series(pd.NA, index=df.index)), errors='coerce') * df['unit rate in INR_clean']
     df['needs_review'] = df[['weight /KG_clean','unit rate in INR_clean','Total Budget_clean']].isna().any(axis=1)
 
     df = df.rename(columns={
@@ -37,4 +105,6 @@ def transform(df):
     for c in out_cols:
         if c not in df.columns:
             df[c] = pd.NA
-    return df[out_cols]
+    df = df[out_cols]
+    df.attrs['coerced_values'] = coerced
+    return df
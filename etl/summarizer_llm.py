@@ -1,22 +1,42 @@
 import os
 import pandas as pd
 
-def summarize_change(df):
-    """Generate a summary of the budget data"""
-    # Convert to numeric first to avoid warnings
-    df['computed_total'] = pd.to_numeric(df['computed_total'], errors='coerce')
-    df['total_budget'] = pd.to_numeric(df['total_budget'], errors='coerce')
-    
-    # Calculate totals
-    total = df['computed_total'].fillna(0).sum() + df['total_budget'].fillna(0).sum()
-    
+def _format_summary(items, total, needs_review, agencies):
     # Create summary without Unicode characters
-    summary = f"""
+    return f"""
 Budget Summary:
 --------------
-Total Items: {len(df)}
+Total Items: {items}
 Total Budget: INR {total:,.2f}
-Items Needing Review: {df['needs_review'].sum()}
-Agencies: {df['responsible_agency'].nunique()}
+Items Needing Review: {needs_review}
+Agencies: {agencies}
 """
-    return summary
+
+def _chunk_totals(df):
+    # Convert to numeric first to avoid warnings
+    df['computed_total'] = pd.to_numeric(df['computed_total'], errors='coerce')
+    df['total_budget'] = pd.to_numeric(df['total_budget'], errors='coerce')
+    return df['computed_total'].fillna(0).sum() + df['total_budget'].fillna(0).sum()
+
+def summarize_change(df):
+    """Generate a summary of the budget data"""
+    total = _chunk_totals(df)
+    return _format_summary(len(df), total, df['needs_review'].sum(), df['responsible_agency'].nunique())
+
+class ChangeSummary:
+    """Running version of summarize_change for loads that arrive in chunks"""
+
+    def __init__(self):
+        self.items = 0
+        self.total = 0.0
+        self.needs_review = 0
+        self.agencies = set()
+
+    def update(self, df):
+        self.items += len(df)
+        self.total += _chunk_totals(df)
+        self.needs_review += int(df['needs_review'].sum())
+        self.agencies.update(df['responsible_agency'].dropna().unique())
+
+    def render(self):
+        return _format_summary(self.items, self.total, self.needs_review, len(self.agencies))
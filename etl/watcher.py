@@ -0,0 +1,292 @@
+"""Watch data/inbox and load new files as they land.
+
+    python etl/watcher.py [--interval 2] [--settle 5] [--workers 2] [--max-pending 8]
+
+A file is only picked up once its size and mtime have stayed the same for
+--settle seconds, so half-copied uploads are never parsed. Parsing and
+transforming run in a process pool; this process is the only database
+writer. Loaded files are moved to data/archive/.
+
+Files that settle together form one batch. Without --incremental a batch
+replaces budget_items as a whole, like a directory run of etl_runner.py, so
+dropping several files at once loads all of them. With --incremental each
+file is applied in turn as a revision of the whole sheet.
+
+A file that fails to parse or load is skipped until it changes on disk.
+Database errors that usually pass (a locked SQLite file, a dropped
+PostgreSQL connection) and failed moves to the archive are retried with a
+growing delay instead.
+"""
+import argparse
+import logging
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from etl.etl_runner import INPUT_EXTENSIONS, load_file
+from db.db_operations import budget_frame, replace_budget_items_many, upsert_budget_items
+
+logger = logging.getLogger('etl.watcher')
+
+# Its own folder: data/uploads holds committed samples and the File Upload page's previews
+UPLOAD_DIR = project_root / 'data' / 'inbox'
+ARCHIVE_DIR = project_root / 'data' / 'archive'
+
+# Editor lock files and in-progress downloads are never treated as uploads
+IGNORED_PREFIXES = ('.', '~$')
+IGNORED_SUFFIXES = ('.tmp', '.part', '.crdownload')
+
+# Seconds before the first retry of a database error or archive move, doubling up to RETRY_MAX
+RETRY_BASE = 5.0
+RETRY_MAX = 300.0
+# PEP 249 names the errors of a locked database or a lost connection; SQLAlchemy's wrappers
+# share the names, and the PostgreSQL COPY path raises the driver's own
+TRANSIENT_ERRORS = ('OperationalError', 'InterfaceError')
+
+def _signature(path):
+    st = path.stat()
+    return st.st_size, st.st_mtime_ns
+
+def _is_candidate(path):
+    name = path.name.lower()
+    return (path.is_file() and name.endswith(INPUT_EXTENSIONS)
+            and not name.startswith(IGNORED_PREFIXES) and not name.endswith(IGNORED_SUFFIXES))
+
+def _is_transient(error):
+    return any(cls.__name__ in TRANSIENT_ERRORS for cls in type(error).__mro__)
+
+def _retry_delay(attempts):
+    return min(RETRY_BASE * 2 ** (attempts - 1), RETRY_MAX)
+
+def archive_file(path, archive_dir):
+    """Move a loaded upload into archive_dir without overwriting earlier copies"""
+    archive_dir.mkdir(parents=True, exist_ok=True)
+    target = archive_dir / path.name
+    if target.exists():
+        stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+        target = archive_dir / f'{path.stem}_{stamp}{path.suffix}'
+    shutil.move(str(path), str(target))
+    return target
+
+class UploadWatcher:
+    def __init__(self, upload_dir=UPLOAD_DIR, archive_dir=ARCHIVE_DIR, settle=5.0,
+                 workers=2, max_pending=8, incremental=False, use_cache=True):
+        self.upload_dir = Path(upload_dir)
+        self.archive_dir = Path(archive_dir)
+        self.settle = settle
+        self.workers = workers
+        self.max_pending = max_pending
+        self.incremental = incremental
+        self.use_cache = use_cache
+        self._seen = {}      # path -> (signature, first time that signature was seen)
+        self._failed = {}    # path -> signature that failed; retried once the file changes
+        self._retry = {}     # path -> (signature, attempts, next try) after a transient database error
+        self._loaded = {}    # path -> (signature, attempts, next try) loaded but not yet archived
+        self._in_flight = {} # future -> (path, signature)
+        self._batches = []   # lists of (future, path, signature) submitted together, written in order
+        self._batch_open = False  # the last batch still takes files held back by max_pending
+
+    def stable_files(self, now=None):
+        """Return uploads whose size and mtime have not changed for self.settle seconds"""
+        now = time.monotonic() if now is None else now
+        ready, present = [], set()
+        for path in sorted(self.upload_dir.iterdir()):
+            if not _is_candidate(path):
+                continue
+            try:
+                sig = _signature(path)
+            except FileNotFoundError:
+                continue
+            present.add(path)
+            seen = self._seen.get(path)
+            if seen is None or seen[0] != sig:
+                self._seen[path] = (sig, now)
+            elif (now - seen[1] >= self.settle and sig[0] > 0 and self._failed.get(path) != sig
+                  and path not in self._loaded and not self._retry_pending(path, sig, now)):
+                ready.append((path, sig))
+        # Forget files that were removed by hand
+        for path in list(self._seen):
+            if path not in present:
+                del self._seen[path]
+                self._failed.pop(path, None)
+                self._retry.pop(path, None)
+        return ready
+
+    def _retry_pending(self, path, sig, now):
+        # True until a retry is due; a file that changed since the error starts over
+        entry = self._retry.get(path)
+        if entry is None:
+            return False
+        if entry[0] != sig:
+            del self._retry[path]
+            return False
+        return now < entry[2]
+
+    def _submit_ready(self, pool):
+        busy = {path for path, _ in self._in_flight.values()}
+        batch = self._batches[-1] if self._batch_open else []
+        held_back = False
+        for path, sig in self.stable_files():
+            if path in busy:
+                continue
+            # Backpressure: files beyond max_pending stay in the inbox until a parse finishes
+            if sum(not future.done() for future in self._in_flight) >= self.max_pending:
+                held_back = True
+                break
+            logger.info('Queued %s', path.name)
+            future = pool.submit(load_file, str(path), self.use_cache)
+            self._in_flight[future] = (path, sig)
+            batch.append((future, path, sig))
+        if batch and not self._batch_open:
+            self._batches.append(batch)
+        # Files held back join this batch once slots free up, instead of replacing it afterwards
+        self._batch_open = bool(batch) and held_back
+
+    def _write(self, batch):
+        """Write one batch of parsed files: a single replace of all of them, or one upsert per file"""
+        loaded_at = datetime.now(timezone.utc)
+        parsed = []
+        for future, path, sig in batch:
+            try:
+                missing, df_t = future.result()
+            except Exception as e:
+                # The file itself could not be read or transformed; wait until it changes
+                logger.error('Failed to load %s: %s', path.name, e)
+                self._failed[path] = sig
+                continue
+            if missing:
+                logger.warning('%s: missing columns %s', path.name, missing)
+            try:
+                changed = _signature(path) != sig
+            except FileNotFoundError:
+                changed = True
+            if changed:
+                logger.info('%s changed while it was being parsed; will reload', path.name)
+                continue
+            df_t['created_at'] = loaded_at
+            parsed.append((path, sig, df_t))
+        if not parsed:
+            return
+
+        if self.incremental:
+            for path, sig, df_t in parsed:
+                self._persist([(path, sig)], lambda: 'inserted {inserted}, updated {updated}, deleted {deleted}'.format(
+                    **upsert_budget_items(df_t, path.name)))
+        else:
+            self._persist([(path, sig) for path, sig, _ in parsed], lambda: '{} rows'.format(
+                replace_budget_items_many(budget_frame(df_t, path.name) for path, _, df_t in parsed)))
+
+    def _persist(self, files, write):
+        # files are (path, signature) pairs written together by write(), which returns the log detail
+        names = ', '.join(path.name for path, _ in files)
+        try:
+            detail = write()
+        except Exception as e:
+            if not _is_transient(e):
+                logger.error('Failed to load %s: %s', names, e)
+                for path, sig in files:
+                    self._failed[path] = sig
+                return
+            attempts = max(self._retry.get(path, (sig, 0))[1] for path, sig in files) + 1
+            delay = _retry_delay(attempts)
+            logger.warning('Failed to load %s: %s; retrying in %.0fs', names, e, delay)
+            for path, sig in files:
+                self._retry[path] = (sig, attempts, time.monotonic() + delay)
+            return
+        logger.info('Loaded %s (%s)', names, detail)
+        for path, sig in files:
+            self._retry.pop(path, None)
+            self._archive(path, sig)
+
+    def _archive(self, path, sig, attempts=0):
+        # The rows are committed: until the move succeeds the file must not be loaded again
+        try:
+            target = archive_file(path, self.archive_dir)
+        except OSError as e:
+            delay = _retry_delay(attempts + 1)
+            logger.error('Could not archive %s: %s; retrying in %.0fs', path.name, e, delay)
+            self._loaded[path] = (sig, attempts + 1, time.monotonic() + delay)
+            return
+        self._loaded.pop(path, None)
+        self._seen.pop(path, None)
+        logger.info('Archived %s to %s', path.name, target)
+
+    def _archive_due(self, now=None):
+        """Retry moving loaded files whose earlier archive attempt failed"""
+        now = time.monotonic() if now is None else now
+        for path, (sig, attempts, due) in list(self._loaded.items()):
+            try:
+                current = _signature(path)
+            except FileNotFoundError:
+                # Moved away by hand
+                del self._loaded[path]
+                continue
+            if current != sig:
+                # Replaced by a new upload, which stable_files will load
+                del self._loaded[path]
+            elif now >= due:
+                self._archive(path, sig, attempts)
+
+    def poll(self, pool, timeout):
+        """One scan/submit/write cycle; waits up to timeout for a worker to finish"""
+        self._archive_due()
+        self._submit_ready(pool)
+        if not self._in_flight:
+            time.sleep(timeout)
+            return
+        # Parsed files waiting for the rest of their batch would make wait() return at once
+        parsing = [future for future in self._in_flight if not future.done()]
+        if parsing:
+            wait(parsing, timeout=timeout, return_when=FIRST_COMPLETED)
+        # Writes happen here, one batch at a time and in submission order, so loads never
+        # compete for database locks; a batch is written once all of its files are parsed
+        while self._batches and not (self._batch_open and len(self._batches) == 1):
+            batch = self._batches[0]
+            if not all(future.done() for future, _, _ in batch):
+                break
+            self._batches.pop(0)
+            for future, _, _ in batch:
+                del self._in_flight[future]
+            self._write(batch)
+
+    def run(self, interval=2.0):
+        self.upload_dir.mkdir(parents=True, exist_ok=True)
+        logger.info('Watching %s (settle %.0fs, %d workers)', self.upload_dir, self.settle, self.workers)
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            try:
+                while True:
+                    self.poll(pool, interval)
+            except KeyboardInterrupt:
+                logger.info('Stopping; %d file(s) still queued will be picked up next start', len(self._in_flight))
+                for future in self._in_flight:
+                    future.cancel()
+
+def main():
+    parser = argparse.ArgumentParser(description='Load files dropped into data/inbox automatically')
+    parser.add_argument('--upload-dir', default=str(UPLOAD_DIR))
+    parser.add_argument('--archive-dir', default=str(ARCHIVE_DIR))
+    parser.add_argument('--interval', type=float, default=2.0, help='seconds between folder scans')
+    parser.add_argument('--settle', type=float, default=5.0,
+                        help='seconds a file must stay unchanged before it is loaded')
+    parser.add_argument('--workers', type=int, default=2, help='files parsed at the same time')
+    parser.add_argument('--max-pending', type=int, default=8, help='files queued or parsing at once')
+    parser.add_argument('--incremental', action='store_true', help='upsert instead of replacing budget_items')
+    parser.add_argument('--no-cache', action='store_true')
+    args = parser.parse_args()
+    if args.workers < 1 or args.max_pending < 1:
+        raise SystemExit('--workers and --max-pending must be at least 1')
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    UploadWatcher(args.upload_dir, args.archive_dir, args.settle, args.workers,
+                  args.max_pending, args.incremental, not args.no_cache).run(args.interval)
+
+if __name__ == '__main__':
+    main()
@@ -23,5 +23,8 @@ CREATE TABLE IF NOT EXISTS budget_items (
     computed_total FLOAT,
     needs_review BOOLEAN,
     raw_file TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    row_hash BIGINT
 );
+
+CREATE INDEX IF NOT EXISTS ix_budget_items_project_sl ON budget_items (project_id, sl_no);
@@ -0,0 +1,53 @@
+"""Shared fixtures for the tests in tests/"""
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to Python path
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from dashboard.connection import ConnectionManager
+from dashboard.migrations import migrate
+from dashboard.submission import submit_project
+
+@pytest.fixture
+def dashboard_db(tmp_path):
+    """Path of a migrated, empty project_management.db"""
+    path = tmp_path / 'project_management.db'
+    conn = sqlite3.connect(path)
+    migrate(conn)
+    conn.close()
+    return path
+
+@pytest.fixture
+def db(dashboard_db):
+    """ConnectionManager on dashboard_db"""
+    manager = ConnectionManager(str(dashboard_db))
+    yield manager
+    manager.close()
+
+def project_data(name='Test Project'):
+    return {
+        'project_name': name, 'project_description': 'Test', 'domain': 'IT', 'priority': 'Medium',
+        'start_date': '2024-01-01', 'end_date': '2024-12-31', 'department': 'Engineering',
+        'contact_email': 'test@example.com', 'contact_phone': '1234567890', 'justification': 'Test',
+        'submitted_by': 'tester',
+    }
+
+def boq_rows(count, amount=1000.0):
+    """BOQ entries as the Submit Project page builds them"""
+    return [{
+        'Category': '1. Supply', 'Sub-topic': 'Raw Materials', 'Description': f'Item {i}',
+        'Units/Qty': 'Nos', 'Nos': 1, 'Source/Type': 'Vendor Quote', 'Payment Schedule': 'Monthly',
+        'Unit Price Total Amount': amount, 'Amount INR': amount,
+    } for i in range(1, count + 1)]
+
+@pytest.fixture
+def new_project(db):
+    """Submit a project with the given number of BOQ rows; returns its id"""
+    def submit(rows=3, name='Test Project'):
+        return submit_project(db, project_data(name), boq_rows(rows))[0]
+    return submit
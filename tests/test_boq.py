@@ -0,0 +1,59 @@
+"""dashboard/boq.py: bulk_update_material_status reports a result for every proposed row"""
+import pandas as pd
+
+from dashboard.boq import bulk_update_material_status
+
+def materials(db, project_id):
+    return pd.read_sql_query('SELECT * FROM project_materials WHERE project_id = ? ORDER BY id',
+                             db.connection(), params=(project_id,))
+
+def results(frame):
+    return dict(zip(frame['id'], frame['result']))
+
+def test_per_row_results(db, new_project):
+    project_id = new_project(rows=4)
+    current = materials(db, project_id)
+    ids = current['id'].tolist()
+    proposed = current[['id', 'status', 'review_comments', 'finalized']].copy()
+    proposed.loc[0, 'status'] = 'approved'
+    proposed.loc[1, 'review_comments'] = 'Check the quote'
+    proposed.loc[2, 'status'] = 'lost'
+    proposed = pd.concat([proposed, pd.DataFrame(
+        {'id': [9999], 'status': ['rejected'], 'review_comments': [''], 'finalized': [False]})])
+
+    outcome = bulk_update_material_status(db, current, proposed, reviewed_by='Reviewer')
+    assert results(outcome) == {ids[0]: 'updated', ids[1]: 'updated', ids[2]: 'invalid_status',
+                                ids[3]: 'unchanged', 9999: 'not_found'}
+
+    after = materials(db, project_id).set_index('id')
+    assert after.loc[ids[0], 'status'] == 'approved'
+    assert after.loc[ids[1], 'review_comments'] == 'Check the quote'
+    assert after.loc[[ids[0], ids[1]], 'reviewed_by'].tolist() == ['Reviewer', 'Reviewer']
+    assert after.loc[ids[2], 'status'] == 'pending'
+    assert pd.isna(after.loc[ids[3], 'reviewed_by'])
+
+def test_finalized_is_stored_as_an_integer(db, new_project):
+    project_id = new_project(rows=1)
+    current = materials(db, project_id)
+    proposed = current[['id', 'status', 'review_comments', 'finalized']].assign(finalized=True)
+    assert results(bulk_update_material_status(db, current, proposed)) == {current['id'][0]: 'updated'}
+    assert db.fetchone('SELECT finalized FROM project_materials') == (1,)
+
+def test_nothing_changed_writes_nothing(db, new_project):
+    project_id = new_project(rows=2)
+    current = materials(db, project_id)
+    # Form values normalise like the stored ones: None comments and 0/False flags are no change
+    proposed = current[['id', 'status', 'review_comments', 'finalized']].assign(review_comments='', finalized=False)
+    version = db.fetchone("SELECT version FROM table_versions WHERE table_name = 'project_materials'")
+    outcome = bulk_update_material_status(db, current, proposed)
+    assert set(outcome['result']) == {'unchanged'}
+    assert db.fetchone("SELECT version FROM table_versions WHERE table_name = 'project_materials'") == version
+
+def test_ids_deleted_since_loading_are_not_found(db, new_project):
+    project_id = new_project(rows=2)
+    current = materials(db, project_id)
+    with db.transaction() as conn:
+        conn.execute('DELETE FROM project_materials WHERE id = ?', (int(current['id'][1]),))
+    proposed = current[['id', 'status', 'review_comments', 'finalized']].assign(status='approved')
+    outcome = bulk_update_material_status(db, current, proposed)
+    assert results(outcome) == {current['id'][0]: 'updated', current['id'][1]: 'not_found'}
@@ -0,0 +1,70 @@
+"""db/db_operations.py: upsert_budget_items counts and applies inserts, updates and deletes"""
+import pandas as pd
+import pytest
+
+from db import db_operations
+from db.db_operations import read_budget_items, replace_budget_items, upsert_budget_items
+from db.engine import make_engine
+from deploy.init_db import init_db
+
+@pytest.fixture(autouse=True)
+def budget_db(tmp_path, monkeypatch):
+    """Point db_operations at a fresh budget.db with the budget_items table"""
+    engine = make_engine('sqlite:///' + str(tmp_path / 'budget.db'))
+    init_db(engine)
+    monkeypatch.setattr(db_operations, 'engine', engine)
+    yield engine
+    engine.dispose()
+
+def sheet(rows):
+    """A transformed budget sheet; rows are (sl_no, description, total_budget)"""
+    sl_no, description, total = zip(*rows)
+    return pd.DataFrame({
+        'sl_no': list(sl_no), 'description': list(description), 'responsible_agency': 'BHEL',
+        'duration_text': '3 months', 'qty': 1.0, 'weight_kg': None, 'total_weight_kg': None,
+        'unit_rate_inr': list(total), 'total_budget': list(total), 'computed_total': list(total),
+        'needs_review': False,
+    })
+
+def stored():
+    return read_budget_items().set_index('sl_no')
+
+def test_first_load_inserts_every_row():
+    counts = upsert_budget_items(sheet([(1, 'Steel', 100.0), (2, 'Cement', 200.0)]), 'v1.xlsx')
+    assert counts == {'inserted': 2, 'updated': 0, 'deleted': 0, 'unchanged': 0}
+    assert stored()['description'].to_dict() == {1: 'Steel', 2: 'Cement'}
+
+def test_revision_counts_each_kind_of_change():
+    upsert_budget_items(sheet([(1, 'Steel', 100.0), (2, 'Cement', 200.0), (3, 'Paint', 50.0)]), 'v1.xlsx')
+    ids = stored()['id'].to_dict()
+    counts = upsert_budget_items(sheet([(1, 'Steel', 100.0), (2, 'Cement', 250.0), (4, 'Glass', 75.0)]),
+                                 'v2.xlsx')
+    assert counts == {'inserted': 1, 'updated': 1, 'deleted': 1, 'unchanged': 1}
+    after = stored()
+    assert after['total_budget'].to_dict() == {1: 100.0, 2: 250.0, 4: 75.0}
+    # Updated and unchanged rows keep their ids; only the updated one records the new file
+    assert after.loc[[1, 2], 'id'].to_dict() == {1: ids[1], 2: ids[2]}
+    assert after['raw_file'].to_dict() == {1: 'v1.xlsx', 2: 'v2.xlsx', 4: 'v2.xlsx'}
+
+def test_same_file_again_changes_nothing():
+    df = sheet([(1, 'Steel', 100.0), (2, 'Cement', 200.0)])
+    upsert_budget_items(df, 'v1.xlsx')
+    assert upsert_budget_items(df, 'v1.xlsx') == {'inserted': 0, 'updated': 0, 'deleted': 0, 'unchanged': 2}
+
+def test_rows_without_sl_no_are_replaced():
+    df = sheet([(1, 'Steel', 100.0), (None, 'Subtotal', 100.0)])
+    upsert_budget_items(df, 'v1.xlsx')
+    assert upsert_budget_items(df, 'v1.xlsx') == {'inserted': 1, 'updated': 0, 'deleted': 1, 'unchanged': 1}
+    assert len(read_budget_items()) == 2
+
+def test_duplicates_from_a_full_load_are_dropped():
+    replace_budget_items(sheet([(1, 'Steel', 100.0), (1, 'Steel again', 100.0)]), 'full.xlsx')
+    counts = upsert_budget_items(sheet([(1, 'Steel', 100.0)]), 'v1.xlsx')
+    assert counts == {'inserted': 0, 'updated': 0, 'deleted': 1, 'unchanged': 1}
+    assert stored()['description'].to_dict() == {1: 'Steel'}
+
+def test_repeated_sl_no_is_rejected_without_writing():
+    upsert_budget_items(sheet([(1, 'Steel', 100.0)]), 'v1.xlsx')
+    with pytest.raises(ValueError):
+        upsert_budget_items(sheet([(2, 'Cement', 200.0), (2, 'Cement', 200.0)]), 'v2.xlsx')
+    assert stored()['description'].to_dict() == {1: 'Steel'}
@@ -0,0 +1,57 @@
+"""dashboard/excel_export.py: the exported workbook reads back with the frame's values and styles"""
+import io
+
+import numpy as np
+import pandas as pd
+from openpyxl import load_workbook
+
+from dashboard.excel_export import HEADER_FILL, MAX_COLUMN_WIDTH, STATUS_FILLS, dataframe_to_xlsx
+
+def exported(df, **kwargs):
+    return load_workbook(io.BytesIO(dataframe_to_xlsx(df, 'BOQ Data', **kwargs)))['BOQ Data']
+
+def fill(cell):
+    return cell.fill.fgColor.rgb[-6:] if cell.fill.fill_type == 'solid' else None
+
+def test_values_round_trip():
+    df = pd.DataFrame({
+        'S.No.': [1, 2, 3],
+        'Description': ['Steel <grade A> & bolts', 'Bell\x07 wire', None],
+        'Amount': [1500.5, np.nan, np.inf],
+        'Nos': pd.array([4, None, 6], dtype='Int64'),
+        'Final': [True, False, None],
+    })
+    ws = exported(df)
+    assert [list(row) for row in ws.iter_rows(values_only=True)] == [
+        ['S.No.', 'Description', 'Amount', 'Nos', 'Final'],
+        [1, 'Steel <grade A> & bolts', 1500.5, 4, True],
+        # Characters XML cannot carry are dropped; missing and infinite values leave empty cells
+        [2, 'Bell wire', None, None, False],
+        [3, None, None, 6, None],
+    ]
+
+def test_status_fills_and_borders():
+    statuses = list(STATUS_FILLS) + ['unknown', None]
+    df = pd.DataFrame({'Item': range(len(statuses)), 'Current Status': statuses})
+    ws = exported(df, status_column='Current Status')
+    header = ws['A1']
+    assert header.font.b and fill(header) == HEADER_FILL
+    for row, status in enumerate(statuses, 2):
+        assert fill(ws.cell(row, 2)) == STATUS_FILLS.get(status)
+        assert fill(ws.cell(row, 1)) is None
+        # Every data cell is bordered, the empty ones included
+        assert all(ws.cell(row, column).border.left.style == 'thin' for column in (1, 2))
+
+def test_no_status_column_means_no_fills():
+    ws = exported(pd.DataFrame({'Current Status': ['approved']}))
+    assert fill(ws['A2']) is None
+
+def test_column_widths():
+    df = pd.DataFrame({'Id': [1], 'Description': ['x' * 80]})
+    ws = exported(df)
+    assert ws.column_dimensions['A'].width == len('Id') + 2
+    assert ws.column_dimensions['B'].width == MAX_COLUMN_WIDTH
+
+def test_empty_frame_has_the_header_only():
+    ws = exported(pd.DataFrame({'A': [], 'B': []}))
+    assert [list(row) for row in ws.iter_rows(values_only=True)] == [['A', 'B']]
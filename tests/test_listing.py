@@ -0,0 +1,68 @@
+"""dashboard/listing.py: filters and keyset pages behave the same on SQLite and PostgreSQL.
+
+The PostgreSQL cases run when DASHBOARD_TEST_PG_URL names a scratch database;
+they empty its projects, project_materials and notifications tables.
+"""
+import os
+
+import pytest
+
+from conftest import boq_rows, project_data
+from dashboard.connection import connection_manager
+from dashboard.listing import list_projects
+from dashboard.submission import submit_project
+
+PG_URL = os.environ.get('DASHBOARD_TEST_PG_URL')
+
+def _empty(manager):
+    with manager.transaction() as conn:
+        for table in ('notifications', 'project_materials', 'projects'):
+            conn.execute(f'DELETE FROM {table}')
+
+@pytest.fixture(params=['sqlite', 'postgresql'])
+def backend(request, dashboard_db):
+    if request.param == 'postgresql' and not PG_URL:
+        pytest.skip('set DASHBOARD_TEST_PG_URL to run against PostgreSQL')
+    manager = connection_manager(PG_URL if request.param == 'postgresql' else str(dashboard_db))
+    manager.migrate()
+    _empty(manager)
+    yield manager
+    _empty(manager)
+    manager.close()
+
+def submit(db, name, department):
+    return submit_project(db, dict(project_data(name), department=department), boq_rows(1))
+
+def names(db, filters=None, search=None):
+    return sorted(list_projects(db, filters, search)[0]['project_name'])
+
+def test_department_filter_ignores_case(backend):
+    submit(backend, 'Turbine', 'Power Engineering')
+    submit(backend, 'Boiler', 'Quality')
+    assert names(backend, {'department': 'engineering'}) == ['Turbine']
+    assert names(backend, {'department': 'POWER ENG'}) == ['Turbine']
+
+def test_search_ignores_case_on_name_and_tracking_id(backend):
+    _, tracking_id = submit(backend, 'Turbine Overhaul', 'Power')
+    submit(backend, 'Boiler', 'Power')
+    assert names(backend, search='turbine') == ['Turbine Overhaul']
+    assert names(backend, search=tracking_id.lower()) == ['Turbine Overhaul']
+
+def test_search_text_is_literal(backend):
+    submit(backend, '100% Inspection', 'Quality')
+    submit(backend, '1000 Bolts', 'Quality')
+    submit(backend, 'Spare_Parts', 'Quality')
+    submit(backend, 'Spare Parts', 'Quality')
+    assert names(backend, search='100%') == ['100% Inspection']
+    assert names(backend, search='e_p') == ['Spare_Parts']
+
+def test_pages_cover_every_match_once(backend):
+    for i in range(7):
+        submit(backend, f'Project {i}', 'Power')
+    seen, key = [], None
+    while True:
+        page, key = list_projects(backend, {'department': 'power'}, after=key, limit=3)
+        seen.extend(page['project_name'])
+        if key is None:
+            break
+    assert sorted(seen) == [f'Project {i}' for i in range(7)]
@@ -0,0 +1,76 @@
+"""dashboard/migrations.py: migrate() from an empty or pre-migration database to the latest schema"""
+import shutil
+import sqlite3
+from pathlib import Path
+
+import numpy as np
+
+from dashboard.migrations import MIGRATIONS, migrate, schema_version
+
+LATEST = MIGRATIONS[-1][0]
+project_root = Path(__file__).parent.parent
+
+def names(conn, kind):
+    return {row[0] for row in conn.execute('SELECT name FROM sqlite_master WHERE type = ?', (kind,))}
+
+def test_versions_are_consecutive():
+    assert [version for version, _, _ in MIGRATIONS] == list(range(1, LATEST + 1))
+
+def test_empty_database_migrates_to_latest(tmp_path):
+    conn = sqlite3.connect(tmp_path / 'project_management.db')
+    assert schema_version(conn) == 0
+    assert migrate(conn) == LATEST
+    assert schema_version(conn) == LATEST
+    assert {'projects', 'notifications', 'project_materials', 'table_versions'} <= names(conn, 'table')
+    assert {'ix_projects_status_submitted', 'ix_projects_submitted', 'ix_materials_project_status',
+            'ix_notifications_created'} <= names(conn, 'index')
+
+def test_migrate_again_is_a_no_op(dashboard_db):
+    conn = sqlite3.connect(dashboard_db)
+    schema = conn.execute('SELECT type, name, sql FROM sqlite_master ORDER BY name').fetchall()
+    assert migrate(conn) == LATEST
+    assert conn.execute('SELECT type, name, sql FROM sqlite_master ORDER BY name').fetchall() == schema
+
+def test_committed_database_keeps_its_rows(tmp_path):
+    # project_management.db in the repository predates the migrations (user_version 0)
+    path = tmp_path / 'project_management.db'
+    shutil.copy(project_root / 'project_management.db', path)
+    conn = sqlite3.connect(path)
+    counts = {table: conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+              for table in ('projects', 'notifications', 'project_materials')}
+    assert schema_version(conn) == 0
+    assert migrate(conn) == LATEST
+    for table, count in counts.items():
+        assert conn.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0] == count
+
+def project_ids(conn, table):
+    return conn.execute(f'SELECT typeof(project_id), project_id FROM {table} ORDER BY 2').fetchall()
+
+def test_blob_project_ids_become_integers(tmp_path):
+    # A version 5 database where some rows were inserted with numpy ids, which sqlite3 binds as blobs
+    conn = sqlite3.connect(tmp_path / 'project_management.db')
+    for _version, _description, apply in MIGRATIONS[:5]:
+        apply(conn.cursor())
+    conn.execute('PRAGMA user_version = 5')
+    rows = [(np.int64(7), 100.0), (np.int64(7), 50.0), (7, 25.0), (np.int64(8), 10.0), (9, 5.0)]
+    conn.executemany('INSERT INTO project_materials (project_id, amount_inr) VALUES (?, ?)', rows)
+    conn.commit()
+    assert [kind for kind, _ in project_ids(conn, 'project_materials')].count('blob') == 3
+
+    assert migrate(conn) == LATEST
+    assert project_ids(conn, 'project_materials') == [('integer', 7)] * 3 + [('integer', 8), ('integer', 9)]
+    assert conn.execute('SELECT project_id, entries, amount_inr FROM material_totals_by_project ORDER BY 1'
+                        ).fetchall() == [(7, 3, 175.0), (8, 1, 10.0), (9, 1, 5.0)]
+    # Lookups by the integer id now find every row
+    assert conn.execute('SELECT COUNT(*) FROM project_materials WHERE project_id = ?', (7,)).fetchone() == (3,)
+
+def test_committed_database_blob_ids_are_decoded(tmp_path):
+    path = tmp_path / 'project_management.db'
+    shutil.copy(project_root / 'project_management.db', path)
+    conn = sqlite3.connect(path)
+    blob_rows = conn.execute("SELECT COUNT(*) FROM project_materials WHERE typeof(project_id) = 'blob'").fetchone()[0]
+    assert blob_rows > 0
+    migrate(conn)
+    assert {kind for kind, _ in project_ids(conn, 'project_materials')} == {'integer'}
+    assert {kind for kind, _ in project_ids(conn, 'material_totals_by_project')} == {'integer'}
+    assert set(conn.execute('SELECT project_id FROM project_materials')) <= set(conn.execute('SELECT id FROM projects'))
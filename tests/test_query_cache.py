@@ -0,0 +1,56 @@
+"""dashboard/query_cache.py: cached frames are served until a write bumps table_versions"""
+import pandas as pd
+
+from dashboard.query_cache import QueryCache
+
+PROJECTS = 'SELECT id, project_name FROM projects ORDER BY id'
+
+def test_repeat_read_is_a_hit(db, new_project):
+    new_project()
+    first = db.cached_query(PROJECTS, ('projects',))
+    second = db.cached_query(PROJECTS, ('projects',))
+    pd.testing.assert_frame_equal(first, second)
+    assert (db.cache.hits, db.cache.misses) == (1, 1)
+
+def test_write_to_a_read_table_invalidates(db, new_project):
+    new_project(name='First')
+    assert len(db.cached_query(PROJECTS, ('projects',))) == 1
+    new_project(name='Second')
+    df = db.cached_query(PROJECTS, ('projects',))
+    assert df['project_name'].tolist() == ['First', 'Second']
+    assert (db.cache.hits, db.cache.misses) == (0, 2)
+
+def test_write_to_another_table_keeps_the_entry(db, new_project):
+    new_project()
+    db.cached_query(PROJECTS, ('projects',))
+    with db.transaction() as conn:
+        conn.execute("UPDATE notifications SET is_read = 1")
+    db.cached_query(PROJECTS, ('projects',))
+    assert (db.cache.hits, db.cache.misses) == (1, 1)
+
+def test_write_from_another_connection_invalidates(db, dashboard_db, new_project):
+    # Another session or process: a separate QueryCache and connection on the same file
+    project_id = new_project()
+    db.cached_query(PROJECTS, ('projects',))
+    other = type(db)(str(dashboard_db))
+    with other.transaction() as conn:
+        conn.execute("UPDATE projects SET project_name = 'Renamed' WHERE id = ?", (project_id,))
+    other.close()
+    assert db.cached_query(PROJECTS, ('projects',))['project_name'].tolist() == ['Renamed']
+    assert db.cache.misses == 2
+
+def test_changing_a_returned_frame_leaves_the_cache_intact(db, new_project):
+    new_project(name='Original')
+    df = db.cached_query(PROJECTS, ('projects',))
+    df['project_name'] = 'Changed'
+    assert db.cached_query(PROJECTS, ('projects',))['project_name'].tolist() == ['Original']
+
+def test_least_recently_used_entry_is_evicted(db, new_project):
+    new_project()
+    cache = QueryCache(max_entries=2)
+    conn = db.connection()
+    for project_id in (1, 2, 3):
+        cache.read_sql(conn, 'SELECT * FROM projects WHERE id = ?', ('projects',), (project_id,))
+    assert cache.stats()['entries'] == 2
+    cache.read_sql(conn, 'SELECT * FROM projects WHERE id = ?', ('projects',), (1,))
+    assert (cache.hits, cache.misses) == (0, 4)
@@ -0,0 +1,68 @@
+"""The dashboard's hot queries use the indexes from dashboard/migrations.py"""
+import random
+import sqlite3
+
+import pytest
+
+from dashboard.migrations import migrate
+
+STATUSES = ['pending', 'under_review', 'approved', 'rejected']
+PROJECTS = 2000
+
+# (label, sql, params, index that must appear in the plan)
+HOT_QUERIES = [
+    ('projects by status, newest first',
+     "SELECT * FROM projects WHERE status = ? ORDER BY submitted_at DESC", ('pending',),
+     'ix_projects_status_submitted'),
+    ('BOQ lines for a project',
+     "SELECT * FROM project_materials WHERE project_id = ?", (7,),
+     'ix_materials_project_status'),
+    ('pending BOQ lines for a project',
+     "SELECT * FROM project_materials WHERE project_id = ? AND status = ?", (7, 'pending'),
+     'ix_materials_project_status'),
+    ('recent projects',
+     "SELECT tracking_id FROM projects ORDER BY submitted_at DESC, id DESC LIMIT 10", (),
+     'ix_projects_submitted'),
+    ('project listing, later page',
+     "SELECT * FROM projects WHERE (submitted_at, id) < (?, ?) ORDER BY submitted_at DESC, id DESC LIMIT 51",
+     ('2025-06-01 10:00:00', 500), 'ix_projects_submitted'),
+    ('project listing by status, later page',
+     "SELECT * FROM projects WHERE status IN (?) AND (submitted_at, id) < (?, ?) ORDER BY submitted_at DESC, id DESC LIMIT 51",
+     ('pending', '2025-06-01 10:00:00', 500), 'ix_projects_status_submitted'),
+    ('notification feed',
+     "SELECT * FROM notifications ORDER BY created_at DESC LIMIT 50", (),
+     'ix_notifications_created'),
+]
+
+def seed(conn, projects):
+    rng = random.Random(0)
+    conn.executemany(
+        "INSERT INTO projects (tracking_id, project_name, status, submitted_at) VALUES (?, ?, ?, ?)",
+        [(f'PRJ{i:06d}', f'Project {i}', rng.choice(STATUSES), f'2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 10:00:00')
+         for i in range(projects)])
+    conn.executemany(
+        "INSERT INTO project_materials (project_id, category, amount_inr, status) VALUES (?, ?, ?, ?)",
+        [(i // 20 + 1, f'Category {i % 6}', float(i), rng.choice(STATUSES)) for i in range(projects * 20)])
+    conn.executemany(
+        "INSERT INTO notifications (project_id, title, created_at) VALUES (?, ?, ?)",
+        [(i + 1, f'Project {i} submitted', f'2025-{i % 12 + 1:02d}-{i % 28 + 1:02d} 10:00:00')
+         for i in range(projects)])
+    conn.commit()
+    # The planner's choices depend on the statistics, as they do on a database in use
+    conn.execute('ANALYZE')
+
+def plan(conn, sql, params):
+    return ' | '.join(row[3] for row in conn.execute('EXPLAIN QUERY PLAN ' + sql, params))
+
+@pytest.fixture(scope='module')
+def seeded_db(tmp_path_factory):
+    conn = sqlite3.connect(tmp_path_factory.mktemp('plans') / 'project_management.db')
+    migrate(conn)
+    seed(conn, PROJECTS)
+    yield conn
+    conn.close()
+
+@pytest.mark.parametrize('label, sql, params, index', HOT_QUERIES, ids=[q[0] for q in HOT_QUERIES])
+def test_hot_query_uses_index(seeded_db, label, sql, params, index):
+    detail = plan(seeded_db, sql, params)
+    assert index in detail, f'{label} no longer uses {index}: {detail}'
@@ -0,0 +1,22 @@
+"""dashboard/submission.py: submit_project writes the project, BOQ rows and notification together"""
+import pytest
+
+from conftest import boq_rows, project_data
+from dashboard.submission import submit_project
+
+def counts(db):
+    return [db.fetchone(f'SELECT COUNT(*) FROM {table}')[0]
+            for table in ('projects', 'project_materials', 'notifications')]
+
+def test_submit_writes_all_three(db):
+    project_id, tracking_id = submit_project(db, project_data(), boq_rows(3, amount=500.0))
+    assert counts(db) == [1, 3, 1]
+    assert db.fetchone('SELECT tracking_id, total_cost FROM projects WHERE id = ?', (project_id,)) == \
+        (tracking_id, 1500.0)
+
+def test_failed_materials_leave_no_project(db):
+    materials = boq_rows(2)
+    del materials[1]['Description']
+    with pytest.raises(KeyError):
+        submit_project(db, project_data(), materials)
+    assert counts(db) == [0, 0, 0]